@@ -9,6 +9,8 @@ source.dir = .
 source.include_exts = py,kv,png,jpg,jpeg,svg,wav,ogg,mp3,txt,json
 # Package assets
 source.include_patterns = assets/*
+# Developer tooling (local sync server, harnesses) is not shipped
+source.exclude_dirs = tools
 
 # iOS build: DO NOT include pyjnius
 # Keep requirements platform-neutral
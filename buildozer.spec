@@ -8,6 +8,8 @@ source.dir = .
 source.include_exts = py,kv,png,jpg,jpeg,svg,wav,ogg,mp3,txt,json
 # Package assets (do not bundle the runtime DB)
 source.include_patterns = assets/*
+# Developer tooling (local sync server, harnesses) is not shipped
+source.exclude_dirs = tools
 
 # Pin stack compatible with Cython 0.29.x
 # Keep requirements platform-agnostic; add pyjnius locally only for Android builds
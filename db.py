@@ -13,6 +13,9 @@ introduced in this documentation pass.
 import os
 import sqlite3
 import shutil
+import zlib
+
+import startup_trace
 
 try:
     from kivy.app import App
@@ -24,6 +27,7 @@ except Exception:  # Allow importing outside Kivy (e.g., for tooling)
 
 def _get_persistent_db_path(filename: str = "events.db") -> str:
     """Resolve the database path.
+    - DRAFTBUDDY_DATA_DIR, when set, wins on every platform (developer tooling).
     - Android/iOS: use the app sandbox (user_data_dir/ANDROID_PRIVATE/~/).
     - Desktop (win/linux/macosx): store alongside the project (same folder as db.py).
     - Fallback: use a per-user folder (~/.draft_buddy).
@@ -36,11 +40,13 @@ def _get_persistent_db_path(filename: str = "events.db") -> str:
     except Exception:
         plat = None
 
-    # Determine base dir
-    base_dir = None
+    # Determine base dir. DRAFTBUDDY_DATA_DIR is a developer override that keeps
+    # all app data (DB, auth, settings) in one folder, e.g. per simulated device
+    # in tools/sync_load_test.py.
+    base_dir = os.environ.get('DRAFTBUDDY_DATA_DIR') or None
 
     # On mobile, prefer Kivy App.user_data_dir when available
-    if plat in ('android', 'ios') and App is not None:
+    if not base_dir and plat in ('android', 'ios') and App is not None:
         try:
             app = App.get_running_app()
         except Exception:
@@ -92,8 +98,10 @@ def _get_persistent_db_path(filename: str = "events.db") -> str:
     return target_path
 
 
-def init_db():
-    db_path = _get_persistent_db_path()
+def init_db(db_path=None):
+    """Open (creating or migrating as needed) the app database at db_path,
+    by default the persistent events.db, and return the connection."""
+    db_path = db_path or _get_persistent_db_path()
     need_init = not os.path.exists(db_path)
     conn = sqlite3.connect(db_path, check_same_thread=False)
     c = conn.cursor()
@@ -286,25 +294,206 @@ def init_db():
 def get_db_path() -> str:
     return _get_persistent_db_path()
 
-DB = init_db()
+
+class LiveConnection:
+    """The app-wide DB handle; forwards everything to the current connection.
+
+    Modules keep the object they imported (from db import DB), so replacing
+    the database means pointing this handle at a new sqlite3 connection
+    (repoint) instead of copying data into the old one.
+    """
+    __slots__ = ('_conn',)
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    @property
+    def connection(self):
+        return self._conn
+
+    def repoint(self, conn):
+        """Use conn from now on; returns the previous connection (not closed)."""
+        old, self._conn = self._conn, conn
+        return old
+
+
+with startup_trace.phase('db.init_db'):
+    DB = LiveConnection(init_db())
+startup_trace.count_sql(DB)
 
 
 def reload_db():
     """Close and reopen the global SQLite connection after external DB file replacement.
     Safe to call multiple times. Swallows exceptions to avoid crashing UI.
     """
-    global DB
     try:
-        try:
-            if DB:
-                DB.close()
-        except Exception:
-            pass
-        DB = init_db()
-        return True
+        old = DB.repoint(init_db())
     except Exception:
         # Leave DB as-is on failure
         return False
+    try:
+        old.close()
+    except Exception:
+        pass
+    return True
+
+
+def _healthy(conn) -> bool:
+    try:
+        row = conn.execute("PRAGMA quick_check").fetchone()
+        return bool(row) and row[0] == 'ok'
+    except Exception:
+        return False
+
+
+def prepare_snapshot(path: str, warm_queries=()) -> bool:
+    """Get a downloaded DB file ready to become the live DB (any thread).
+
+    Runs PRAGMA quick_check, the same migrations as the live DB (init_db) and
+    the warm-up queries, all in the file's own connection, so the pages the
+    UI reads first are already in the OS cache. Returns False if the file is
+    not a healthy SQLite database.
+    """
+    try:
+        conn = sqlite3.connect(path, check_same_thread=False)
+    except Exception:
+        return False
+    try:
+        if not _healthy(conn):
+            return False
+    finally:
+        conn.close()
+    try:
+        conn = init_db(path)
+    except Exception:
+        return False
+    try:
+        warm_up(warm_queries, conn)
+    finally:
+        conn.close()
+    return True
+
+
+# Connection opened by the last repoint_live and the table digests of its file
+_SWAPPED = {'conn': None, 'digests': None, 'tag': None}
+
+
+def repoint_live(path: str, digests=None, tag=None):
+    """Make the prepared snapshot at path the live DB. UI thread only.
+
+    The file is renamed over the DB path and DB is pointed at a new
+    connection to it; no data is copied, so this takes milliseconds however
+    large the snapshot is. path must be on the same filesystem as the DB.
+    digests (table_digests of the file) are kept for live_digests(), and
+    tag (the server's ETag for it) for live_snapshot_tag().
+    Returns the previous connection for the caller to close off the UI
+    thread (None if it had to be closed here).
+    """
+    target = get_db_path()
+    old = DB.connection
+    try:
+        os.replace(path, target)
+    except OSError:
+        # Windows cannot rename over an open file: close the live one first
+        old.close()
+        old = None
+        try:
+            os.replace(path, target)
+        except OSError:
+            DB.repoint(sqlite3.connect(target, check_same_thread=False))
+            raise
+    conn = sqlite3.connect(target, check_same_thread=False)
+    DB.repoint(conn)
+    _SWAPPED.update(conn=conn, digests=digests, tag=tag)
+    return old
+
+
+def warm_up(queries, conn=None) -> None:
+    """Run read-only queries and discard the results to warm the page cache.
+    Used on a snapshot before it is swapped in so the next screen refresh is not cold.
+    """
+    conn = conn or DB
+    for sql in queries or ():
+        try:
+            conn.execute(sql).fetchall()
+        except Exception:
+            pass
+
+
+def snapshot_bytes() -> bytes:
+    """Return a consistent copy of the last committed database state as bytes.
+
+    A separate read-only connection is used, so a transaction still open on
+    the shared DB connection is never captured half-way. Python 3.11+ uses
+    Connection.serialize(); older runtimes read the file while holding a read
+    transaction, which keeps writers from committing mid-read.
+    """
+    from urllib.request import pathname2url
+    path = get_db_path()
+    src = sqlite3.connect(f"file:{pathname2url(path)}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        if hasattr(src, 'serialize'):
+            return src.serialize()
+        src.execute("BEGIN")
+        src.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        try:
+            src.close()
+        except Exception:
+            pass
+
+
+def table_digests(path: str, tables) -> dict:
+    """Return {table: (row count, crc32 of all rows)} for the names in tables
+    that exist in the database file at path, read through its own connection.
+
+    Used on a downloaded snapshot before it is swapped in (never on the live
+    DB), so the next download can tell which tables changed.
+    """
+    out = {}
+    conn = sqlite3.connect(path, check_same_thread=False)
+    try:
+        names = [r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'").fetchall()]
+        for name in names:
+            if name not in tables:
+                continue
+            rows = conn.execute(f'SELECT rowid, * FROM "{name}" ORDER BY rowid').fetchall()
+            out[name] = (len(rows), zlib.crc32(repr(rows).encode('utf-8')))
+    finally:
+        conn.close()
+    return out
+
+
+def _live_is_swapped() -> bool:
+    # The live DB is still exactly the snapshot repoint_live swapped in
+    conn = DB.connection
+    return _SWAPPED['conn'] is conn and conn.total_changes == 0
+
+
+def live_digests():
+    """table_digests() of the snapshot last swapped in by repoint_live, or None
+    if the live DB was written (or reopened) since, i.e. they may be stale.
+    Reads no data, so it is safe on the UI thread.
+    """
+    return _SWAPPED['digests'] if _live_is_swapped() else None
+
+
+def live_snapshot_tag():
+    """Server ETag of the snapshot last swapped in by repoint_live, or None if
+    the live DB was written (or reopened) since and must not be kept as is."""
+    return _SWAPPED['tag'] if _live_is_swapped() else None
+
+
+def changed_tables(before: dict, after: dict):
+    """Tables whose digest differs between two table_digests() results
+    (tables that appeared or disappeared count as changed)."""
+    return {name for name in set(before) | set(after) if before.get(name) != after.get(name)}
 
 
 def reset_non_player_data():
@@ -0,0 +1,231 @@
+"""Background job scheduler.
+
+One small, bounded worker pool for everything that must not run on the Kivy
+main thread (sync downloads/uploads, sound preloads),
+instead of spawning a new daemon thread per request.
+Interactive sign-in and diagnostics use AUTH_JOBS, a separate one-worker
+scheduler, so a user waiting on them never queues behind that work.
+
+- Priorities: lower numbers run first (PRIORITY_SYNC before PRIORITY_MEDIA).
+- Deduplication: jobs submitted with the same ``key`` while one is queued
+  share that job; while one is running, a single follow-up run is queued
+  so the latest request is never lost and the same key never runs twice
+  at the same time.
+- Cancellation: queued jobs are dropped; running jobs are flagged
+  (``job.cancelled``) and their callbacks are suppressed.
+- Results and errors are delivered on the main thread (Clock.schedule_once).
+- metrics() exposes per-job-name timing (queue wait and run time) for profiling.
+- After shutdown() (app stop), submit() raises RuntimeError.
+
+Job functions take the Job as their only argument so long work can check
+``job.cancelled`` between steps.
+"""
+import heapq
+import itertools
+import json
+import threading
+import time
+
+PRIORITY_SYNC = 0
+PRIORITY_MEDIA = 5  # sound preloads: idle-time work, but needed within seconds
+
+
+def _clock_deliver(fn):
+    try:
+        from kivy.clock import Clock
+        Clock.schedule_once(lambda dt: fn(), 0)
+    except Exception:
+        fn()
+
+
+class Job:
+    __slots__ = ('fn', 'key', 'name', 'priority', 'on_done', 'on_error',
+                 'cancelled', 'submitted_ts', 'started_ts', 'finished_ts', 'result', 'error')
+
+    def __init__(self, fn, key=None, name=None, priority=PRIORITY_SYNC, on_done=None, on_error=None):
+        self.fn = fn
+        self.key = key
+        self.name = name or key or getattr(fn, '__name__', 'job')
+        self.priority = int(priority)
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+        self.submitted_ts = time.monotonic()
+        self.started_ts = None
+        self.finished_ts = None
+        self.result = None
+        self.error = None
+
+    @property
+    def running(self):
+        return self.started_ts is not None and self.finished_ts is None
+
+
+class JobScheduler:
+    """Bounded priority worker pool; see the module docstring."""
+
+    def __init__(self, workers=2, deliver=None):
+        self.workers = max(1, int(workers))
+        self.deliver = deliver or _clock_deliver
+        self._cond = threading.Condition()
+        self._heap = []
+        self._seq = itertools.count()
+        self._queued = {}     # key -> Job waiting in the heap
+        self._running = {}    # key -> Job currently running
+        self._followups = {}  # key -> Job to enqueue when the running one finishes
+        self._threads = []
+        self._stats = {}
+        self._shutdown = False
+
+    # ---- Submission ----
+    def submit(self, fn, key=None, name=None, priority=PRIORITY_SYNC, on_done=None, on_error=None) -> Job:
+        job = Job(fn, key, name, priority, on_done, on_error)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError('JobScheduler is shut down')
+            if key is not None:
+                if key in self._queued:
+                    return self._queued[key]
+                if key in self._running:
+                    # Coalesce: at most one follow-up per key, it runs after the current one
+                    return self._followups.setdefault(key, job)
+            self._push(job)
+            self._ensure_workers()
+        return job
+
+    def _push(self, job):
+        heapq.heappush(self._heap, (job.priority, next(self._seq), job))
+        if job.key is not None:
+            self._queued[job.key] = job
+        self._cond.notify()
+
+    def _ensure_workers(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            t = threading.Thread(target=self._worker, name=f'jobs-{len(self._threads)}', daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    # ---- Queries / cancellation ----
+    def busy(self, key) -> bool:
+        with self._cond:
+            return key in self._queued or key in self._running
+
+    def cancel(self, key_or_job) -> bool:
+        """Cancel by key (queued, running and follow-up) or by Job. Returns True if anything was cancelled."""
+        with self._cond:
+            if isinstance(key_or_job, Job):
+                jobs = [key_or_job]
+            else:
+                jobs = [d.get(key_or_job) for d in (self._queued, self._running, self._followups)]
+                self._followups.pop(key_or_job, None)
+            found = False
+            for job in jobs:
+                if job is None or job.finished_ts is not None:
+                    continue
+                job.cancelled = True
+                found = True
+                if job.key is not None and self._queued.get(job.key) is job:
+                    # Lazily skipped when popped from the heap
+                    del self._queued[job.key]
+                if job.key is not None and self._followups.get(job.key) is job:
+                    del self._followups[job.key]
+            return found
+
+    def shutdown(self):
+        with self._cond:
+            self._shutdown = True
+            for _, _, job in self._heap:
+                job.cancelled = True
+            self._heap = []
+            self._queued.clear()
+            self._followups.clear()
+            self._cond.notify_all()
+
+    # ---- Worker ----
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.cancelled:
+                    self._record(job, 'cancelled')
+                    continue
+                if job.key is not None:
+                    self._queued.pop(job.key, None)
+                    self._running[job.key] = job
+                job.started_ts = time.monotonic()
+            try:
+                job.result = job.fn(job)
+            except Exception as e:
+                job.error = e
+            job.finished_ts = time.monotonic()
+            with self._cond:
+                if job.key is not None and self._running.get(job.key) is job:
+                    del self._running[job.key]
+                    nxt = self._followups.pop(job.key, None)
+                    if nxt is not None and not nxt.cancelled:
+                        self._push(nxt)
+                self._record(job, 'cancelled' if job.cancelled else ('error' if job.error else 'ok'))
+            if not job.cancelled:
+                self._deliver(job)
+
+    def _deliver(self, job):
+        cb = job.on_error if job.error is not None else job.on_done
+        if cb is None:
+            return
+        arg = job.error if job.error is not None else job.result
+
+        def _call():
+            if job.cancelled:
+                return
+            try:
+                cb(arg)
+            except Exception:
+                pass
+        self.deliver(_call)
+
+    # ---- Metrics ----
+    def _record(self, job, outcome):
+        st = self._stats.setdefault(job.name, {
+            'ok': 0, 'error': 0, 'cancelled': 0, 'runs': 0,
+            'run_ms_total': 0.0, 'run_ms_max': 0.0, 'wait_ms_total': 0.0,
+        })
+        st[outcome] += 1
+        if job.started_ts is not None:
+            st['runs'] += 1
+            st['wait_ms_total'] += (job.started_ts - job.submitted_ts) * 1000.0
+            if job.finished_ts is not None:
+                run = (job.finished_ts - job.started_ts) * 1000.0
+                st['run_ms_total'] += run
+                st['run_ms_max'] = max(st['run_ms_max'], run)
+
+    def metrics(self) -> dict:
+        """Per job name: counts, total/avg/max run time and avg queue wait (ms)."""
+        with self._cond:
+            out = {}
+            for name, st in self._stats.items():
+                runs = st['runs']
+                m = dict(st)
+                m['run_ms_avg'] = round(st['run_ms_total'] / runs, 2) if runs else 0.0
+                m['wait_ms_avg'] = round(st['wait_ms_total'] / runs, 2) if runs else 0.0
+                out[name] = m
+            return {'jobs': out, 'queued': len(self._queued), 'running': len(self._running)}
+
+    def export_metrics(self, path) -> bool:
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.metrics(), f, indent=2)
+            return True
+        except Exception:
+            return False
+
+
+# Shared app-wide scheduler
+JOBS = JobScheduler(workers=2)
+# Sign-in and connection diagnostics: the user is waiting on them, so they get
+# their own worker instead of queuing behind downloads, uploads and preloads
+AUTH_JOBS = JobScheduler(workers=1)
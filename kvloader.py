@@ -0,0 +1,127 @@
+"""Load kv files on demand, with an optional parse cache.
+
+ui.kv only holds the shared rules (root layout, typography, buttons, bottom
+nav, toast). Each screen's rules live in kv/<name>.kv and are loaded right
+before that screen is first constructed (see LazyScreenManager in main.py),
+so their parsing is no longer on the cold-start path.
+
+With DRAFTBUDDY_KV_CACHE=1 the parsed and precompiled rule tree of each kv
+file is pickled into a cache directory and reused on the next launch as long
+as the file content, Kivy and Python versions are unchanged (code objects are
+stored with marshal, which is Python-version specific). Anything unexpected
+(templates, a root widget, a broken cache file) falls back to
+Builder.load_file.
+"""
+import copyreg
+import hashlib
+import importlib.util
+import marshal
+import os
+import pickle
+import types
+
+from kivy.factory import Factory
+from kivy.lang import Builder
+from kivy.lang.parser import Parser
+from kivy.resources import resource_find
+
+import startup_trace
+
+CACHE_ENABLED = os.environ.get('DRAFTBUDDY_KV_CACHE') == '1'
+
+_loaded = set()
+_cache_dir = None
+
+
+def set_cache_dir(path):
+    global _cache_dir
+    _cache_dir = path
+
+
+def is_loaded(path):
+    return (resource_find(path) or path) in _loaded
+
+
+def load_kv(path) -> bool:
+    """Load a kv file once. Returns True if it was loaded by this call."""
+    fn = resource_find(path) or path
+    if fn in _loaded:
+        return False
+    _loaded.add(fn)
+    with startup_trace.phase(f"kv.{os.path.splitext(os.path.basename(fn))[0]}"):
+        if not (CACHE_ENABLED and _cache_dir) or not _load_cached(fn):
+            Builder.load_file(fn)
+    return True
+
+
+# ---- Parse cache ----
+def _reduce_code(code):
+    return marshal.loads, (marshal.dumps(code),)
+
+
+def _cache_path(fn, data):
+    import kivy
+    h = hashlib.sha1()
+    h.update(data.encode('utf-8'))
+    h.update(kivy.__version__.encode('utf-8'))
+    h.update(importlib.util.MAGIC_NUMBER)
+    base = os.path.splitext(os.path.basename(fn))[0]
+    return os.path.join(_cache_dir, f"{base}-{h.hexdigest()[:16]}.pickle"), base
+
+
+def _load_cached(fn) -> bool:
+    try:
+        with open(fn, 'r', encoding='utf8') as f:
+            data = f.read()
+        path, base = _cache_path(fn, data)
+        parser = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    parser = pickle.load(f)
+                # #:import / #:set directives run at parse time; replay them
+                parser.execute_directives()
+            except Exception:
+                parser = None
+        if parser is None:
+            parser = Parser(content=data, filename=fn)
+            if parser.templates or parser.root:
+                return False
+            _store(parser, path, base)
+        if parser.templates or parser.root:
+            return False
+        _merge(parser, fn)
+        return True
+    except Exception:
+        return False
+
+
+def _store(parser, path, base):
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        # Drop stale entries of the same file
+        for name in os.listdir(_cache_dir):
+            if name.startswith(base + '-') and name.endswith('.pickle'):
+                try:
+                    os.remove(os.path.join(_cache_dir, name))
+                except Exception:
+                    pass
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            p = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            p.dispatch_table = copyreg.dispatch_table.copy()
+            p.dispatch_table[types.CodeType] = _reduce_code
+            p.dump(parser)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def _merge(parser, fn):
+    # Same bookkeeping as Builder.load_string for a rules-only file
+    Builder.rules.extend(parser.rules)
+    Builder._clear_matchcache()
+    for name, baseclasses in parser.dynamic_classes.items():
+        Factory.register(name, baseclasses=baseclasses, filename=fn, warn=True)
+    if parser.dynamic_classes or parser.rules:
+        Builder.files.append(fn)
@@ -0,0 +1,65 @@
+"""Deferred imports for heavy or optional modules.
+
+LazyModule('requests') stands in for the module and imports it on first
+attribute access, so code keeps writing `requests.get(...)` /
+`except requests.exceptions.Timeout` while the import cost moves from the
+cold start to the first network call. optional() resolves an optional
+dependency (e.g. Kivy Garden svg) the first time it is asked for and caches
+the answer, None when it is not installed.
+
+Each import done here is recorded in the startup trace as `lazy.<module>`
+(see startup_trace.py), so it is visible when one sneaks back into startup.
+"""
+import importlib
+import threading
+
+import startup_trace
+
+_lock = threading.Lock()
+_optional = {}  # (module, attr) -> object or None
+
+
+class LazyModule:
+    """Module proxy that imports `name` on first attribute access (thread-safe)."""
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        mod = self.__dict__['_module']
+        if mod is None:
+            with _lock:
+                mod = self.__dict__['_module']
+                if mod is None:
+                    with startup_trace.phase(f"lazy.{self.__dict__['_name']}"):
+                        mod = importlib.import_module(self.__dict__['_name'])
+                    self.__dict__['_module'] = mod
+        return mod
+
+    @property
+    def loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
+
+
+def optional(name, attr=None):
+    """Import `name` (and return its `attr`) on first call; None if unavailable. Cached."""
+    key = (name, attr)
+    if key in _optional:
+        return _optional[key]
+    with _lock:
+        if key not in _optional:
+            try:
+                with startup_trace.phase(f'lazy.{name}'):
+                    mod = importlib.import_module(name)
+                _optional[key] = getattr(mod, attr) if attr else mod
+            except Exception:
+                _optional[key] = None
+    return _optional[key]
@@ -10,16 +10,21 @@ This module wires together all Kivy Screens, kv layout, and business logic for:
 Notes:
 - This documentation pass adds docstrings and comments without changing logic
   or visuals.
-- The embedded KV string defines most of the UI; the code-behind updates it.
+- Layout lives in kv files: shared rules in ui.kv, one kv/<screen>.kv per
+  screen, loaded when the screen is first built (see kvloader.py).
 """
 
+import startup_trace  # first, so the cold-start trace (if enabled) covers every import
 import sqlite3
 import random
 import os
 import time
 from datetime import datetime
 import json
-import requests
+from lazy_imports import LazyModule
+startup_trace.mark('import.stdlib')
+# Network stack loads on the first request (login, sync), not before the first frame
+requests = LazyModule('requests')
 
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition, SlideTransition
@@ -30,15 +35,22 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.clock import Clock
-from kivy.core.audio import SoundLoader
-from pairing import get_name_for_event_player, compute_standings, generate_round_one, compute_next_round_pairings
-from timer import DraftTimer, IconButton
+from kivy.event import EventDispatcher
 from kivy.core.window import Window
 from kivy.utils import platform
 from kivy.metrics import dp
 from kivy.animation import Animation
+startup_trace.mark('import.kivy')
+# App modules; importing db opens the database and runs migrations (traced as db.init_db)
+from pairing import get_name_for_event_player, compute_standings, generate_round_one, compute_next_round_pairings
+from timer import DraftTimer, IconButton, MAX_PODS, saved_pod_count
+from ticker import TICKER
+from sounds import SOUNDS
 from db import get_db_path
+import kvloader
+startup_trace.mark('import.app_modules')
 
 # Ensure desktop window starts in a smartphone-like portrait proportion (20:9)
 # Only apply on desktop platforms to avoid interfering with mobile builds
@@ -59,415 +71,100 @@ if platform in ("win", "linux", "macosx"):
 
 DB_FILE = "events.db"
 
-KV = r'''
-#:import dp kivy.metrics.dp
-
-<PlayersScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(40)
-            Label:
-                markup: True
-                text: "[b]Players[/b]"
-            Button:
-                text: "New Player"
-                size_hint_x: None
-                width: dp(140)
-                on_release: root.manager.current = "newplayer"
-
-        BoxLayout:
-            size_hint_y: None
-            height: dp(36)
-            TextInput:
-                id: filter_input
-                hint_text: "Filter..."
-                on_text: root.filter_players(self.text)
-
-        ScrollView:
-            GridLayout:
-                id: players_list
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(6)
-                row_default_height: dp(36)
-
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                text: "Events"
-                on_release: root.manager.current = "eventslist"
-            Button:
-                text: "League Tracker"
-                on_release: root.manager.current = "league"
-            Button:
-                text: "Bingo"
-                on_release: root.manager.current = "bingo"
-            Button:
-                text: "Draft Timer"
-                on_release: root.manager.current = "drafttimer"
-
-<NewPlayerScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            markup: True
-            text: "[b]Add New Player[/b]"
-        TextInput:
-            id: name_input
-            hint_text: "Player name"
-            multiline: False
-        BoxLayout:
-            size_hint_y: None
-            height: dp(48)
-            Button:
-                text: "Save"
-                on_release:
-                    root.save_player(name_input.text)
-            Button:
-                text: "Back"
-                on_release: root.manager.current = "players"
-
-<CreateEventScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            markup: True
-            text: "[b]Create Event[/b]"
-        BoxLayout:
-            size_hint_y: None
-            height: dp(36)
-            TextInput:
-                id: event_name
-                hint_text: "Event name"
-                multiline: False
-            Spinner:
-                id: event_type
-                text: "draft"
-                values: ["draft", "sealed", "cube"]
-                size_hint_x: None
-                width: dp(120)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(36)
-            TextInput:
-                id: rounds_input
-                hint_text: "Rounds (e.g. 3)"
-                multiline: False
-                input_filter: "int"
-            TextInput:
-                id: round_time
-                hint_text: "Round time (sec)"
-                multiline: False
-                input_filter: "int"
-            Button:
-                text: "Randomize seating"
-                size_hint_x: None
-                width: dp(140)
-                on_release: root.randomize_seating()
-        Label:
-            text: "Select players (or add guests)"
-            size_hint_y: None
-            height: dp(24)
-        ScrollView:
-            GridLayout:
-                id: players_select
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(6)
-                row_default_height: dp(36)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            TextInput:
-                id: guest_name
-                hint_text: "Guest name (optional)"
-                multiline: False
-            Button:
-                text: "Add guest to list"
-                on_release:
-                    root.add_guest(guest_name.text)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(48)
-            Button:
-                text: "Start Event"
-                on_release:
-                    root.start_event(event_name.text, event_type.text, rounds_input.text, round_time.text)
-            Button:
-                text: "Cancel"
-                on_release: root.manager.current = "players"
-
-<EventsListScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            markup: True
-            text: "[b]Events[/b]"
-        BoxLayout:
-            size_hint_y: None
-            height: dp(40)
-            Button:
-                text: "Create Event"
-                size_hint_x: None
-                width: dp(140)
-                on_release: root.manager.current = "createevent"
-            Widget:
-        ScrollView:
-            GridLayout:
-                id: events_grid
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(6)
-                row_default_height: dp(48)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                text: "Events"
-                on_release: root.manager.current = "eventslist"
-            Button:
-                text: "League Tracker"
-                on_release: root.manager.current = "league"
-            Button:
-                text: "Bingo"
-                on_release: root.manager.current = "bingo"
-            Button:
-                text: "Draft Timer"
-                on_release: root.manager.current = "drafttimer"
-
-<EventScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(40)
-            Label:
-                id: event_title
-                text: root.event_title
-                color: 0,0,0,1
-            Label:
-                id: round_label
-                text: "Round: " + str(root.current_round)
-                color: 0,0,0,1
-            Button:
-                text: "Close Event"
-                size_hint_x: None
-                width: dp(120)
-                on_release: root.close_event()
-        ScrollView:
-            GridLayout:
-                id: matches_grid
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(6)
-                row_default_height: dp(48)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                id: next_btn
-                text: "Next Round"
-                on_release: root.next_round()
-            Button:
-                text: "Back to Events"
-                on_release: root.manager.current = "eventslist"
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                text: "Events"
-                on_release: root.manager.current = "eventslist"
-            Button:
-                text: "League Tracker"
-                on_release: root.manager.current = "league"
-            Button:
-                text: "Bingo"
-                on_release: root.manager.current = "bingo"
-            Button:
-                text: "Draft Timer"
-                on_release: root.manager.current = "drafttimer"
-
-<MatchRow>:
-    size_hint_y: None
-    height: dp(48)
-    spacing: dp(8)
-    canvas.before:
-        Color:
-            rgba: (0.95,0.95,0.95,1) if self.bye else (1,1,1,1)
-        Rectangle:
-            pos: self.pos
-            size: self.size
-    Label:
-        text: root.p1_name
-        color: 0,0,0,1
-    Button:
-        id: p1btn
-        text: str(root.score1)
-        size_hint_x: None
-        width: dp(60)
-        on_release: root.cycle_score(1)
-        color: 0,0,0,1
-    Label:
-        text: "-"
-        size_hint_x: None
-        width: dp(20)
-        color: 0,0,0,1
-    Button:
-        id: p2btn
-        text: str(root.score2)
-        size_hint_x: None
-        width: dp(60)
-        on_release: root.cycle_score(2)
-        color: 0,0,0,1
-    Label:
-        text: root.p2_name
-        color: 0,0,0,1
-
-<SeatingScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        TitleLabel:
-            text: "Table Seating"
-            size_hint_y: None
-            height: dp(32)
-        ScrollView:
-            id: seat_sv
-            do_scroll_x: False
-            canvas.after:
-                Color:
-                    rgba: 1, 1, 1, 1
-                Line:
-                    rectangle: (self.x, self.y, self.width, self.height)
-                    width: 1.2
-            GridLayout:
-                id: seating_list
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(6)
-                row_default_height: dp(32)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(48)
-            Button:
-                text: "Randomize again"
-                on_release: root.randomize()
-            Button:
-                text: "Begin Round 1"
-                on_release: root.confirm_and_begin()
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                text: "Events"
-                on_release: root.manager.current = "eventslist"
-            Button:
-                text: "League Tracker"
-                on_release: root.manager.current = "league"
-            Button:
-                text: "Bingo"
-                on_release: root.manager.current = "bingo"
-            Button:
-                text: "Draft Timer"
-                on_release: root.manager.current = "drafttimer"
-
-<StandingsScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        TitleLabel:
-            id: standings_title
-            text: "Standings"
-            size_hint_y: None
-            height: dp(32)
-        ScrollView:
-            id: std_sv
-            do_scroll_x: False
-            canvas.after:
-                Color:
-                    rgba: 1, 1, 1, 1
-                Line:
-                    rectangle: (self.x, self.y, self.width, self.height)
-                    width: 1.2
-            GridLayout:
-                id: standings_grid
-                cols: 1
-                size_hint_y: None
-                height: self.minimum_height
-                spacing: dp(4)
-                row_default_height: dp(28)
-        BoxLayout:
-            size_hint_y: None
-            height: dp(48)
-            Button:
-                text: "Back to Events"
-                on_release: root.manager.current = "eventslist"
-        BoxLayout:
-            size_hint_y: None
-            height: dp(56)
-            Button:
-                text: "Events"
-                on_release: root.manager.current = "eventslist"
-            Button:
-                text: "League Tracker"
-                on_release: root.manager.current = "league"
-            Button:
-                text: "Bingo"
-                on_release: root.manager.current = "bingo"
-            Button:
-                text: "Draft Timer"
-                on_release: root.manager.current = "drafttimer"
-
-<LeagueScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            text: "League Tracker (coming soon)"
-
-<BingoScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            text: "Bingo (coming soon)"
-
-<DraftTimerScreen>:
-    BoxLayout:
-        orientation: "vertical"
-        padding: dp(10)
-        spacing: dp(8)
-        Label:
-            text: "Draft Timer (coming soon)"
-'''
-
 # ----------------------
 # DB helpers
 # ----------------------
 from db import DB
 
+# Read-only queries that mirror what each screen runs on refresh. After a
+# downloaded snapshot is applied they are replayed once so the first refresh
+# hits a warm page cache instead of cold storage.
+_WARMUP_QUERIES = {
+    'players': [
+        "SELECT id, name FROM players ORDER BY name",
+    ],
+    'eventslist': [
+        "SELECT id, name, type, status FROM events ORDER BY (status='active') DESC, created_at DESC",
+    ],
+    'event': [
+        "SELECT id, name, rounds, current_round, status, round_time, round_start_ts FROM events WHERE status='active'",
+        "SELECT m.id, m.round, m.player1, m.player2, m.score_p1, m.score_p2, m.bye FROM matches m JOIN events e ON e.id=m.event_id WHERE e.status='active'",
+        "SELECT ep.id, ep.player_id, ep.guest_name FROM event_players ep JOIN events e ON e.id=ep.event_id WHERE e.status='active'",
+        "SELECT id, COALESCE(nickname, name) FROM players",
+    ],
+    'standings': [
+        "SELECT id, event_id, player_id, guest_name FROM event_players",
+        "SELECT event_id, round, player1, player2, score_p1, score_p2, bye FROM matches",
+    ],
+    'league': [
+        "SELECT id, name, start_ts, end_ts FROM leagues ORDER BY start_ts DESC",
+        "SELECT id FROM events WHERE status='closed'",
+        "SELECT id, event_id, player_id, guest_name FROM event_players",
+        "SELECT player1, player2, score_p1, score_p2, bye FROM matches",
+    ],
+    'bingo': [
+        "SELECT id, title, COALESCE(extra_notes, '') FROM bingo_achievements ORDER BY id ASC",
+        "SELECT player_id,c0,c1,c2,c3,c4,c5,c6,c7,c8 FROM bingo_players",
+        "SELECT * FROM bingo_meta WHERE id=1",
+        "SELECT id, COALESCE(nickname, name) as n FROM players ORDER BY n COLLATE NOCASE",
+    ],
+}
+
+# Tables each screen reads; a synced change to any of them refreshes that screen
+_SCREEN_TABLES = {
+    'players': {'players'},
+    'eventslist': {'events'},
+    'event': {'events', 'matches', 'event_players', 'players'},
+    'standings': {'events', 'matches', 'event_players', 'players'},
+    'league': {'leagues', 'events', 'matches', 'event_players', 'players'},
+    'bingo': {'players', 'bingo_players', 'bingo_meta', 'bingo_achievements'},
+}
+# Only these tables are digested on a download; changes elsewhere refresh nothing
+_SYNC_TABLES = frozenset().union(*_SCREEN_TABLES.values())
+
+# Guest polling intervals (seconds) when the push channel is not live: a round clock
+# is running, an event is active between rounds, nothing is going on
+_GUEST_POLL_LIVE = 15.0
+_GUEST_POLL_ACTIVE = 45.0
+_GUEST_POLL_IDLE = 180.0
+
+def _call_on_ui(fn, timeout: float = 60.0):
+    """Run fn() on the Kivy main thread and return its result.
+    Called directly when already on the main thread; from a worker it blocks
+    until the main thread ran it. If the main thread has not started it after
+    `timeout`, the call is cancelled (it will never run) and TimeoutError is
+    raised; a call that already started is always waited for.
+    """
+    import threading
+    if threading.current_thread() is threading.main_thread():
+        return fn()
+    lock = threading.Lock()
+    done = threading.Event()
+    box = {'state': 'pending'}
+
+    def _run(_dt):
+        with lock:
+            if box['state'] != 'pending':
+                return
+            box['state'] = 'running'
+        try:
+            box['result'] = fn()
+        except Exception as e:
+            box['error'] = e
+        finally:
+            done.set()
+    ev = Clock.schedule_once(_run, 0)
+    if not done.wait(timeout):
+        with lock:
+            if box['state'] == 'pending':
+                box['state'] = 'cancelled'
+                ev.cancel()
+                raise TimeoutError('UI thread did not run the call')
+        done.wait()
+    if 'error' in box:
+        raise box['error']
+    return box.get('result')
+
 # ----------------------
 # Nickname helpers
 # ----------------------
@@ -630,6 +327,39 @@ def _rebuild_all_nicknames():
 # ----------------------
 # UI Widgets
 # ----------------------
+class ThemePalette(EventDispatcher):
+    """Colors derived from EventsApp.theme, computed once per theme change.
+
+    kv rules bind to these properties (app.palette.*) instead of recomputing
+    RGBA lists from app.theme in every binding of every row. The defaults are
+    the fallback colors used when no theme is available.
+    """
+    row_bg_even = ListProperty([0.96, 0.96, 0.96, 1])
+    row_bg_odd = ListProperty([0.92, 0.92, 0.92, 1])
+    # BYE rows: clearly distinct, soft lighter tint
+    row_bg_bye = ListProperty([1.0, 0.97, 0.88, 1])
+    row_outline = ListProperty([0, 0, 0, 0.12])
+    on_surface = ListProperty([0.1, 0.1, 0.1, 1])
+    on_surface_muted = ListProperty([0.2, 0.2, 0.2, 1])
+
+    def update(self, theme):
+        try:
+            r, g, b = (float(c) for c in tuple(theme.get('surface', (1, 1, 1)))[:3])
+            self.row_bg_even = [r, g, b, 1]
+            self.row_bg_odd = [max(r - 0.03, 0), max(g - 0.03, 0), max(b - 0.03, 0), 1]
+            self.row_bg_bye = [min(r + 0.10, 1), min(g + 0.10, 1), min(b + 0.06, 1), 1]
+            r, g, b = (float(c) for c in tuple(theme.get('on_surface', (0.1, 0.1, 0.1)))[:3])
+            self.on_surface = [r, g, b, 1]
+            self.on_surface_muted = [max(r - 0.25, 0), max(g - 0.25, 0), max(b - 0.25, 0), 1]
+            self.row_outline = [r, g, b, 0.12]
+        except Exception:
+            pass
+
+
+# Shared palette; EventsApp keeps it in sync with its theme
+PALETTE = ThemePalette()
+
+
 class MatchRow(BoxLayout):
     p1_name = StringProperty("")
     p2_name = StringProperty("")
@@ -640,68 +370,7 @@ class MatchRow(BoxLayout):
     row_index = NumericProperty(0)
     on_score_change = ObjectProperty(None, allownone=True)
 
-    def get_bg(self):
-        try:
-            app = App.get_running_app()
-        except Exception:
-            app = None
-        try:
-            if app and hasattr(app, 'theme'):
-                s = app.theme.get('surface', (1, 1, 1))
-                # ensure we have 3 components
-                r, g, b = float(s[0]), float(s[1]), float(s[2])
-                if self.bye:
-                    # Make BYE rows clearly distinct with a soft, lighter tint
-                    return [min(r + 0.10, 1), min(g + 0.10, 1), min(b + 0.06, 1), 1]
-                if (int(self.row_index) % 2) == 0:
-                    return [r, g, b, 1]
-                else:
-                    return [max(r - 0.03, 0), max(g - 0.03, 0), max(b - 0.03, 0), 1]
-            else:
-                # Fallback light/alt rows; BYE gets a warm highlight
-                if self.bye:
-                    return [1.0, 0.97, 0.88, 1]
-                return [0.96, 0.96, 0.96, 1] if (int(self.row_index) % 2) == 0 else [0.92, 0.92, 0.92, 1]
-        except Exception:
-            return [1, 1, 1, 1]
-
-    def get_score_bg_rgba(self, disabled, state):
-        # Theme-aware blueish pill background for score buttons
-        try:
-            app = App.get_running_app()
-        except Exception:
-            app = None
-        try:
-            if disabled:
-                return [0.75, 0.75, 0.78, 0.35]
-            # Enabled state
-            alpha = 0.22 if state == 'normal' else 0.32
-            if app and hasattr(app, 'theme'):
-                p = app.theme.get('primary', (0.16, 0.47, 0.96))
-                r, g, b = float(p[0]), float(p[1]), float(p[2])
-                return [r, g, b, alpha]
-            # Fallback primary-ish blue
-            return [0.16, 0.47, 0.96, alpha]
-        except Exception:
-            return [0.16, 0.47, 0.96, 0.22]
-
-    def get_score_border_rgba(self, disabled):
-        # Subtle border matching the primary hue
-        try:
-            app = App.get_running_app()
-        except Exception:
-            app = None
-        try:
-            if disabled:
-                return [0.6, 0.6, 0.65, 0.45]
-            if app and hasattr(app, 'theme'):
-                p = app.theme.get('primary', (0.16, 0.47, 0.96))
-                r, g, b = float(p[0]), float(p[1]), float(p[2])
-                return [r, g, b, 0.45]
-            return [0.16, 0.47, 0.96, 0.45]
-        except Exception:
-            return [0.16, 0.47, 0.96, 0.45]
-
+    # Row colors come from the shared PALETTE, bound in kv/event.kv
     def cycle_score(self, side):
         """Cycle a player's game score 0→1→2→0 and persist it.
 
@@ -752,6 +421,95 @@ class MatchRow(BoxLayout):
         # visually update (buttons bound to values)
 
 
+class ScoreTableRow(RecycleDataViewBehavior, BoxLayout):
+    """One recycled row of a ScoreTable.
+
+    Cell widgets are built once per column layout and then only get their text
+    swapped when the RecycleView reuses the row for another data item.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('size_hint_y', None)
+        kwargs.setdefault('height', dp(42))
+        kwargs.setdefault('spacing', dp(4))
+        super().__init__(**kwargs)
+        self._layout = None
+        self._labels = []
+        self._name_sv = None
+
+    def _build(self, layout):
+        from kivy.uix.scrollview import ScrollView
+        col_sizes, name_col, header = layout
+        self.clear_widgets()
+        self._labels = []
+        self._name_sv = None
+        for i, size in enumerate(col_sizes):
+            if i == name_col and not header:
+                # Name column: horizontally scrollable if too long
+                sv = ScrollView(size_hint_x=size, do_scroll_x=True, do_scroll_y=False, bar_width=0)
+                # Hard-disable any vertical scrolling/bounce on some devices
+                sv.effect_y = None
+                sv.scroll_wheel_distance = 0
+                lbl = Label(size_hint=(None, 1), color=(1, 1, 1, 1))
+                # Do not wrap; size to texture for horizontal scrolling
+                lbl.bind(texture_size=lambda inst, val: setattr(inst, 'width', val[0] + dp(4)))
+                sv.add_widget(lbl)
+                self.add_widget(sv)
+                self._name_sv = sv
+            else:
+                lbl = Label(size_hint_x=size, markup=header, color=(1, 1, 1, 1),
+                            halign=('left' if i == name_col else 'center'), valign='middle')
+                lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', val))
+                self.add_widget(lbl)
+            self._labels.append(lbl)
+        self._layout = layout
+
+    def refresh_view_attrs(self, rv, index, data):
+        layout = data['layout']
+        if layout != self._layout:
+            self._build(layout)
+        elif self._name_sv is not None:
+            # Recycled for another player: show the start of the name again
+            self._name_sv.scroll_x = 0
+        for lbl, text in zip(self._labels, data['cells']):
+            if lbl.text != text:
+                lbl.text = text
+
+
+class ScoreTable(BoxLayout):
+    """Virtualized scoreboard: fixed header plus a RecycleView of ScoreTableRow (see ui.kv).
+
+    Usage: set_columns(headers, col_sizes, name_col) once, then set_rows(rows)
+    with one sequence of display strings per row. Only visible rows have widgets.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._columns = None
+        self._layout = None
+
+    def set_columns(self, headers, col_sizes, name_col=1):
+        columns = (tuple(headers), tuple(col_sizes), int(name_col))
+        if columns == self._columns:
+            return
+        self._columns = columns
+        self._layout = (columns[1], columns[2], False)
+        # Header markup is built once per column set, rows carry plain text (no markup parsing)
+        self.ids.header.refresh_view_attrs(None, 0, {
+            'layout': (columns[1], columns[2], True),
+            'cells': tuple(f"[b]{h}[/b]" for h in columns[0]),
+        })
+        self.ids.rv.data = []
+
+    def set_rows(self, rows):
+        layout = self._layout
+        data = [{'layout': layout, 'cells': tuple(str(v) for v in row)} for row in rows]
+        rv = self.ids.rv
+        # Unchanged scoreboard (e.g. a data-change refresh): keep rows and scroll position
+        if data != rv.data:
+            rv.data = data
+
+
 # ----------------------
 # Screens
 # ----------------------
@@ -866,42 +624,24 @@ class PlayersScreen(Screen):
             pass
         self.refresh()
 
-    def _add_player_row(self, pid, name):
-        row = BoxLayout(size_hint_y=None, height=dp(56))
-        # Show full name only on Players main list
-        lbl = Label(text=f"{name}", color=(1,1,1,1))
-        btn_del = Button(text="Delete", size_hint_x=None, width=dp(200))
-        try:
-            btn_del.text_size = (None, None)
-            btn_del.shorten = True
-            btn_del.font_size = '18sp'
-        except Exception:
-            pass
-        # Disable delete for guests
-        try:
-            btn_del.disabled = not _is_manager()
-            btn_del.opacity = 1 if _is_manager() else 0.5
-        except Exception:
-            pass
-        btn_del.bind(on_release=lambda inst, _pid=pid, _name=name: self.delete_player(_pid, _name))
-        row.add_widget(lbl)
-        row.add_widget(btn_del)
-        self.ids.players_list.add_widget(row)
-
     def refresh(self):
-        grid = self.ids.players_list
-        grid.clear_widgets()
+        # Load all players once; the RecycleView only creates rows for what is on screen
         cur = DB.execute("SELECT id, name FROM players ORDER BY name")
-        for pid, name in cur.fetchall():
-            self._add_player_row(pid, name)
+        self._rows = [((name or '').lower(), {'pid': int(pid), 'player_name': name or ''})
+                      for pid, name in cur.fetchall()]
+        try:
+            text = self.ids.filter_input.text
+        except Exception:
+            text = ''
+        self.filter_players(text)
 
     def filter_players(self, text):
-        grid = self.ids.players_list
-        grid.clear_widgets()
-        q = "%" + (text or "") + "%"
-        cur = DB.execute("SELECT id, name FROM players WHERE name LIKE ? ORDER BY name", (q,))
-        for pid, name in cur.fetchall():
-            self._add_player_row(pid, name)
+        # Filter the cached rows (case-insensitive substring, like SQL LIKE); only the data list changes
+        if getattr(self, '_rows', None) is None:
+            self.refresh()
+            return
+        q = (text or '').lower()
+        self.ids.players_list.data = [d for key, d in self._rows if q in key] if q else [d for _, d in self._rows]
 
     def delete_player(self, pid, name):
         if not _is_manager():
@@ -937,6 +677,19 @@ class PlayersScreen(Screen):
         self.refresh()
 
 
+class PlayerRow(BoxLayout):
+    """Recycled row of the Players list (RecycleView viewclass, see ui.kv)."""
+    pid = NumericProperty(0)
+    player_name = StringProperty('')
+
+    def delete(self):
+        try:
+            scr = App.get_running_app().root.ids.sm.get_screen('players')
+            scr.delete_player(self.pid, self.player_name)
+        except Exception:
+            pass
+
+
 class NewPlayerScreen(Screen):
     def save_player(self, name):
         if not _is_manager():
@@ -1015,6 +768,53 @@ class CreateEventDetailsScreen(Screen):
             pass
 
 
+class RosterModel:
+    """In-memory roster for CreateEventScreen: every player is either available or selected.
+
+    Players are loaded once (one query) when the screen opens. A tap moves a single
+    row dict between the two RecycleView data lists; nothing is re-queried or rebuilt.
+    """
+
+    def __init__(self, rows):
+        # rows: (pid, display_name, full_name) ordered by full name
+        self.rows = {}
+        self.order = []
+        for rank, (pid, disp, full) in enumerate(rows):
+            pid = int(pid)
+            self.rows[pid] = {
+                'side': 'available', 'key': pid, 'label': disp or '', 'rank': rank,
+                'hay': f"{disp} {full}".lower(),
+            }
+            self.order.append(pid)
+        self.selected = {}  # pid -> None, insertion ordered
+
+    def name(self, pid):
+        row = self.rows.get(pid)
+        return row['label'] if row else None
+
+    def available(self, filt=''):
+        filt = (filt or '').strip().lower()
+        return [self.rows[pid] for pid in self.order
+                if pid not in self.selected and (not filt or filt in self.rows[pid]['hay'])]
+
+    def selected_row(self, pid):
+        return {'side': 'selected', 'key': pid, 'label': f"• {self.name(pid) or f'Player {pid}'}"}
+
+
+class RosterRow(BoxLayout):
+    """Recycled row of the CreateEventScreen lists (RecycleView viewclass, see ui.kv)."""
+    side = StringProperty('available')  # 'available' (Add) or 'selected' (X)
+    key = ObjectProperty(None)          # player id, or the guest tuple for guests
+    label = StringProperty('')
+
+    def tap(self):
+        try:
+            scr = App.get_running_app().root.ids.sm.get_screen('createevent')
+            scr.roster_tap(self.side, self.key)
+        except Exception:
+            pass
+
+
 class CreateEventScreen(Screen):
     seating = ListProperty([])  # deprecated for seating preview
     guest_list = ListProperty([])  # list of (None, guest_name)
@@ -1027,108 +827,84 @@ class CreateEventScreen(Screen):
             self.ids.filter_input.text = ""
         except Exception:
             pass
+        self._load_roster()
+
+    def _load_roster(self):
+        cur = DB.execute("SELECT id, COALESCE(nickname, name) as dname, name FROM players ORDER BY name")
+        self._roster = RosterModel(cur.fetchall())
         self.refresh_players()
         self.update_selected_view()
 
-    def refresh_players(self):
-        # Rebuild the selectable players list, applying filter and excluding already selected players
-        sel = self.ids.players_select
-        sel.clear_widgets()
+    def _filter_text(self):
         try:
-            filt = (self.ids.filter_input.text or "").strip().lower()
+            return (self.ids.filter_input.text or "").strip().lower()
         except Exception:
-            filt = ""
-        if not hasattr(self, 'selected_ids'):
-            self.selected_ids = set()
-        cur = DB.execute("SELECT id, COALESCE(nickname, name) as dname, name FROM players ORDER BY name")
-        rows = cur.fetchall()
-        for pid, disp_name, full_name in rows:
-            # Skip players already added to the event (they will appear in the Selected list)
-            if pid in self.selected_ids:
-                continue
-            hay = f"{disp_name} {full_name}".lower()
-            if filt and filt not in hay:
-                continue
-            row = BoxLayout(size_hint_y=None, height=dp(56))
-            lbl = Label(text=disp_name)
-            # Make label flexible and centered; button has fixed width (prevents clipping)
-            try:
-                lbl.size_hint_x = 1
-                lbl.halign = 'center'
-                lbl.valign = 'middle'
-                lbl.shorten = True
-                # Centering requires text_size to match width
-                lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', (inst.width, None)))
-            except Exception:
-                pass
-            def add_player(instance, _pid=pid):
-                self.selected_ids.add(_pid)
-                # Rebuild lists so the player disappears here and appears in Selected
-                self.refresh_players()
-                self.update_selected_view()
-            btn = Button(text="Add")
-            try:
-                btn.size_hint_x = None
-                btn.width = dp(80)
-                btn.text_size = (None, None)
-                btn.shorten = True
-                btn.font_size = '18sp'
-            except Exception:
-                pass
-            btn.bind(on_release=add_player)
-            row.add_widget(lbl)
-            row.add_widget(btn)
-            sel.add_widget(row)
-        # Update the selected list preview
-        self.update_selected_view()
+            return ""
+
+    def refresh_players(self):
+        # Selectable list = roster minus selected, filtered; data only, rows are recycled
+        if getattr(self, '_roster', None) is None:
+            self._load_roster()
+            return
+        data = self._roster.available(self._filter_text())
+        # Ranks of the rows shown, kept in step with data for bisect (no key= before 3.10)
+        self._avail_ranks = [d['rank'] for d in data]
+        self.ids.players_select.data = data
 
     def filter_players(self, text):
-        # Rebuild list based on filter text
         self.refresh_players()
 
     def update_selected_view(self):
-        # Populate the selected players/guests list
+        # Populate the selected players/guests list from the model
         cont = self.ids.get('selected_list')
-        if not cont:
+        if not cont or getattr(self, '_roster', None) is None:
             return
-        cont.clear_widgets()
-        # Players (selected_ids)
-        if hasattr(self, 'selected_ids') and self.selected_ids:
-            for pid in sorted(self.selected_ids, key=lambda x: x):
-                try:
-                    name = DB.execute("SELECT COALESCE(nickname, name) FROM players WHERE id=?", (pid,)).fetchone()
-                    name = name[0] if name else f"Player {pid}"
-                except Exception:
-                    name = f"Player {pid}"
-                row = BoxLayout(size_hint_y=None, height=dp(56))
-                row.add_widget(Label(text=f"• {name}"))
-                btn = Button(text="X", size_hint_x=None, width=dp(56), font_size='22sp')
-                def remove_player(instance, pid_to_remove=pid):
-                    if hasattr(self, 'selected_ids') and pid_to_remove in self.selected_ids:
-                        self.selected_ids.remove(pid_to_remove)
-                    # rebuild lists to reflect change
-                    self.refresh_players()
-                    self.update_selected_view()
-                btn.bind(on_release=remove_player)
-                row.add_widget(btn)
-                cont.add_widget(row)
-        # Guests (keep index for precise removal)
-        for idx, (pid, gname) in enumerate(list(self.guest_list)):
-            if pid is None:
-                row = BoxLayout(size_hint_y=None, height=dp(56))
-                row.add_widget(Label(text=f"• {gname} (guest)"))
-                gbtn = Button(text="X", size_hint_x=None, width=dp(56), font_size='22sp')
-                def remove_guest(instance, guest_index=idx):
-                    try:
-                        if 0 <= guest_index < len(self.guest_list):
-                            self.guest_list.pop(guest_index)
-                    except Exception:
-                        pass
-                    self.refresh_players()
-                    self.update_selected_view()
-                gbtn.bind(on_release=remove_guest)
-                row.add_widget(gbtn)
-                cont.add_widget(row)
+        data = [self._roster.selected_row(pid) for pid in self._roster.selected]
+        data.extend({'side': 'selected', 'key': g, 'label': f"• {g[1]} (guest)"}
+                    for g in self.guest_list if g[0] is None)
+        cont.data = data
+
+    def roster_tap(self, side, key):
+        # One row moves between the two lists
+        import bisect
+        roster = getattr(self, '_roster', None)
+        if roster is None:
+            return
+        avail = self.ids.players_select.data
+        ranks = self._avail_ranks
+        sel = self.ids.selected_list.data
+        if side == 'available':
+            row = roster.rows.get(key)
+            if row is None or key in roster.selected:
+                return
+            roster.selected[key] = None
+            self.selected_ids.add(key)
+            i = bisect.bisect_left(ranks, row['rank'])
+            if i < len(ranks) and ranks[i] == row['rank']:
+                ranks.pop(i)
+                avail.pop(i)
+            sel.insert(len(roster.selected) - 1, roster.selected_row(key))
+            return
+        # 'selected': key is a player id or a guest tuple
+        for i, d in enumerate(sel):
+            if d['key'] is key or (not isinstance(key, tuple) and d['key'] == key):
+                sel.pop(i)
+                break
+        if isinstance(key, tuple):
+            for i, g in enumerate(self.guest_list):
+                if g is key:
+                    self.guest_list.pop(i)
+                    break
+            return
+        roster.selected.pop(key, None)
+        self.selected_ids.discard(key)
+        row = roster.rows.get(key)
+        filt = self._filter_text()
+        if row is not None and (not filt or filt in row['hay']):
+            # Back into its sorted place
+            i = bisect.bisect(ranks, row['rank'])
+            ranks.insert(i, row['rank'])
+            avail.insert(i, row)
 
     def add_guest(self, guest_name):
         if not guest_name:
@@ -1137,31 +913,46 @@ class CreateEventScreen(Screen):
         name = guest_name.strip()
         if not name:
             return
-        self.guest_list.append((None, name))
-        self.ids.guest_name.text = ""
+        guest = (None, name)
+        self.guest_list.append(guest)
+        try:
+            self.ids.guest_name.text = ""
+        except Exception:
+            pass
         # update selected preview
-        self.update_selected_view()
+        try:
+            self.ids.selected_list.data.append({'side': 'selected', 'key': guest, 'label': f"• {name} (guest)"})
+        except Exception:
+            self.update_selected_view()
 
-    def randomize_seating(self):
-        # collect selected players and guests only (use selected_ids, not UI state)
+    def _selected_players(self):
+        # (pid, display name) for every selected player, names from the in-memory roster
+        roster = getattr(self, '_roster', None)
         chosen = []
-        if not hasattr(self, 'selected_ids'):
-            self.selected_ids = set()
-        for pid in self.selected_ids:
-            try:
-                row = DB.execute("SELECT COALESCE(nickname, name) FROM players WHERE id=?", (pid,)).fetchone()
-                if row:
-                    chosen.append((pid, row[0]))
-            except Exception:
-                pass
+        for pid in (roster.selected if roster is not None else getattr(self, 'selected_ids', ())):
+            name = roster.name(pid) if roster is not None else None
+            if name is None:
+                try:
+                    row = DB.execute("SELECT COALESCE(nickname, name) FROM players WHERE id=?", (pid,)).fetchone()
+                    name = row[0] if row else None
+                except Exception:
+                    name = None
+            if name is not None:
+                chosen.append((pid, name))
+        return chosen
+
+    def randomize_seating(self):
+        # collect selected players and guests only (use the roster model, not UI state)
+        chosen = self._selected_players()
         # plus any guests explicitly added
         chosen.extend(self.guest_list)
         if len(chosen) < 2:
             return
         random.shuffle(chosen)
         self.seating = chosen
-        # write seating preview into the selected_list area for quick check
-        cont = self.ids.get('seating_list') or self.ids.get('players_select')
+        # write seating preview into a seating_list area if the layout has one
+        # (players_select is a RecycleView now and cannot take plain labels)
+        cont = self.ids.get('seating_list')
         if cont is None:
             return
         try:
@@ -1177,14 +968,8 @@ class CreateEventScreen(Screen):
 
     def start_event(self):
         # collect selected players and guests, then navigate to SeatingScreen
-        chosen = []
-        # Build from selected_ids to avoid dependence on filter/UI list
-        if not hasattr(self, 'selected_ids'):
-            self.selected_ids = set()
-        for pid in self.selected_ids:
-            row = DB.execute("SELECT COALESCE(nickname, name) FROM players WHERE id=?", (pid,)).fetchone()
-            if row:
-                chosen.append((pid, row[0]))
+        # Build from the roster model to avoid dependence on filter/UI list
+        chosen = self._selected_players()
         # plus any guests explicitly added
         chosen.extend(self.guest_list)
         if len(chosen) < 2:
@@ -1242,18 +1027,14 @@ class EventScreen(Screen):
         super().__init__(**kwargs)
         self.timer_event = None
         self.time_left = 0
+        self._round_start_ts = 0
         self._timer_round = 0
         self._end_sound_played = False
         self.view_round = None  # if set, we are viewing a past (or specific) round without changing state
-        # load sounds: only tick for countdown and rooster at end (no random pool)
-        try:
-            self.tick_sound = SoundLoader.load("assets/tick.wav")
-        except Exception:
-            self.tick_sound = None
-        try:
-            self.end_sound = SoundLoader.load("assets/rooster.mp3")
-        except Exception:
-            self.end_sound = None
+        # sounds: only tick for countdown and rooster at end, loaded in the background
+        self.tick_sound_path = "assets/tick.wav"
+        self.end_sound_path = "assets/rooster.mp3"
+        SOUNDS.preload((self.tick_sound_path, self.end_sound_path))
 
     def load_event(self, event_id):
         self.event_id = event_id
@@ -1271,11 +1052,23 @@ class EventScreen(Screen):
             self.round_duration = int(rt[0]) if rt and rt[0] is not None else 0
         except Exception:
             self.round_duration = 0
-        self.ids.matches_grid.clear_widgets()
+        self.refresh_matches()
+
+    def apply_changes(self, changes):
+        """Apply a synced change set (names of changed tables). Only an events change
+        (round advanced, renamed) reloads the header; the rest re-syncs the match rows."""
+        if changes is None or 'events' in changes:
+            row = DB.execute("SELECT name, current_round, round_time FROM events WHERE id=?", (self.event_id,)).fetchone()
+            if not row:
+                return
+            self.event_title, self.current_round = row[0], row[1]
+            try:
+                self.round_duration = int(row[2]) if row[2] is not None else 0
+            except Exception:
+                self.round_duration = 0
         self.refresh_matches()
 
     def refresh_matches(self):
-        self.ids.matches_grid.clear_widgets()
         # Determine which round to display: a specific view_round or the current round (defaulting to 1)
         round_to_show = None
         try:
@@ -1293,19 +1086,7 @@ class EventScreen(Screen):
             DB.execute("UPDATE events SET current_round=? WHERE id=?", (1, self.event_id))
             DB.commit()
             rows = DB.execute("SELECT id, round, player1, player2, score_p1, score_p2, bye FROM matches WHERE event_id=? AND round=?", (self.event_id,1)).fetchall()
-        for idx, (mid, rnd, p1, p2, s1, s2, bye) in enumerate(rows):
-            p1name = get_name_for_event_player(self.event_id, p1)
-            p2name = get_name_for_event_player(self.event_id, p2) if p2 else "BYE"
-            row_widget = MatchRow()
-            row_widget.p1_name = p1name
-            row_widget.p2_name = p2name
-            row_widget.score1 = s1
-            row_widget.score2 = s2
-            row_widget.match_id = mid
-            row_widget.bye = bye
-            row_widget.row_index = idx
-            row_widget.on_score_change = lambda w, _self=self: _self._on_match_score_changed(w)
-            self.ids.matches_grid.add_widget(row_widget)
+        self._sync_match_rows(rows)
         # update round label (mark if viewing a past round)
         label = f"Round: {round_to_show}"
         try:
@@ -1345,6 +1126,44 @@ class EventScreen(Screen):
             self.stop_timer()
             self.timer_text = "--:--"
 
+    def _sync_match_rows(self, rows):
+        """Show `rows` in matches_grid, reusing MatchRow widgets.
+
+        Rows are pooled by match id and updated in place (Kivy properties only
+        dispatch on real changes), so a refresh with the same matches touches
+        no widgets. Rows of matches that went away are kept as spares and
+        rebound to new match ids (e.g. when navigating rounds).
+        """
+        grid = self.ids.matches_grid
+        if getattr(self, '_match_rows', None) is None:
+            self._match_rows = {}  # match id -> MatchRow
+            self._spare_match_rows = []
+        pool, spares = self._match_rows, self._spare_match_rows
+        wanted = {r[0] for r in rows}
+        for mid in [m for m in pool if m not in wanted]:
+            spares.append(pool.pop(mid))
+        ordered = []
+        for idx, (mid, rnd, p1, p2, s1, s2, bye) in enumerate(rows):
+            row_widget = pool.get(mid)
+            if row_widget is None:
+                row_widget = spares.pop() if spares else MatchRow()
+                # One shared callback for every row
+                row_widget.on_score_change = self._on_match_score_changed
+                pool[mid] = row_widget
+            row_widget.p1_name = get_name_for_event_player(self.event_id, p1)
+            row_widget.p2_name = get_name_for_event_player(self.event_id, p2) if p2 else "BYE"
+            row_widget.score1 = s1
+            row_widget.score2 = s2
+            row_widget.match_id = mid
+            row_widget.bye = bye
+            row_widget.row_index = idx
+            ordered.append(row_widget)
+        # Re-parent only when the set or order of matches changed (GridLayout keeps children reversed)
+        if grid.children[::-1] != ordered:
+            grid.clear_widgets()
+            for row_widget in ordered:
+                grid.add_widget(row_widget)
+
     def _format_time(self, secs):
         try:
             s = int(secs)
@@ -1399,7 +1218,9 @@ class EventScreen(Screen):
             self._timer_round = int(self.current_round)
             self._end_sound_played = True
             return
-        # schedule/update only if new round or timer not running
+        # Remaining time is always derived from round_start_ts (follows DB updates)
+        self._round_start_ts = ts
+        # subscribe only if new round or timer not running
         if self._timer_round != self.current_round or self.timer_event is None:
             self.stop_timer()
             self.time_left = remaining
@@ -1407,28 +1228,27 @@ class EventScreen(Screen):
             self._timer_round = int(self.current_round)
             # end sound not yet played if we are above 0
             self._end_sound_played = self.time_left <= 0
-            self.timer_event = Clock.schedule_interval(self._tick, 1)
-
-    def _tick(self, dt):
-        # Tick sound for last five seconds (5..1)
-        if 1 <= self.time_left <= 5 and getattr(self, 'tick_sound', None):
-            try:
-                self.tick_sound.play()
-            except Exception:
-                pass
-        # Decrement
-        self.time_left -= 1
-        # Play end sound at 0 exactly
-        if self.time_left == 0 and not self._end_sound_played:
-            try:
-                snd = getattr(self, 'end_sound', None)
-                if snd:
-                    snd.play()
-            except Exception:
-                pass
+            self.timer_event = TICKER.subscribe(self._tick)
+
+    def _tick(self, now):
+        # Shared wall-clock tick: compute from the start timestamp so late or
+        # missed ticks (busy frames, resume) never drift or repeat a second
+        remaining = int(self.round_duration or 0) - (int(now) - int(getattr(self, '_round_start_ts', 0) or 0))
+        prev = self.time_left
+        if remaining == prev:
+            return
+        self.time_left = remaining
+        # Tick sound for last five seconds (5..1), once per second passed
+        if 0 <= remaining < prev and remaining <= 4:
+            SOUNDS.play(self.tick_sound_path, channel='event')
+        # Play end sound when reaching 0 (not when resuming long after it)
+        if remaining <= 0 and not self._end_sound_played:
+            if prev > 0 and remaining > -2:
+                SOUNDS.play(self.end_sound_path, channel='event')
             self._end_sound_played = True
         # Stop at -10
-        if self.time_left <= -10:
+        if remaining <= -10:
+            self.time_left = -10
             self.timer_text = self._format_time(-10)
             self.stop_timer()
             return
@@ -1980,74 +1800,16 @@ class StandingsScreen(Screen):
         self.manager.current = 'event'
 
     def refresh(self):
-        grid = self.ids.standings_grid
-        grid.clear_widgets()
+        table = self.ids.standings_table
         standings = compute_standings(self.event_id)
-        # Define column size hints (sum doesn't have to be 1 for GridLayout)
-        # Tighten MP and W-L-D a bit to free room for percentage headers
-        col_sizes = [0.6, 3.0, 0.6, 1.0, 1.1, 1.1, 1.1]
-
-        def add_cell(text, bold=False, halign='center', size_hint_x=1.0):
-            lbl = Label(text=(f"[b]{text}[/b]" if bold else text),
-                        markup=True,
-                        size_hint_y=None,
-                        height=dp(42),
-                        color=(1,1,1,1),
-                        halign=halign,
-                        valign='middle')
-            # Ensure halign takes effect
-            lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', val))
-            lbl.size_hint_x = size_hint_x
-            grid.add_widget(lbl)
-
-        # Header row (7 columns)
-        headers = ['#', 'Name', 'MP', 'W-L-D', 'OMW%', 'GW%', 'OGW%']
-        for i, h in enumerate(headers):
-            add_cell(h, bold=True, halign=('left' if h == 'Name' else 'center'), size_hint_x=col_sizes[i])
-
-        # Data rows
-        from kivy.uix.scrollview import ScrollView
-        for rank, st in enumerate(standings, start=1):
-            name = st['name']
-            mp = st['mp']
-            w = st['wins']
-            l = st['losses']
-            d = st['draws']
-            omwp = f"{st['omwp']:.2f}"
-            gwp = f"{st['gwp']:.2f}"
-            ogwp = f"{st['ogwp']:.2f}"
-
-            row_values = [str(rank), name, str(mp), f"{w}-{l}-{d}", omwp, gwp, ogwp]
-            for i, val in enumerate(row_values):
-                if i == 1:
-                    # Name column: make it horizontally scrollable if too long
-                    sv = ScrollView(size_hint_y=None,
-                                    height=dp(42),
-                                    do_scroll_x=True,
-                                    do_scroll_y=False,
-                                    bar_width=0)
-                    # Hard-disable any vertical scrolling/bounce on some devices
-                    sv.effect_y = None
-                    sv.scroll_wheel_distance = 0
-                    sv.scroll_y = 1
-                    sv.size_hint_x = col_sizes[i]
-                    name_lbl = Label(text=val,
-                                     markup=True,
-                                     size_hint_y=None,
-                                     height=dp(42),
-                                     color=(1,1,1,1),
-                                     halign='left',
-                                     valign='middle',
-                                     size_hint_x=None)
-                    # Do not wrap; size to texture for horizontal scrolling
-                    name_lbl.bind(texture_size=lambda inst, val: setattr(inst, 'width', val[0] + dp(4)))
-                    # Align text vertically
-                    name_lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', (None, None)))
-                    sv.add_widget(name_lbl)
-                    grid.add_widget(sv)
-                else:
-                    hal = 'center'
-                    add_cell(val, bold=False, halign=hal, size_hint_x=col_sizes[i])
+        # Column size hints; MP and W-L-D tightened to free room for percentage headers
+        table.set_columns(['#', 'Name', 'MP', 'W-L-D', 'OMW%', 'GW%', 'OGW%'],
+                          [0.6, 3.0, 0.6, 1.0, 1.1, 1.1, 1.1])
+        table.set_rows(
+            (str(rank), st['name'], str(st['mp']), f"{st['wins']}-{st['losses']}-{st['draws']}",
+             f"{st['omwp']:.2f}", f"{st['gwp']:.2f}", f"{st['ogwp']:.2f}")
+            for rank, st in enumerate(standings, start=1)
+        )
 
 
 class LeagueScreen(Screen):
@@ -2341,46 +2103,16 @@ class LeagueScreen(Screen):
 
     def refresh(self):
         # Render scoreboard for selected league
-        grid = self.ids.get('league_grid')
-        if grid is None:
+        table = self.ids.get('league_table')
+        if table is None:
             return
-        grid.clear_widgets()
-        # Header
-        headers = ['#', 'Name', 'MP', 'W-L-D', 'Winrate %', 'League Score']
-        col_sizes = [0.6, 3.0, 0.8, 1.1, 1.1, 1.2]
-        def add_cell(text, bold=False, halign='center', size_hint_x=1.0):
-            lbl = Label(text=(f"[b]{text}[/b]" if bold else text), markup=True, size_hint_y=None, height=dp(42), color=(1,1,1,1), halign=halign, valign='middle')
-            lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', val))
-            lbl.size_hint_x = size_hint_x
-            grid.add_widget(lbl)
-        for i, h in enumerate(headers):
-            add_cell(h, bold=True, halign=('left' if h == 'Name' else 'center'), size_hint_x=col_sizes[i])
-        # Data
-        rows = self._compute_league_rows()
-        from kivy.uix.scrollview import ScrollView
-        for rank, st in enumerate(rows, start=1):
-            name = st['name']
-            mp = st['matches']
-            w = st['wins']
-            l = st['losses']
-            d = st['draws']
-            wr = f"{st['winrate']*100:.2f}"
-            ls = f"{st['score']:.2f}"
-            row_values = [str(rank), name, str(mp), f"{w}-{l}-{d}", wr, ls]
-            for i, val in enumerate(row_values):
-                if i == 1:
-                    sv = ScrollView(size_hint_y=None, height=dp(42), do_scroll_x=True, do_scroll_y=False, bar_width=0)
-                    sv.effect_y = None
-                    sv.scroll_wheel_distance = 0
-                    sv.scroll_y = 1
-                    sv.size_hint_x = col_sizes[i]
-                    name_lbl = Label(text=val, markup=True, size_hint_y=None, height=dp(42), color=(1,1,1,1), halign='left', valign='middle', size_hint_x=None)
-                    name_lbl.bind(texture_size=lambda inst, val: setattr(inst, 'width', val[0] + dp(4)))
-                    name_lbl.bind(size=lambda inst, val: setattr(inst, 'text_size', (None, None)))
-                    sv.add_widget(name_lbl)
-                    grid.add_widget(sv)
-                else:
-                    add_cell(val, bold=False, halign='center', size_hint_x=col_sizes[i])
+        table.set_columns(['#', 'Name', 'MP', 'W-L-D', 'Winrate %', 'League Score'],
+                          [0.6, 3.0, 0.8, 1.1, 1.1, 1.2])
+        table.set_rows(
+            (str(rank), st['name'], str(st['matches']), f"{st['wins']}-{st['losses']}-{st['draws']}",
+             f"{st['winrate']*100:.2f}", f"{st['score']:.2f}")
+            for rank, st in enumerate(self._compute_league_rows(), start=1)
+        )
 
     def _compute_league_rows(self):
         try:
@@ -2538,6 +2270,28 @@ class BingoScreen(Screen):
         except Exception:
             pass
 
+    def apply_changes(self, changes):
+        """Apply a synced change set (names of changed tables) with the smallest redraw.
+        Player list or unknown changes fall back to a full refresh_from_db."""
+        if changes is None or 'players' in changes:
+            self.refresh_from_db()
+            return
+        try:
+            redraw = False
+            if 'bingo_achievements' in changes:
+                self._ensure_achievements()
+                redraw = True
+            if 'bingo_players' in changes or 'bingo_meta' in changes:
+                self._load_state()
+                # bingo_meta (taken lines/winners) only feeds the status line
+                if 'bingo_players' in changes:
+                    redraw = True
+            if redraw:
+                self._render_grid()
+            self._update_status()
+        except Exception:
+            self.refresh_from_db()
+
     def refresh_from_db(self):
         # Reload bingo state and players, then reconcile current selection and redraw UI
         try:
@@ -3341,50 +3095,146 @@ def _auth_path() -> str:
     return os.path.join(base_dir, 'auth.json')
 
 
+class AuthSession:
+    """In-memory copy of auth.json.
+
+    The file is read once; role/token/expiry checks afterwards are plain
+    attribute reads (they run per list row and per bingo cell). save/clear
+    write through to disk and notify listeners so bound UI can update.
+    Call invalidate() if auth.json may have changed behind our back.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._loaded = False
+        self._listeners = []
+        self.is_manager = False
+
+    def _set(self, data):
+        self._data = dict(data) if data else None
+        self._loaded = True
+        d = self._data or {}
+        role = (d.get('role') or '').strip().lower()
+        uname = (d.get('username') or '').strip().lower()
+        self.is_manager = bool(role == 'manager' or uname.startswith('manager'))
+
+    def _notify(self):
+        for cb in list(self._listeners):
+            try:
+                cb()
+            except Exception:
+                pass
+
+    def bind(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            data = None
+            try:
+                p = _auth_path()
+                if os.path.exists(p):
+                    with open(p, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+            except Exception:
+                data = None
+            self._set(data)
+
+    def get(self):
+        """Return a copy of the saved auth dict, or None when logged out."""
+        self._ensure_loaded()
+        return dict(self._data) if self._data else None
+
+    @property
+    def token(self):
+        self._ensure_loaded()
+        return (self._data or {}).get('token')
+
+    @property
+    def expired(self) -> bool:
+        # exp is the server's epoch-seconds expiry; missing means "no known expiry"
+        self._ensure_loaded()
+        try:
+            exp = float((self._data or {}).get('exp') or 0)
+        except Exception:
+            return False
+        return bool(exp) and exp < time.time()
+
+    def save(self, data: dict) -> bool:
+        try:
+            p = _auth_path()
+            with open(p, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            ok = True
+        except Exception:
+            ok = False
+        # Keep the in-memory session even if persisting failed (remember=False devices)
+        self._set(data)
+        self._notify()
+        return ok
+
+    def clear(self):
+        try:
+            p = _auth_path()
+            if os.path.exists(p):
+                os.remove(p)
+        except Exception:
+            pass
+        self._set(None)
+        self._notify()
+
+    def invalidate(self):
+        self._loaded = False
+        self._notify()
+
+
+SESSION = AuthSession()
+
+
 def load_auth():
-    try:
-        p = _auth_path()
-        if os.path.exists(p):
-            with open(p, 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return None
+    return SESSION.get()
 
 
 def save_auth(data: dict):
-    try:
-        p = _auth_path()
-        with open(p, 'w', encoding='utf-8') as f:
-            json.dump(data, f)
-        return True
-    except Exception:
-        return False
+    return SESSION.save(data)
 
 
 def clear_auth():
-    try:
-        p = _auth_path()
-        if os.path.exists(p):
-            os.remove(p)
-    except Exception:
-        pass
+    SESSION.clear()
 
 
 def _get_base_url(auth: dict | None) -> str:
-    # Fixed, non-configurable base URL per requirements
-    return "https://draftbuddy.hackthep.it"
+    # The production server is fixed: users cannot change it from the app.
+    # DRAFTBUDDY_SERVER_URL overrides it from the environment for development
+    # (the local stand-in server, tools/sync_server.py, and the load test).
+    return os.environ.get('DRAFTBUDDY_SERVER_URL') or "https://draftbuddy.hackthep.it"
+
+
+def _server_reachable(base: str, timeout: float = 8, session=None) -> bool:
+    """Cheap /health probe, retrying without SSL verification like the rest of the sync code."""
+    http = session or requests
+    try:
+        health = http.get(f"{base}/health", timeout=timeout)
+        return health.status_code == 200
+    except requests.exceptions.SSLError:
+        try:
+            health = http.get(f"{base}/health", timeout=timeout, verify=False)
+            return health.status_code == 200
+        except Exception:
+            return False
+    except Exception:
+        return False
 
 
 def _is_manager() -> bool:
     """Return True if the current user is a manager.
     Uses saved auth role and username prefix fallback (username startswith 'manager').
+    Answered from the in-memory SESSION; auth.json is only read once.
     """
     try:
-        auth = load_auth() or {}
-        role = (auth.get('role') or '').strip().lower()
-        uname = (auth.get('username') or '').strip().lower()
-        return bool(role == 'manager' or uname.startswith('manager'))
+        SESSION._ensure_loaded()
+        return SESSION.is_manager
     except Exception:
         return False
 
@@ -3394,6 +3244,10 @@ class LoginScreen(Screen):
     username = StringProperty("")
     playgroup = StringProperty("clandestini")
     status = StringProperty("")
+    # Network progress: busy drives the spinner/cancel row, busy_text its caption
+    busy = BooleanProperty(False)
+    busy_text = StringProperty("")
+    spin_angle = NumericProperty(0)
 
     def on_pre_enter(self):
         try:
@@ -3405,7 +3259,79 @@ class LoginScreen(Screen):
         except Exception:
             pass
 
+    # ---- Background network calls ----
+    # Requests run on the dedicated AUTH_JOBS worker (never behind sync transfers); results
+    # come back through Clock. work(progress, session) makes its requests through session,
+    # so cancel_network aborts the one in flight. Each call also gets a sequence number,
+    # so a superseded call's result is dropped.
+    def _run_network(self, label, work, done, name='login'):
+        from jobs import AUTH_JOBS, PRIORITY_SYNC
+        from sync import CancellableSession
+        self._op_seq = getattr(self, '_op_seq', 0) + 1
+        op = self._op_seq
+        self._set_busy(label)
+        session = self._net_session = CancellableSession()
+
+        def _progress(text):
+            Clock.schedule_once(lambda dt: self._on_progress(op, text), 0)
+
+        self._net_job = AUTH_JOBS.submit(
+            lambda job: work(_progress, session),
+            name=f'net.{name}',
+            priority=PRIORITY_SYNC,
+            on_done=lambda result: self._deliver(op, done, result),
+            on_error=lambda err: self._deliver(op, done, err),
+        )
+
+    def _on_progress(self, op, text):
+        if op == getattr(self, '_op_seq', 0) and self.busy:
+            self.busy_text = text
+
+    def _deliver(self, op, done, result):
+        if op != getattr(self, '_op_seq', 0):
+            return  # cancelled or superseded
+        self._clear_busy()
+        done(result)
+
+    def _set_busy(self, text):
+        self.busy = True
+        self.busy_text = text
+        if getattr(self, '_spin_ev', None) is None:
+            self._spin_ev = Clock.schedule_interval(self._spin, 1 / 30.)
+
+    def _spin(self, dt):
+        self.spin_angle = (self.spin_angle - 360 * dt) % 360
+
+    def _clear_busy(self):
+        self.busy = False
+        self.busy_text = ''
+        ev = getattr(self, '_spin_ev', None)
+        if ev is not None:
+            ev.cancel()
+            self._spin_ev = None
+
+    def cancel_network(self):
+        # Abort the request in flight (its worker is freed at once) and ignore its result
+        if not self.busy:
+            return
+        self._op_seq = getattr(self, '_op_seq', 0) + 1
+        try:
+            from jobs import AUTH_JOBS
+            if getattr(self, '_net_job', None) is not None:
+                AUTH_JOBS.cancel(self._net_job)
+            if getattr(self, '_net_session', None) is not None:
+                self._net_session.cancel()
+        except Exception:
+            pass
+        self._clear_busy()
+        self.status = 'Cancelled'
+
+    def on_leave(self, *args):
+        self.cancel_network()
+
     def do_login(self, password: str, remember: bool):
+        if self.busy:
+            return
         password = password or ''
         base = _get_base_url(None)
         user = (self.username or '').strip()
@@ -3418,39 +3344,43 @@ class LoginScreen(Screen):
             App.get_running_app().show_toast(msg)
             return
         url = f"{base}/auth/login"
+        playgroup = (self.playgroup or 'clandestini')
+        payload = {
+            'username': user,
+            'password': password,
+            'remember': bool(remember),
+            'playgroup': playgroup,
+        }
 
-        # Optional preflight to provide clearer feedback if server is unreachable
-        def _preflight():
+        def _work(progress, session):
+            # Worker thread: network only, no widget access
+            # Optional preflight to provide clearer feedback if server is unreachable
+            pre_ok = _server_reachable(base, session=session)
+            progress('Signing in...')
             try:
-                h = requests.get(f"{base}/health", timeout=8)
-                return h.status_code == 200
-            except requests.exceptions.SSLError as se:
                 try:
-                    h = requests.get(f"{base}/health", timeout=8, verify=False)
-                    return h.status_code == 200
-                except Exception:
-                    return False
-            except Exception:
-                return False
-
-        try:
-            pre_ok = _preflight()
-            try:
-                resp = requests.post(url, json={
-                    'username': user,
-                    'password': password,
-                    'remember': bool(remember),
-                    'playgroup': (self.playgroup or 'clandestini')
-                }, timeout=25)
-            except requests.exceptions.SSLError:
-                # Retry without SSL verification on Android devices missing some CAs
-                resp = requests.post(url, json={
-                    'username': user,
-                    'password': password,
-                    'remember': bool(remember),
-                    'playgroup': (self.playgroup or 'clandestini')
-                }, timeout=25, verify=False)
-
+                    resp = session.post(url, json=payload, timeout=(5, 25))
+                except requests.exceptions.SSLError:
+                    # Retry without SSL verification on Android devices missing some CAs
+                    resp = session.post(url, json=payload, timeout=(5, 25), verify=False)
+            except Exception as e:
+                return {'pre_ok': pre_ok, 'error': e}
+            return {'pre_ok': pre_ok, 'resp': resp}
+
+        self.status = ''
+        self._run_network('Contacting server...',
+                          _work,
+                          lambda result: self._finish_login(result, base, user, playgroup))
+
+    def _finish_login(self, result, base, user, playgroup):
+        # UI thread: interpret the worker's result exactly as the old inline code did
+        if isinstance(result, Exception):
+            result = {'pre_ok': False, 'error': result}
+        pre_ok = result.get('pre_ok')
+        try:
+            if result.get('error') is not None:
+                raise result['error']
+            resp = result['resp']
             if resp.status_code != 200:
                 # Include short server message if any
                 extra = ''
@@ -3475,7 +3405,7 @@ class LoginScreen(Screen):
             save_auth({
                 'base_url': base,
                 'username': user,
-                'playgroup': (self.playgroup or 'clandestini'),
+                'playgroup': playgroup,
                 'token': token,
                 'manager_id': manager_id,
                 'exp': exp,
@@ -3511,7 +3441,7 @@ class LoginScreen(Screen):
             self.status = f'Network timeout: {type(e).__name__}'
             App.get_running_app().show_toast('Network timeout while logging in')
         except requests.exceptions.ConnectionError as e:
-            hint = '' if _preflight() else ' (server unreachable?)'
+            hint = '' if pre_ok else ' (server unreachable?)'
             self.status = f'Network error: {type(e).__name__}: {e}'
             App.get_running_app().show_toast('Network error while logging in' + hint)
         except Exception as e:
@@ -3527,7 +3457,13 @@ class LoginScreen(Screen):
         self.do_login('guest', True)
 
     def diagnose_connection(self):
-        # Run a few simple checks and show results in a popup and status
+        # Run a few simple checks in the background, then show results in a popup and status
+        if self.busy:
+            return
+        self._run_network('Running diagnostics...', self._diagnose_work, self._show_diagnostics, name='diagnostics')
+
+    def _diagnose_work(self, progress, session):
+        # Worker thread: DNS and HTTPS probes, returns report lines
         try:
             import socket
             import traceback
@@ -3543,6 +3479,7 @@ class LoginScreen(Screen):
         except Exception:
             pass
         # DNS
+        progress('Resolving server name...')
         try:
             host = base.split('://', 1)[-1].split('/', 1)[0]
             addrs = []
@@ -3558,10 +3495,11 @@ class LoginScreen(Screen):
         except Exception as e:
             lines.append(f"DNS error: {type(e).__name__}: {e}")
         # HTTPS /health
+        progress('Checking HTTPS /health...')
         import time as _t
         try:
             t0 = _t.time()
-            r = requests.get(f"{base}/health", timeout=8)
+            r = session.get(f"{base}/health", timeout=(5, 8))
             dt = int((_t.time() - t0) * 1000)
             lines.append(f"HTTPS /health: {r.status_code} in {dt} ms")
         except requests.exceptions.SSLError as e:
@@ -3569,7 +3507,7 @@ class LoginScreen(Screen):
             # Retry insecure
             try:
                 t0 = _t.time()
-                r = requests.get(f"{base}/health", timeout=8, verify=False)
+                r = session.get(f"{base}/health", timeout=(5, 8), verify=False)
                 dt = int((_t.time() - t0) * 1000)
                 lines.append(f"HTTPS /health (insecure): {r.status_code} in {dt} ms")
             except Exception as e2:
@@ -3578,6 +3516,11 @@ class LoginScreen(Screen):
             lines.append(f"HTTPS /health connection error: {e}")
         except Exception as e:
             lines.append(f"HTTPS /health error: {type(e).__name__}: {e}")
+        return lines
+
+    def _show_diagnostics(self, lines):
+        if isinstance(lines, Exception):
+            lines = [f"Diagnostics error: {type(lines).__name__}: {lines}"]
         # Summarize
         report = "\n".join(lines)
         self.status = lines[-1] if lines else ""
@@ -3657,59 +3600,68 @@ class SettingsScreen(Screen):
             pass
         app.show_toast('Logged out')
 
-    def _replace_db_with_file(self, tmp_path: str):
-        """Apply a downloaded DB file to the running app.
-        Prefer a live copy into the existing SQLite connection to avoid
-        invalidating imported DB references. Fallback to atomic file
-        replacement + reload if needed.
+    def _replace_db_with_file(self, tmp_path: str, table_versions=None, tag=None):
+        """Make a downloaded DB file the live database.
+        The file is checked (PRAGMA quick_check), migrated, warmed up for the
+        current screen and digested (_SYNC_TABLES) in its own connection on
+        the calling thread; the UI thread then only renames it into place and
+        repoints the shared DB handle (db.repoint_live), so no data is copied
+        during a frame and the live DB is never read from this thread.
+        table_versions ({table: version}, sent by the server) replaces the
+        digest pass when given; tag (the snapshot's ETag) is kept for the
+        next download's If-None-Match.
+        tmp_path must be in the DB folder (see _download_temp_file).
+        Returns (changed tables, or None if unknown; table digests or versions
+        of the new DB), or None on failure (local DB untouched, temp file removed).
         """
-        # 1) Try live copy via sqlite3 backup API
+        import db as _dbmod
         try:
-            import sqlite3 as _sqlite
-            import db as _dbmod
-            src = _sqlite.connect(tmp_path)
-            try:
-                # Copy contents of src into the existing destination connection
-                # This keeps the same connection object alive for all callers.
-                src.backup(_dbmod.DB)
-                try:
-                    src.close()
-                except Exception:
-                    pass
-                # Remove temp file after successful copy
-                try:
-                    os.remove(tmp_path)
-                except Exception:
-                    pass
-                App.get_running_app().show_toast('Database updated')
-                return
-            finally:
-                try:
-                    src.close()
-                except Exception:
-                    pass
+            current = App.get_running_app().root.ids.sm.current
         except Exception:
-            # Proceed to fallback
-            pass
-        # 2) Fallback: atomic file replace + reload (may invalidate old DB refs)
-        try:
-            target = get_db_path()
-            tmp = target + '.tmpdl'
-            if os.path.exists(tmp):
-                try:
-                    os.remove(tmp)
-                except Exception:
-                    pass
-            os.replace(tmp_path, tmp)
-            os.replace(tmp, target)
+            current = None
+        ok = _dbmod.prepare_snapshot(tmp_path, _WARMUP_QUERIES.get(current, ()))
+        if not ok:
+            after = None
+        elif table_versions:
+            after = {t: v for t, v in table_versions.items() if t in _SYNC_TABLES}
+        else:
+            try:
+                after = _dbmod.table_digests(tmp_path, _SYNC_TABLES)
+            except Exception:
+                after = None
+
+        def _swap():
+            # Digests of the previous snapshot still describe the live DB if nothing wrote to it since
+            before = _dbmod.live_digests()
+            return _dbmod.repoint_live(tmp_path, after, tag), before
+        old = before = None
+        if ok:
+            try:
+                old, before = _call_on_ui(_swap)
+            except Exception:
+                ok = False
+        if not ok:
             try:
-                from db import reload_db
-                reload_db()
+                os.remove(tmp_path)
             except Exception:
                 pass
-            App.get_running_app().show_toast('Database updated')
+            App.get_running_app().show_toast('Downloaded DB could not be applied')
+            return None
+        try:
+            if old is not None:
+                old.close()
         except Exception:
-            App.get_running_app().show_toast('Failed to replace DB')
+            pass
+        App.get_running_app().show_toast('Database updated')
+        if before is None or after is None:
+            return None, after or {}
+        return _dbmod.changed_tables(before, after), after
+
+    def _download_temp_file(self):
+        # Next to the DB so repoint_live can rename it into place atomically
+        import tempfile
+        fd, path = tempfile.mkstemp(prefix='dbdl_', suffix='.sqlite', dir=os.path.dirname(get_db_path()))
+        return path, os.fdopen(fd, 'wb')
 
     def do_download(self):
         auth = load_auth() or {}
@@ -3717,8 +3669,14 @@ class SettingsScreen(Screen):
         if not base:
             App.get_running_app().show_toast('Set server in Login first')
             return
-        token = auth.get('token')
+        # An expired token would only earn a 401; go straight to the public snapshot
+        token = None if SESSION.expired else auth.get('token')
         manager_id = auth.get('manager_id')
+        # The full snapshot is always what gets transferred; the ETag of the one we hold
+        # (if the live DB is still exactly it) lets the server answer 304 when it is unchanged
+        import db as _dbmod
+        tag = _dbmod.live_snapshot_tag()
+        cond = {'If-None-Match': tag} if tag else {}
         # Helper to perform GET with optional SSL verify
         def _get(url, headers=None, allow_insecure_retry=True):
             try:
@@ -3737,7 +3695,7 @@ class SettingsScreen(Screen):
             # 1) Try private download if we have a token
             if token:
                 url = f"{base}/db/download"
-                headers = {'Authorization': f'Bearer {token}'}
+                headers = {'Authorization': f'Bearer {token}', **cond}
                 attempted_urls.append(url)
                 r = _get(url, headers=headers)
                 # If we get 401/403/404, fall back to public snapshot (e.g., guest token or no upload yet)
@@ -3748,15 +3706,24 @@ class SettingsScreen(Screen):
                         pass
                     url_pub = f"{base}/public/{manager_id}/snapshot.sqlite"
                     attempted_urls.append(url_pub)
-                    r = _get(url_pub)
+                    r = _get(url_pub, headers=cond)
                     used_public = True
             else:
                 # No token: use public snapshot directly
                 url = f"{base}/public/{manager_id}/snapshot.sqlite"
                 attempted_urls.append(url)
-                r = _get(url)
+                r = _get(url, headers=cond)
                 used_public = True
 
+            if r.status_code == 304:
+                try:
+                    r.close()
+                except Exception:
+                    pass
+                dur_ms = int((time.time() - start_ts) * 1000)
+                self.last_status = f"Snapshot unchanged ({tag}), nothing downloaded in {dur_ms} ms\nURL: {attempted_urls[-1]}"
+                return
+
             if r.status_code != 200:
                 # Try include a short server message
                 msg = ''
@@ -3775,23 +3742,40 @@ class SettingsScreen(Screen):
                     pass
                 return
 
-            # Save to a temp file (stream to avoid large memory)
-            import tempfile
-            fd, path = tempfile.mkstemp(prefix='dbdl_', suffix='.sqlite')
-            os.close(fd)
+            # Stream straight into the file that becomes the live DB (see _replace_db_with_file)
+            path = None
+            f = None
             bytes_written = 0
-            with open(path, 'wb') as f:
+            try:
+                for chunk in r.iter_content(chunk_size=1024 * 64):
+                    if not chunk:
+                        continue
+                    if f is None:
+                        path, f = self._download_temp_file()
+                    f.write(chunk)
+                    bytes_written += len(chunk)
+            finally:
                 try:
-                    for chunk in r.iter_content(chunk_size=1024 * 64):
-                        if chunk:
-                            f.write(chunk)
-                            bytes_written += len(chunk)
-                finally:
-                    try:
-                        r.close()
-                    except Exception:
-                        pass
-            self._replace_db_with_file(path)
+                    if f is not None:
+                        f.close()
+                except Exception:
+                    pass
+                try:
+                    r.close()
+                except Exception:
+                    pass
+            # Per-table versions let us skip rescanning the snapshot for changes
+            try:
+                table_versions = json.loads(r.headers.get('X-Table-Versions') or 'null')
+            except ValueError:
+                table_versions = None
+            if not isinstance(table_versions, dict):
+                table_versions = None
+            applied = self._replace_db_with_file(path, table_versions, r.headers.get('ETag')) if path else None
+            if applied is None:
+                self.last_status = f"Downloaded snapshot could not be applied ({bytes_written} bytes); kept local DB\nURL: {attempted_urls[-1]}"
+                return
+            changes, digests = applied
             # After DB update, reset Bingo persistent state so downloaded DB view reflects prior server state
             try:
                 # Compute the bingo_state.json path without requiring the Bingo screen to be instantiated
@@ -3801,63 +3785,45 @@ class SettingsScreen(Screen):
                     os.remove(p)
             except Exception:
                 pass
-            # If the Bingo screen is present, refresh it to reflect the new DB
-            try:
-                app = App.get_running_app()
-                if app and app.root and hasattr(app.root, 'ids'):
-                    try:
-                        b = app.root.ids.sm.get_screen('bingo')
-                        if b and hasattr(b, 'refresh_all'):
-                            b.refresh_all()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
             dur_ms = int((time.time() - start_ts) * 1000)
             src = "public" if used_public else "private"
-            # Post-apply sanity: count some rows to help diagnose
-            counts = ""
-            try:
-                import db as _dbmod
-                try:
-                    pcount = _dbmod.DB.execute("SELECT COUNT(*) FROM players").fetchone()[0]
-                except Exception:
-                    pcount = 'n/a'
-                try:
-                    ecount = _dbmod.DB.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-                except Exception:
-                    ecount = 'n/a'
-                counts = f" | players={pcount} events={ecount}"
-            except Exception:
-                counts = ""
-            self.last_status = f"Downloaded {bytes_written} bytes from {src} in {dur_ms} ms{counts}\nURL: {attempted_urls[-1]}"
+            # Post-apply sanity: row counts (from the snapshot digests, if we computed them) help diagnose
+            pcount, ecount = (d[0] if isinstance(d, tuple) else 'n/a'
+                              for d in (digests.get('players'), digests.get('events')))
+            counts = f" | players={pcount} events={ecount}"
+            changed = ','.join(sorted(changes)) if changes is not None else '?'
+            self.last_status = f"Downloaded {bytes_written} bytes from {src} in {dur_ms} ms{counts} changed_tables={changed or '-'}\nURL: {attempted_urls[-1]}"
             app = App.get_running_app()
             if app:
                 app.show_toast('Download complete')
+                # Tell screens what changed (None = unknown, refresh as before)
                 try:
-                    # Proactively refresh Bingo screen to reflect new DB
-                    sm = app.root.ids.sm if app.root and hasattr(app.root, 'ids') else None
-                    if sm:
-                        try:
-                            scr = sm.get_screen('bingo')
-                        except Exception:
-                            scr = None
-                        if scr and hasattr(scr, 'refresh_from_db'):
-                            scr.refresh_from_db()
+                    app.publish_data_changes(changes)
                 except Exception:
                     pass
         except Exception as e:
             self.last_status = 'Network error during download'
             App.get_running_app().show_toast('Network error during download')
 
-    def do_upload(self):
+    def _last_upload_path(self):
+        from db import _get_persistent_db_path
+        return _get_persistent_db_path('last_upload.json')
+
+    def do_upload(self, force: bool = False, preflight: bool = True):
+        """Upload the local DB snapshot. Returns True when the server stored it
+        (or, unless force is set, when it is identical to the last upload).
+        Pass preflight=False when the caller already probed the server."""
         auth = load_auth() or {}
         base = _get_base_url(auth)
         token = auth.get('token')
         if not base or not token:
             self.last_status = 'Upload unavailable: not authenticated as manager'
             App.get_running_app().show_toast('Login as manager to upload')
-            return
+            return False
+        if SESSION.expired:
+            self.last_status = 'Upload unavailable: session expired, login again'
+            App.get_running_app().show_toast('Session expired - login again to upload')
+            return False
         url = f"{base}/db/upload"
         # Be explicit with headers to avoid some proxy quirks
         headers = {
@@ -3866,39 +3832,39 @@ class SettingsScreen(Screen):
             'Expect': ''
         }
         db_path = get_db_path()
-        # Ensure DB file exists and is readable
+        # Take a consistent in-memory snapshot (committed state only) instead of streaming the live file
         try:
-            size = os.path.getsize(db_path)
-        except FileNotFoundError:
-            self.last_status = f"DB file not found: {db_path}"
-            App.get_running_app().show_toast('Database file not found')
-            return
+            import db as _dbmod
+            data = _dbmod.snapshot_bytes()
+            size = len(data)
         except Exception as e:
-            self.last_status = f"Cannot access DB file: {db_path} - {e}"
+            self.last_status = f"Cannot read DB snapshot: {db_path} - {e}"
             App.get_running_app().show_toast('Cannot access database file')
-            return
+            return False
+        import hashlib
+        digest = hashlib.sha256(data).hexdigest()
+        target = {'base': base, 'manager_id': auth.get('manager_id'), 'sha256': digest}
+        # Skip the transfer when this exact snapshot already reached this server/manager
+        last = {}
+        try:
+            with open(self._last_upload_path(), 'r', encoding='utf-8') as f:
+                last = json.load(f) or {}
+        except Exception:
+            last = {}
+        if not force and all(last.get(k) == v for k, v in target.items()):
+            self.last_status = f"No changes since last upload ({size} bytes, ver={last.get('version') or '-'}); skipped"
+            return True
 
         def _upload(verify=True):
-            with open(db_path, 'rb') as f:
-                files = {'file': (os.path.basename(db_path) or 'events.sqlite', f, 'application/octet-stream')}
-                return requests.post(url, headers=headers, files=files, timeout=60, verify=verify)
+            import io
+            files = {'file': (os.path.basename(db_path) or 'events.sqlite', io.BytesIO(data), 'application/octet-stream')}
+            return requests.post(url, headers=headers, files=files, timeout=60, verify=verify)
 
         # Optional preflight to provide clearer feedback if server is unreachable
-        def _preflight():
-            try:
-                health = requests.get(f"{base}/health", timeout=8)
-                return health.status_code == 200
-            except requests.exceptions.SSLError:
-                try:
-                    health = requests.get(f"{base}/health", timeout=8, verify=False)
-                    return health.status_code == 200
-                except Exception:
-                    return False
-            except Exception:
-                return False
-
+        pre_ok = True
         try:
-            pre_ok = _preflight()
+            if preflight:
+                pre_ok = _server_reachable(base)
             start_ts = time.time()
             try:
                 resp = _upload(verify=True)
@@ -3916,7 +3882,13 @@ class SettingsScreen(Screen):
                 ver = det.get('version') if isinstance(det, dict) else None
                 stored = det.get('stored') if isinstance(det, dict) else None
                 self.last_status = f"Uploaded {size if size is not None else '?'} bytes in {dur_ms} ms\nURL: {url}\nServer stored: {stored or '-'} ver={ver or '-'}"
+                try:
+                    with open(self._last_upload_path(), 'w', encoding='utf-8') as f:
+                        json.dump(dict(target, version=ver, ts=int(time.time())), f)
+                except Exception:
+                    pass
                 App.get_running_app().show_toast('Upload complete')
+                return True
             else:
                 # Include short server message to help diagnose (e.g., 403 Forbidden)
                 extra = ''
@@ -3939,6 +3911,7 @@ class SettingsScreen(Screen):
             # Any other unexpected error
             self.last_status = f"Error during upload: {type(e).__name__}: {e}\nURL: {url}"
             App.get_running_app().show_toast('Network error while uploading')
+        return False
 
     def reset_data(self):
         # Manager-only: two-step confirmation and reset of non-player data
@@ -3979,7 +3952,7 @@ class SettingsScreen(Screen):
                     sm = None
                 if sm:
                     try:
-                        bs = sm.get_screen('bingo')
+                        bs = sm.built_screen('bingo')
                         if bs and hasattr(bs, 'refresh_all'):
                             bs.refresh_all()
                         elif bs and hasattr(bs, 'refresh_from_db'):
@@ -3987,13 +3960,13 @@ class SettingsScreen(Screen):
                     except Exception:
                         pass
                     try:
-                        ls = sm.get_screen('league')
+                        ls = sm.built_screen('league')
                         if ls and hasattr(ls, '_load_leagues'):
                             ls._load_leagues()
                     except Exception:
                         pass
                     try:
-                        es = sm.get_screen('eventslist')
+                        es = sm.built_screen('eventslist')
                         if es and hasattr(es, 'refresh'):
                             es.refresh()
                     except Exception:
@@ -4141,7 +4114,16 @@ class BottomNav(BoxLayout):
 
 
 class DraftTimerScreen(Screen):
+    """Draft timer for one pod, or 2-4 pods drafting side by side.
+
+    Each pod is its own DraftTimer (independent mode, pause and seek, saved
+    state); all pods share the app-wide tick and sound pool, so adding pods
+    adds no Clock events. The control bar acts on the selected pod, exposed
+    as _timer_widget like in single-pod mode.
+    """
     from kivy.properties import BooleanProperty
+    pod_count = NumericProperty(1)
+    selected_pod = NumericProperty(0)
     can_play = BooleanProperty(True)
     can_pause = BooleanProperty(False)
     can_reset = BooleanProperty(False)
@@ -4192,16 +4174,67 @@ class DraftTimerScreen(Screen):
             self.can_prev = False
             self.can_next = False
 
-    def on_enter(self):
+    def pods(self):
+        return list(getattr(self, '_pods', None) or [])
+
+    def set_pod_count(self, count):
         cont = getattr(self, 'ids', {}).get('timer_container')
-        if cont is not None:
-            if not hasattr(self, '_timer_widget'):
-                try:
-                    self._timer_widget = DraftTimer()
-                except Exception:
+        if cont is None:
+            return
+        count = max(1, min(MAX_PODS, int(count)))
+        pods = self.pods()
+        while len(pods) < count:
+            try:
+                tw = DraftTimer(pod=len(pods))
+            except Exception:
+                if not pods:
                     self._timer_widget = Label(text="Draft Timer failed to load", color=(1,1,1,1))
+                    cont.clear_widgets()
+                    cont.add_widget(self._timer_widget)
+                    return
+                break
+            tw.on_select = lambda w: self.select_pod(w.pod)
+            pods.append(tw)
+        # Dropped pods stop and forget their draft
+        while len(pods) > count:
+            pods.pop().reset_all(None)
+        self._pods = pods
+        self.pod_count = len(pods)
+        grid = getattr(self, '_pod_grid', None)
+        if grid is None:
+            grid = self._pod_grid = GridLayout(cols=1, spacing=dp(8))
+        grid.clear_widgets()
+        grid.cols = 1 if len(pods) <= 2 else 2
+        multi = len(pods) > 1
+        for tw in pods:
+            tw.set_title_prefix(f"Pod {tw.pod + 1} · " if multi else "")
+            grid.add_widget(tw)
+        if grid.parent is not cont:
             cont.clear_widgets()
-            cont.add_widget(self._timer_widget)
+            cont.add_widget(grid)
+        self.select_pod(min(int(self.selected_pod), len(pods) - 1))
+
+    def select_pod(self, index):
+        pods = self.pods()
+        if not pods:
+            return
+        index = max(0, min(int(index), len(pods) - 1))
+        self.selected_pod = index
+        self._timer_widget = pods[index]
+        for tw in pods:
+            tw.set_highlight(len(pods) > 1 and tw is pods[index])
+        self._recompute_controls()
+
+    def on_enter(self):
+        if getattr(self, '_pods', None) is None:
+            # Restore every pod that still has a saved draft
+            self.set_pod_count(max(1, saved_pod_count()))
+        # Pods paused with the app while another screen was shown catch up now
+        for tw in self.pods():
+            try:
+                tw.on_app_resume()
+            except Exception:
+                pass
         # Start polling control state while on this screen
         try:
             if not hasattr(self, '_ctrl_ev') or self._ctrl_ev is None:
@@ -4268,6 +4301,97 @@ class DraftTimerScreen(Screen):
 # ----------------------
 # App Setup
 # ----------------------
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that constructs registered screens on first use.
+
+    register(name, cls, kv) records a screen and its kv files without building
+    or parsing anything; get_screen() and setting `current` build it on
+    demand. That must happen on the main thread (widgets must not be created
+    from worker threads): on a worker, an unbuilt screen raises RuntimeError.
+    has_screen() means registered (built or not) and builds nothing;
+    built_screen() returns a screen only if it already exists, for callers
+    that just want to poke a live screen. prewarm() builds likely next
+    screens one per frame once the app is idle.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories = {}  # name -> (Screen subclass, kv files), in registration order
+        self.build_times = {}  # name -> seconds spent constructing the screen
+
+    def register(self, name, cls, kv=()):
+        self._factories[name] = (cls, tuple(kv))
+
+    def built_screen(self, name):
+        for scr in self.screens:
+            if scr.name == name:
+                return scr
+        return None
+
+    def _ensure_screen(self, name):
+        entry = self._factories.get(name)
+        if entry is None or self.built_screen(name) is not None:
+            return
+        import threading
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError(f"screen '{name}' is not built yet and cannot be built off the main thread")
+        cls, kv_files = entry
+        t0 = time.perf_counter()
+        with startup_trace.phase(f'screen.{name}'):
+            # The screen's kv rules must be known before the widget is created
+            for path in kv_files:
+                kvloader.load_kv(path)
+            self.add_widget(cls(name=name))
+        self.build_times[name] = time.perf_counter() - t0
+
+    def get_screen(self, name):
+        self._ensure_screen(name)
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+    def prewarm(self, names, delay=0.5, gap=0.2):
+        pending = [n for n in names if n in self._factories]
+
+        def _step(dt):
+            while pending:
+                name = pending.pop(0)
+                if self.built_screen(name) is None:
+                    self._ensure_screen(name)
+                    break
+            if pending:
+                Clock.schedule_once(_step, gap)
+        if pending:
+            Clock.schedule_once(_step, delay)
+
+
+# Screen registry: name -> class and kv files. Both are loaded on first navigation (see LazyScreenManager).
+_SCREENS = (
+    ('login', 'LoginScreen', ('kv/login.kv',)),
+    ('settings', 'SettingsScreen', ('kv/settings.kv',)),
+    ('players', 'PlayersScreen', ('kv/players.kv',)),
+    ('newplayer', 'NewPlayerScreen', ('kv/newplayer.kv',)),
+    ('createevent_details', 'CreateEventDetailsScreen', ('kv/createevent_details.kv',)),
+    ('createevent', 'CreateEventScreen', ('kv/createevent.kv',)),
+    ('eventslist', 'EventsListScreen', ('kv/eventslist.kv',)),
+    ('event', 'EventScreen', ('kv/event.kv',)),
+    ('seating', 'SeatingScreen', ('kv/seating.kv',)),
+    ('standings', 'StandingsScreen', ('kv/scoretable.kv', 'kv/standings.kv')),
+    ('league', 'LeagueScreen', ('kv/scoretable.kv', 'kv/league.kv')),
+    ('bingo', 'BingoScreen', ('kv/bingo.kv',)),
+    ('drafttimer', 'DraftTimerScreen', ('kv/drafttimer.kv',)),
+    ('lifetracker', 'LifeTrackerScreen', ('kv/lifetracker.kv',)),
+)
+# Built eagerly: 'settings' drives sync from worker threads, which must not construct widgets
+_EAGER_SCREENS = ('settings',)
+# Idle-time pre-warm after the first frame, by initial screen
+_PREWARM = {
+    'login': ('players',),
+    'players': ('eventslist', 'event'),
+}
+
+
 class EventsApp(App):
     # Theme scaffold (Phase 2): centralized color tokens
     theme = DictProperty({
@@ -4280,10 +4404,25 @@ class EventsApp(App):
         'warning': (1.00, 0.75, 0.00, 1),
         'error': (0.85, 0.22, 0.22, 1),
     })
+    # Derived colors for kv bindings (see ThemePalette)
+    palette = ObjectProperty(PALETTE, rebind=True)
     # Reactive auth cache to drive UI bindings
     auth_role = StringProperty('guest')
     auth_username = StringProperty('')
     is_mgr = BooleanProperty(False)
+    # Manager upload queue state (see _update_sync_status)
+    sync_status = StringProperty('')
+
+    def _on_session_changed(self):
+        # Session listeners may fire from worker threads; update properties on the UI thread
+        Clock.schedule_once(lambda dt: self.refresh_auth_cache(), 0)
+        # A fresh login unblocks uploads that failed on an expired session
+        try:
+            if self.is_manager() and not SESSION.expired and self._outbox().pending_count():
+                self._outbox().retry_now()
+                self._schedule_outbox(0.5)
+        except Exception:
+            pass
 
     def refresh_auth_cache(self):
         try:
@@ -4300,8 +4439,47 @@ class EventsApp(App):
             self.auth_role = 'guest'
             self.auth_username = ''
 
+    # --- Change events after sync ---
+    # on_data_changed(changes): changes is a set of table names or None when unknown
+    __events__ = ('on_data_changed',)
+
+    def publish_data_changes(self, changes):
+        # Safe to call from worker threads: the event is dispatched on the UI thread
+        if changes is not None and not changes:
+            return
+        Clock.schedule_once(lambda dt: self.dispatch('on_data_changed', changes), 0)
+
+    def on_data_changed(self, changes):
+        # Refresh the visible screen only if it reads a changed table; other screens reload on enter
+        try:
+            # An event started/ended or a round began: re-pick the polling pace
+            if (changes is None or 'events' in changes) and getattr(self, '_guest_dl_ev', None) is not None:
+                self._schedule_guest_poll()
+        except Exception:
+            pass
+        try:
+            sm = self.root.ids.sm if self.root and hasattr(self.root, 'ids') else None
+            current = sm.current if sm else None
+            if not current:
+                return
+            if changes is not None:
+                deps = _SCREEN_TABLES.get(current)
+                if not deps or not (deps & set(changes)):
+                    return
+            scr = sm.get_screen(current)
+            if hasattr(scr, 'apply_changes'):
+                scr.apply_changes(changes)
+            elif hasattr(scr, 'refresh'):
+                scr.refresh()
+        except Exception:
+            pass
+
     # --- Guest auto-download scheduler ---
     def _stop_guest_autodownload(self):
+        self._stop_live_updates()
+        self._stop_guest_polling()
+
+    def _stop_guest_polling(self):
         try:
             ev = getattr(self, '_guest_dl_ev', None)
             if ev is not None:
@@ -4313,7 +4491,49 @@ class EventsApp(App):
         except Exception:
             self._guest_dl_ev = None
 
-    def _do_guest_download(self, *args):
+    def _start_guest_polling(self):
+        # Adaptive fallback used while the push channel is not live
+        if getattr(self, '_guest_dl_ev', None) is not None:
+            return
+        self._schedule_guest_poll()
+
+    def _schedule_guest_poll(self):
+        self._stop_guest_polling()
+        if getattr(self, '_paused', False):
+            return
+        try:
+            self._guest_dl_ev = Clock.schedule_once(self._guest_poll_tick, self._guest_poll_interval())
+        except Exception:
+            self._guest_dl_ev = None
+
+    def _guest_poll_tick(self, _dt):
+        self._guest_dl_ev = None
+        interval = self._guest_poll_interval()
+        # Let the poll itself run at its own pace; the 15 s navbar debounce would skip every other fast tick
+        self._do_guest_download(min_gap=interval / 2.0)
+        self._schedule_guest_poll()
+
+    def _guest_poll_interval(self) -> float:
+        """Seconds until the next guest poll, from what the local snapshot says is going on:
+        a round timer running (or just ended) -> fast, an active event -> medium, idle -> slow."""
+        try:
+            import db as _dbmod
+            rows = _dbmod.DB.execute(
+                "SELECT round_time, round_start_ts FROM events WHERE status='active'").fetchall()
+        except Exception:
+            return _GUEST_POLL_ACTIVE
+        if not rows:
+            return _GUEST_POLL_IDLE
+        now = time.time()
+        for round_time, start_ts in rows:
+            try:
+                if start_ts and now - float(start_ts) < float(round_time or 0) + 120:
+                    return _GUEST_POLL_LIVE
+            except Exception:
+                continue
+        return _GUEST_POLL_ACTIVE
+
+    def _do_guest_download(self, *args, min_gap: float = 15.0):
         # Guard: only in guest mode
         try:
             if self.is_manager():
@@ -4322,7 +4542,7 @@ class EventsApp(App):
             pass
         # Use unified debounce + background execution
         try:
-            if self._should_trigger_download():
+            if self._should_trigger_download(min_gap=min_gap):
                 self._start_background_download(reason="auto")
         except Exception:
             pass
@@ -4341,13 +4561,62 @@ class EventsApp(App):
                 _Clock.schedule_once(lambda dt: self._do_guest_download(), 0)
             except Exception:
                 pass
+        # Poll until the push channel reports it is live, then let it take over
+        self._start_guest_polling()
+        self._start_live_updates()
+
+    # --- Guest live updates (long-poll push channel, polling fallback) ---
+    def _start_live_updates(self):
+        self._stop_live_updates()
         try:
-            self._guest_dl_ev = _Clock.schedule_interval(lambda dt: self._do_guest_download(), 15.0)
+            auth = load_auth() or {}
+            manager_id = auth.get('manager_id')
+            if not manager_id:
+                return
+            from sync import VersionWatcher
+            self._live_watcher = VersionWatcher(
+                _get_base_url(auth),
+                manager_id,
+                on_version=lambda v: Clock.schedule_once(lambda dt: self._on_live_version(v), 0),
+                on_state=lambda st: Clock.schedule_once(lambda dt: self._on_live_state(st), 0),
+            )
+            self._live_watcher.start()
         except Exception:
-            self._guest_dl_ev = None
+            self._live_watcher = None
+
+    def _stop_live_updates(self):
+        try:
+            w = getattr(self, '_live_watcher', None)
+            if w is not None:
+                w.stop()
+        except Exception:
+            pass
+        self._live_watcher = None
+
+    def _on_live_state(self, state):
+        # Interval polling only runs while the push channel is not delivering
+        try:
+            if self.is_manager() or getattr(self, '_live_watcher', None) is None:
+                return
+            if state == 'live':
+                self._stop_guest_polling()
+            elif state in ('backoff', 'unsupported'):
+                self._start_guest_polling()
+        except Exception:
+            pass
+
+    def _on_live_version(self, version):
+        # Server published a new snapshot: fetch it now, bypassing the poll debounce
+        try:
+            if self.is_manager():
+                return
+        except Exception:
+            return
+        # If a download is running, the scheduler queues one follow-up so this bump is not lost
+        self._start_background_download(reason="push")
 
     # --- Conditional background download used by auto-schedule and navbar clicks ---
-    def _should_trigger_download(self) -> bool:
+    def _should_trigger_download(self, min_gap: float = 15.0) -> bool:
         try:
             # Only trigger for guests (non-managers)
             if self.is_manager():
@@ -4356,93 +4625,45 @@ class EventsApp(App):
             return False
         now = time.time()
         last = getattr(self, "_last_dl_ts", 0) or 0
-        in_prog = bool(getattr(self, "_dl_in_progress", False))
-        # Debounce: avoid if a download is running or ran within the last 15 seconds
+        try:
+            from jobs import JOBS
+            in_prog = JOBS.busy('download')
+        except Exception:
+            in_prog = False
+        # Debounce: avoid if a download is running or ran within the last min_gap seconds (15 s for navbar taps)
         if in_prog:
             return False
-        if last and (now - float(last) < 15.0):
+        if last and (now - float(last) < float(min_gap)):
             return False
         return True
 
     def _start_background_download(self, reason: str = "auto"):
-        # Mark pre-emptively to reduce race with multiple triggers
+        # Runs on the shared job pool; key='download' dedupes triggers and never overlaps runs
+        def _work(job):
+            sm = self.root.ids.sm if self.root and hasattr(self.root, 'ids') else None
+            scr = sm.get_screen('settings') if sm else None
+            if scr and hasattr(scr, 'do_download'):
+                scr.do_download()
+            # Screens refresh themselves from the change event published by do_download
+
+        def _finished(_result=None):
+            self._last_dl_ts = time.time()
         try:
-            self._dl_in_progress = True
-            if not getattr(self, "_last_dl_ts", None):
-                self._last_dl_ts = 0.0
+            from jobs import JOBS, PRIORITY_SYNC
+            JOBS.submit(_work, key='download', name=f'sync.download.{reason}', priority=PRIORITY_SYNC,
+                        on_done=_finished, on_error=_finished)
         except Exception:
             pass
-        def _worker():
-            try:
-                sm = self.root.ids.sm if self.root and hasattr(self.root, 'ids') else None
-                scr = sm.get_screen('settings') if sm else None
-                if scr and hasattr(scr, 'do_download'):
-                    scr.do_download()
-            except Exception:
-                pass
-            finally:
-                # Mark completion and timestamp
-                try:
-                    self._last_dl_ts = time.time()
-                    self._dl_in_progress = False
-                except Exception:
-                    pass
-                # After download, refresh current relevant screen
-                try:
-                    if not self.root or not hasattr(self.root, 'ids'):
-                        return
-                    sm2 = self.root.ids.sm
-                    current = sm2.current if sm2 else None
-                    def _refresh(_dt):
-                        try:
-                            if not sm2:
-                                return
-                            if current == 'players':
-                                try:
-                                    sm2.get_screen('players').refresh()
-                                except Exception:
-                                    pass
-                            elif current == 'eventslist':
-                                try:
-                                    sm2.get_screen('eventslist').refresh()
-                                except Exception:
-                                    pass
-                            elif current == 'event':
-                                try:
-                                    ev = sm2.get_screen('event')
-                                    if hasattr(ev, 'refresh_matches'):
-                                        ev.refresh_matches()
-                                except Exception:
-                                    pass
-                            elif current == 'league':
-                                try:
-                                    sm2.get_screen('league').refresh()
-                                except Exception:
-                                    pass
-                            elif current == 'bingo':
-                                try:
-                                    b = sm2.get_screen('bingo')
-                                    if hasattr(b, 'refresh_from_db'):
-                                        b.refresh_from_db()
-                                    elif hasattr(b, 'refresh_all'):
-                                        b.refresh_all()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                    Clock.schedule_once(_refresh, 0)
-                except Exception:
-                    pass
-        try:
-            import threading
-            t = threading.Thread(target=_worker, daemon=True)
-            t.start()
-        except Exception:
-            # Fallback: run inline (may block UI)
-            try:
-                _worker()
-            except Exception:
-                pass
+
+    # --- Manager outbound queue ---
+    def _outbox(self):
+        q = getattr(self, '_outbox_q', None)
+        if q is None:
+            from sync import OutboundQueue
+            from db import _get_persistent_db_path
+            q = OutboundQueue(_get_persistent_db_path('sync_outbox.db'))
+            self._outbox_q = q
+        return q
 
     def _maybe_upload_after_write(self, reason: str = ""):
         # Only for managers; guests never upload
@@ -4451,64 +4672,141 @@ class EventsApp(App):
                 return
         except Exception:
             return
-        # Debounce and avoid overlapping uploads
-        now = time.time()
+        # Persist the pending upload first so it survives dropped Wi-Fi and restarts
         try:
-            last = float(getattr(self, "_last_ul_ts", 0) or 0)
-            if getattr(self, "_ul_in_progress", False):
-                return
-            if last and (now - last) < 2.0:
+            self._outbox().enqueue('upload', reason)
+        except Exception:
+            return
+        # Debounce: a burst of writes becomes one upload
+        self._schedule_outbox(2.0)
+        self._update_sync_status()
+
+    def upload_now(self):
+        # Manual upload from Settings: skip any backoff and send right away
+        try:
+            if not self.is_manager():
                 return
+            q = self._outbox()
+            q.enqueue('upload', 'manual')
+            q.retry_now()
+        except Exception:
+            return
+        self._schedule_outbox(0)
+        self._update_sync_status()
+
+    def _schedule_outbox(self, delay: float):
+        try:
+            ev = getattr(self, '_outbox_ev', None)
+            if ev is not None:
+                ev.cancel()
         except Exception:
             pass
-        def _worker():
-            try:
-                sm = self.root.ids.sm if self.root and hasattr(self.root, 'ids') else None
-                scr = sm.get_screen('settings') if sm else None
-                if scr and hasattr(scr, 'do_upload'):
-                    scr.do_upload()
-            except Exception:
-                pass
-            finally:
-                try:
-                    self._last_ul_ts = time.time()
-                    self._ul_in_progress = False
-                except Exception:
-                    pass
+        self._outbox_ev = Clock.schedule_once(self._process_outbox, max(0.0, float(delay)))
+
+    def _process_outbox(self, _dt=0):
+        self._outbox_ev = None
+        # Avoid overlapping uploads; the running job re-checks the queue when done
+        from jobs import JOBS, PRIORITY_SYNC
+        if JOBS.busy('upload'):
+            return
         try:
-            import threading
-            self._ul_in_progress = True
-            t = threading.Thread(target=_worker, daemon=True)
-            t.start()
+            item = self._outbox().next_item() if self.is_manager() else None
         except Exception:
+            item = None
+        if not item:
+            self._update_sync_status()
+            return
+        wait = float(item.get('next_ts') or 0) - time.time()
+        if wait > 0:
+            self._schedule_outbox(wait)
+            self._update_sync_status()
+            return
+
+        def _work(job):
+            ok = False
+            err = ''
+            try:
+                base = _get_base_url(load_auth() or {})
+                # Probe first so offline retries never resend the whole file
+                if SESSION.expired:
+                    err = 'session expired, login again'
+                elif not _server_reachable(base, timeout=5):
+                    err = 'server unreachable'
+                else:
+                    sm = self.root.ids.sm if self.root and hasattr(self.root, 'ids') else None
+                    scr = sm.get_screen('settings') if sm else None
+                    if scr and hasattr(scr, 'do_upload'):
+                        # A manual upload always sends, even if the snapshot is unchanged;
+                        # the server was just probed, so skip the upload's own preflight
+                        ok = bool(scr.do_upload(force=(item.get('reason') == 'manual'), preflight=False))
+                        if not ok:
+                            err = (scr.last_status or 'upload failed').splitlines()[0]
+            except Exception as e:
+                err = f"{type(e).__name__}: {e}"
             try:
-                _worker()
+                q = self._outbox()
+                if ok:
+                    q.mark_done(item['op'], item['seq'])
+                else:
+                    q.mark_failed(item['op'], err)
             except Exception:
                 pass
 
+        def _after(_result=None):
+            self._last_ul_ts = time.time()
+            # Next pending item (a newer write, or the retry after backoff)
+            self._process_outbox()
+        try:
+            JOBS.submit(_work, key='upload', name='sync.upload', priority=PRIORITY_SYNC,
+                        on_done=_after, on_error=_after)
+        except RuntimeError:
+            return  # app stopping: the item stays in the outbox for the next start
+        self._update_sync_status()
+
+    def _update_sync_status(self):
+        # Human-readable queue state for the Settings screen
+        try:
+            if not self.is_manager():
+                self.sync_status = ''
+                return
+            from jobs import JOBS
+            if JOBS.busy('upload'):
+                self.sync_status = 'Uploading changes...'
+                return
+            item = self._outbox().next_item()
+            if not item:
+                self.sync_status = 'All changes uploaded'
+            elif item.get('attempts'):
+                at = datetime.fromtimestamp(float(item.get('next_ts') or 0)).strftime('%H:%M:%S')
+                self.sync_status = f"Upload pending: {item.get('attempts')} failed attempt(s), next retry {at} ({item.get('last_error') or 'error'})"
+            else:
+                self.sync_status = 'Upload pending'
+        except Exception:
+            pass
+
+    def on_theme(self, instance, value):
+        PALETTE.update(value)
+
     def build(self):
-        Builder.load_file("ui.kv")
+        SESSION.bind(self._on_session_changed)
+        PALETTE.update(self.theme)
+        # Shared rules only; each screen's kv is loaded with the screen
+        kvloader.set_cache_dir(os.path.join(os.path.dirname(get_db_path()), 'kvcache'))
+        kvloader.load_kv("ui.kv")
         # Create root container with fixed BottomNav and a ScreenManager (id: sm)
         from kivy.factory import Factory
         root = Factory.Root()
         sm = root.ids.sm
         # Ensure transition is SlideTransition with short duration
         sm.transition = SlideTransition(duration=0.18)
-        # Add all screens to ScreenManager
-        sm.add_widget(LoginScreen(name="login"))
-        sm.add_widget(SettingsScreen(name="settings"))
-        sm.add_widget(PlayersScreen(name="players"))
-        sm.add_widget(NewPlayerScreen(name="newplayer"))
-        sm.add_widget(CreateEventDetailsScreen(name="createevent_details"))
-        sm.add_widget(CreateEventScreen(name="createevent"))
-        sm.add_widget(EventsListScreen(name="eventslist"))
-        sm.add_widget(EventScreen(name="event"))
-        sm.add_widget(SeatingScreen(name="seating"))
-        sm.add_widget(StandingsScreen(name="standings"))
-        sm.add_widget(LeagueScreen(name="league"))
-        sm.add_widget(BingoScreen(name="bingo"))
-        sm.add_widget(DraftTimerScreen(name="drafttimer"))
-        sm.add_widget(LifeTrackerScreen(name="lifetracker"))
+        # Register all screens; each is constructed on first navigation
+        for name, cls_name, kv_files in _SCREENS:
+            sm.register(name, globals()[cls_name], kv_files)
+            if startup_trace.ENABLED:
+                cls = globals()[cls_name]
+                startup_trace.wrap_first_call(cls, 'on_kv_post', f'screen.{name}.on_kv_post')
+                startup_trace.wrap_first_call(cls, 'refresh_matches' if name == 'event' else 'refresh',
+                                              f'screen.{name}.first_refresh')
         # Set initial screen based on saved auth
         try:
             auth = load_auth()
@@ -4536,6 +4834,12 @@ class EventsApp(App):
                 root.ids.bottomnav.disabled = True
             except Exception:
                 pass
+        # After the initial screen is current (the first added screen would become current)
+        for name in _EAGER_SCREENS:
+            try:
+                sm.get_screen(name)
+            except Exception:
+                pass
         # Refresh auth cache to drive UI bindings
         try:
             self.refresh_auth_cache()
@@ -4557,16 +4861,42 @@ class EventsApp(App):
             pass
         # Debounce storage for back handling
         self._back_debounce_until = 0
-        # Start guest auto-download on app open if applicable
+        # Build the likely next screens while idle
+        try:
+            sm.prewarm(_PREWARM.get(sm.current, ()))
+        except Exception:
+            pass
+        # Start guest auto-download on app open if applicable; after the first frame,
+        # so the network stack is not imported while the first screen is drawn
         try:
             if not self.is_manager():
-                self._start_guest_autodownload(fire_immediately=True)
+                Clock.schedule_once(lambda dt: self._start_guest_autodownload(fire_immediately=True), 1.0)
             else:
                 self._stop_guest_autodownload()
+                # Resume uploads left pending by a previous session
+                self._schedule_outbox(1.0)
         except Exception:
             pass
         return root
 
+    def on_start(self):
+        if startup_trace.ENABLED:
+            try:
+                Window.bind(on_flip=self._on_first_flip)
+            except Exception:
+                pass
+
+    def _on_first_flip(self, *args):
+        # First frame on screen: close the cold-start trace
+        try:
+            Window.unbind(on_flip=self._on_first_flip)
+        except Exception:
+            pass
+        startup_trace.mark('first_frame')
+        startup_trace.write()
+        if startup_trace.EXIT_AFTER:
+            Clock.schedule_once(lambda dt: self.stop(), 0)
+
     def is_manager(self):
         try:
             role = (self.auth_role or '').strip().lower()
@@ -4732,13 +5062,32 @@ class EventsApp(App):
             return True  # prevent app close
         return False
 
+    def on_stop(self):
+        # Developer profiling: dump background job timings if requested
+        try:
+            from jobs import JOBS, AUTH_JOBS
+            path = os.environ.get('DRAFTBUDDY_JOB_METRICS')
+            if path:
+                JOBS.export_metrics(path)
+            JOBS.shutdown()
+            AUTH_JOBS.shutdown()
+        except Exception:
+            pass
+
     def on_pause(self):
         # Android: app is going to background; keep state, pause schedules if needed
+        self._paused = True
+        # Guests: no polling or long-poll while backgrounded (battery and data)
+        try:
+            if not self.is_manager():
+                self._stop_guest_autodownload()
+        except Exception:
+            pass
         try:
             # Pause DraftTimer updates if present to save CPU (state is wall-clock based)
-            scr = self.root.ids.sm.get_screen("drafttimer")
-            if hasattr(scr, "_timer_widget") and hasattr(scr._timer_widget, "_cancel_schedule"):
-                scr._timer_widget._cancel_schedule()
+            scr = self.root.ids.sm.built_screen("drafttimer")
+            for tw in (scr.pods() if scr is not None else ()):
+                tw._cancel_schedule()
         except Exception:
             pass
         # Return True to allow pause on Android
@@ -4746,6 +5095,10 @@ class EventsApp(App):
 
     def on_resume(self):
         # Resync timers when app returns to foreground
+        try:
+            TICKER.resync()
+        except Exception:
+            pass
         try:
             sm = self.root.ids.sm
             current = sm.current
@@ -4760,17 +5113,22 @@ class EventsApp(App):
         # DraftTimer: reschedule updates using wall-clock remaining
         try:
             if current == "drafttimer":
-                scr = sm.get_screen("drafttimer")
-                if hasattr(scr, "_timer_widget") and hasattr(scr._timer_widget, "on_app_resume"):
-                    scr._timer_widget.on_app_resume()
+                for tw in sm.get_screen("drafttimer").pods():
+                    tw.on_app_resume()
         except Exception:
             pass
-        # Ensure guest auto-download continues after resume (avoid duplicate schedules)
+        # Ensure guest auto-download continues after resume (avoid duplicate schedules);
+        # catch up right away since nothing was fetched while paused (still debounced)
+        self._paused = False
         try:
             if not self.is_manager():
-                self._start_guest_autodownload(fire_immediately=False)
+                self._start_guest_autodownload(fire_immediately=True)
             else:
                 self._stop_guest_autodownload()
+                # Connectivity may be back: retry pending uploads without waiting out the backoff
+                if self._outbox().pending_count():
+                    self._outbox().retry_now()
+                    self._schedule_outbox(0.5)
         except Exception:
             pass
 
@@ -0,0 +1,101 @@
+"""Shared pool of preloaded sound effects.
+
+Timer cues used to call SoundLoader.load() at the moment they had to play
+(the draft timer's animal sound right when a phase ends, tick.wav on the
+first countdown tick), which stalls the frame exactly when the sound is due.
+
+SOUNDS loads files on the background job pool (jobs.py) ahead of time:
+screens preload their fixed cues when they open and the draft timer
+prefetches the next phase's sound when the phase starts. play() uses the
+loaded Sound and only falls back to a synchronous load if the file is not
+ready yet. Playback goes through named channels; starting a sound on a
+channel stops the previous one on that channel, so stopping overlapping
+sounds is one lookup instead of a scan of every loaded sound.
+"""
+import threading
+
+from jobs import JOBS, PRIORITY_MEDIA
+
+import startup_trace
+
+
+def _load(path):
+    from kivy.core.audio import SoundLoader
+    return SoundLoader.load(path)
+
+
+class SoundPool:
+    def __init__(self, jobs=JOBS):
+        self._jobs = jobs
+        self._lock = threading.Lock()
+        self._sounds = {}    # path -> Sound, None if it failed to load
+        self._pending = set()
+        self._channels = {}  # channel -> Sound last started on it
+
+    def loaded(self, path) -> bool:
+        return self._sounds.get(path) is not None
+
+    def preload(self, paths):
+        """Load `paths` in the background (no-op for loaded or in-flight ones)."""
+        for path in paths:
+            if not path:
+                continue
+            with self._lock:
+                if path in self._sounds or path in self._pending:
+                    continue
+                self._pending.add(path)
+            try:
+                self._jobs.submit(lambda job, p=path: self._load_bg(p), key=f'sound:{path}',
+                                  name='sound.preload', priority=PRIORITY_MEDIA)
+            except Exception:
+                with self._lock:
+                    self._pending.discard(path)
+
+    def _load_bg(self, path):
+        try:
+            sound = _load(path)
+        except Exception:
+            sound = None
+        with self._lock:
+            self._pending.discard(path)
+            self._sounds.setdefault(path, sound)
+
+    def get(self, path):
+        """Loaded Sound for `path`, loading it now if the preload has not finished."""
+        with self._lock:
+            if path in self._sounds:
+                return self._sounds[path]
+        with startup_trace.phase('sound.load_sync'):
+            try:
+                sound = _load(path)
+            except Exception:
+                sound = None
+        with self._lock:
+            return self._sounds.setdefault(path, sound)
+
+    def play(self, path, channel=None) -> bool:
+        """Play `path`; with a channel, first stop what that channel is playing."""
+        sound = self.get(path)
+        if sound is None:
+            return False
+        if channel is not None:
+            self.stop(channel)
+            self._channels[channel] = sound
+        try:
+            sound.play()
+            return True
+        except Exception:
+            return False
+
+    def stop(self, channel):
+        sound = self._channels.pop(channel, None)
+        if sound is not None:
+            try:
+                if getattr(sound, 'state', 'play') == 'play':
+                    sound.stop()
+            except Exception:
+                pass
+
+
+# Shared app-wide pool
+SOUNDS = SoundPool()
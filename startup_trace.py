@@ -0,0 +1,136 @@
+"""Cold-start instrumentation.
+
+Off unless DRAFTBUDDY_STARTUP_TRACE is set to an output path. When enabled,
+main.py and db.py record the startup phases (imports, DB init/migrations,
+ui.kv load, each screen's construction and on_kv_post, the first refresh,
+the first frame) and the trace is written as JSON at the first frame:
+
+    {
+      "phases": [{"name": "import.kivy", "start_ms": 12.1, "dur_ms": 310.4}, ...],
+      "first_frame_ms": 1234.5,
+      "sql_statements": 42,
+      "modules": 812,
+      "eager_imports": {"requests": true, ...}
+    }
+
+Times are milliseconds since this module was imported (main.py imports it
+first). mark() phases are sequential and cover the time since the previous
+mark (so "first_frame" spans build() up to the first frame); phase() spans
+may nest inside them (db.init_db within import.app_modules).
+
+With DRAFTBUDDY_STARTUP_EXIT=1 the app stops right after writing the trace;
+tools/startup_profile.py uses that to compare runs across commits.
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+_T0 = time.perf_counter()
+ENABLED = bool(os.environ.get('DRAFTBUDDY_STARTUP_TRACE'))
+EXIT_AFTER = os.environ.get('DRAFTBUDDY_STARTUP_EXIT') == '1'
+
+# Modules that should stay out of the cold start; reported so a new eager import shows up
+WATCHED_MODULES = ('requests', 'urllib3',
+                   'kivy.core.audio', 'kivy.core.clipboard', 'kivy.core.image')
+
+_phases = []
+_last_mark = 0.0
+_sql = {'count': 0, 'conn': None}
+_written = False
+
+
+def _now_ms():
+    return (time.perf_counter() - _T0) * 1000.0
+
+
+def mark(name):
+    """Record a phase that ran since the previous mark (sequential
+    top-level steps such as imports)."""
+    global _last_mark
+    if not ENABLED:
+        return
+    now = _now_ms()
+    _phases.append({'name': name, 'start_ms': round(_last_mark, 2),
+                    'dur_ms': round(now - _last_mark, 2)})
+    _last_mark = now
+
+
+@contextmanager
+def phase(name):
+    """Record the span of the with-block."""
+    if not ENABLED:
+        yield
+        return
+    start = _now_ms()
+    try:
+        yield
+    finally:
+        _phases.append({'name': name, 'start_ms': round(start, 2),
+                        'dur_ms': round(_now_ms() - start, 2)})
+
+
+def wrap_first_call(cls, attr, name):
+    """Time the first call of cls.attr (e.g. a screen's first refresh) as phase `name`."""
+    if not ENABLED:
+        return
+    orig = cls.__dict__.get(attr)
+    if orig is None or getattr(orig, '_startup_traced', False):
+        return
+
+    def traced(self, *args, **kwargs):
+        if getattr(traced, '_done', False):
+            return orig(self, *args, **kwargs)
+        traced._done = True
+        with phase(name):
+            return orig(self, *args, **kwargs)
+    traced._startup_traced = True
+    traced.__name__ = getattr(orig, '__name__', attr)
+    traced.__doc__ = getattr(orig, '__doc__', None)
+    setattr(cls, attr, traced)
+
+
+def count_sql(conn):
+    """Count statements run on `conn` during startup."""
+    if not ENABLED:
+        return
+    try:
+        def _cb(stmt):
+            _sql['count'] += 1
+        conn.set_trace_callback(_cb)
+        _sql['conn'] = conn
+    except Exception:
+        pass
+
+
+def snapshot():
+    return {
+        'phases': sorted(_phases, key=lambda p: p['start_ms']),
+        'first_frame_ms': next((p['start_ms'] + p['dur_ms']
+                                for p in _phases if p['name'] == 'first_frame'), None),
+        'sql_statements': _sql['count'],
+        'modules': len(sys.modules),
+        'eager_imports': {m: m in sys.modules for m in WATCHED_MODULES},
+    }
+
+
+def write(path=None):
+    """Write the trace once; returns the path or None."""
+    global _written
+    if not ENABLED or _written:
+        return None
+    path = path or os.environ.get('DRAFTBUDDY_STARTUP_TRACE')
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot(), f, indent=2)
+        _written = True
+    except Exception:
+        return None
+    # Startup is over: stop counting statements
+    try:
+        if _sql['conn'] is not None:
+            _sql['conn'].set_trace_callback(None)
+    except Exception:
+        pass
+    return path
@@ -0,0 +1,295 @@
+"""Live sync helpers.
+
+This module holds the client side of the live-update channel used by guests:
+a long-poll watcher that waits on the server for snapshot version bumps so the
+app downloads only when something actually changed, instead of blindly
+re-fetching the whole snapshot on a fixed interval.
+
+It also holds the manager's outbound queue: pending uploads are persisted in
+a small SQLite file so they survive dropped Wi-Fi and app restarts, and are
+retried with exponential backoff instead of being lost after one failure.
+
+CancellableSession is the HTTP session behind interactive calls (sign-in,
+diagnostics) whose request the user can abort while it is in flight.
+
+All network I/O happens on a daemon thread. Callbacks are invoked from that
+thread and never touch widgets directly; the app marshals them onto the UI
+thread itself (Clock.schedule_once). Errors are swallowed and turned into
+reconnects with exponential backoff so the UI never crashes.
+"""
+import random
+import socket
+import sqlite3
+import threading
+import time
+
+
+def backoff_delay(failures, base=1.0, cap=60.0):
+    """Exponential backoff with "equal jitter" so many clients do not retry in lockstep."""
+    top = min(float(cap), float(base) * (2 ** max(0, int(failures) - 1)))
+    return top / 2.0 + random.uniform(0, top / 2.0)
+
+
+class VersionWatcher:
+    """Long-poll the server for snapshot version changes.
+
+    Protocol: ``GET {base}/public/{manager_id}/version?since=<v>&wait=<s>``
+    returns ``{"version": <int>}`` as soon as the published version differs
+    from ``since`` or after ``wait`` seconds, whichever comes first.
+
+    Callbacks:
+    - on_version(version): a new version was observed (not fired for the
+      first baseline reading).
+    - on_state(state): channel state changed; one of 'connecting', 'live',
+      'backoff', 'unsupported', 'stopped'.
+
+    If the server does not know the endpoint (404/405/501) the watcher stops
+    with state 'unsupported' so the caller can fall back to interval polling.
+    """
+
+    def __init__(self, base_url, manager_id, on_version, on_state=None,
+                 wait=25, min_backoff=1.0, max_backoff=60.0):
+        self.base_url = (base_url or '').rstrip('/')
+        self.manager_id = manager_id
+        self.on_version = on_version
+        self.on_state = on_state
+        self.wait = int(wait)
+        self.min_backoff = float(min_backoff)
+        self.max_backoff = float(max_backoff)
+        self.version = None
+        self.state = 'stopped'
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='version-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._set_state('stopped')
+
+    def _set_state(self, state):
+        if state == self.state:
+            return
+        self.state = state
+        try:
+            if self.on_state:
+                self.on_state(state)
+        except Exception:
+            pass
+
+    def _backoff_delay(self, failures):
+        return backoff_delay(failures, self.min_backoff, self.max_backoff)
+
+    def _poll_once(self):
+        import requests
+        url = f"{self.base_url}/public/{self.manager_id}/version"
+        params = {'wait': self.wait}
+        if self.version is not None:
+            params['since'] = self.version
+        # Allow the server the full wait window plus some slack before timing out
+        timeout = (8, self.wait + 10)
+        try:
+            return requests.get(url, params=params, timeout=timeout)
+        except requests.exceptions.SSLError:
+            return requests.get(url, params=params, timeout=timeout, verify=False)
+
+    def _run(self):
+        failures = 0
+        self._set_state('connecting')
+        while not self._stop.is_set():
+            try:
+                resp = self._poll_once()
+            except Exception:
+                resp = None
+            if self._stop.is_set():
+                break
+            if resp is not None and resp.status_code in (404, 405, 501):
+                self._set_state('unsupported')
+                self._stop.set()
+                break
+            ver = None
+            if resp is not None and resp.status_code == 200:
+                try:
+                    ver = resp.json().get('version')
+                except Exception:
+                    ver = None
+            if ver is None:
+                failures += 1
+                self._set_state('backoff')
+                self._stop.wait(self._backoff_delay(failures))
+                continue
+            failures = 0
+            self._set_state('live')
+            if self.version is None:
+                # First reading is only a baseline; the app downloads on start anyway
+                self.version = ver
+                continue
+            if ver != self.version:
+                self.version = ver
+                try:
+                    self.on_version(ver)
+                except Exception:
+                    pass
+
+
+class CancellableSession:
+    """requests-style get/post whose in-flight requests cancel() aborts.
+
+    Closing a requests.Session leaves a request that is already waiting on the
+    server running until its timeout. cancel() also shuts down the sockets of
+    the connections in use, so the blocked call fails at once with a
+    ConnectionError and its worker is free again. A connect still in progress
+    is only bounded by its connect timeout. Calls after cancel() fail at once.
+    """
+
+    def __init__(self):
+        import requests
+        self._requests = requests
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._live = set()  # connections checked out of the pools
+        self.cancelled = False
+        for adapter in self._session.adapters.values():
+            pm = adapter.poolmanager
+            pm.pool_classes_by_scheme = {scheme: self._tracking(cls)
+                                         for scheme, cls in pm.pool_classes_by_scheme.items()}
+
+    def _tracking(self, pool_cls):
+        owner = self
+
+        class _Pool(pool_cls):
+            def _get_conn(self, timeout=None):
+                conn = super()._get_conn(timeout)
+                with owner._lock:
+                    owner._live.add(conn)
+                return conn
+
+            def _put_conn(self, conn):
+                with owner._lock:
+                    owner._live.discard(conn)
+                super()._put_conn(conn)
+        return _Pool
+
+    def request(self, method, url, **kwargs):
+        if self.cancelled:
+            raise self._requests.exceptions.ConnectionError('Cancelled')
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            conns = list(self._live)
+        for conn in conns:
+            sock = getattr(conn, 'sock', None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self._session.close()
+
+
+class OutboundQueue:
+    """Persistent queue of pending sync operations (manager side).
+
+    One row per operation kind (e.g. 'upload'): since an upload always sends
+    the whole snapshot, repeated writes coalesce into a single pending row
+    whose ``seq`` is bumped on every enqueue. A row is only removed by
+    mark_done() if no newer write arrived while it was being sent.
+
+    Lives in its own SQLite file so a downloaded snapshot never replaces it
+    and it is never uploaded along with the event data.
+    """
+
+    def __init__(self, path, min_backoff=2.0, max_backoff=300.0):
+        self.path = path
+        self.min_backoff = float(min_backoff)
+        self.max_backoff = float(max_backoff)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+              op TEXT PRIMARY KEY,
+              reason TEXT,
+              seq INTEGER NOT NULL DEFAULT 1,
+              created_ts REAL,
+              attempts INTEGER NOT NULL DEFAULT 0,
+              next_ts REAL NOT NULL DEFAULT 0,
+              last_error TEXT
+            )
+            """
+        )
+        self._conn.commit()
+
+    def enqueue(self, op='upload', reason=''):
+        # Keep any running backoff: a new write while offline must not trigger a burst of retries
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO outbox(op, reason, seq, created_ts, attempts, next_ts)
+                VALUES(?, ?, 1, ?, 0, ?)
+                ON CONFLICT(op) DO UPDATE SET seq = seq + 1, reason = excluded.reason
+                """,
+                (op, reason or '', now, now),
+            )
+            self._conn.commit()
+
+    def next_item(self):
+        """Return the earliest pending row as a dict, or None when the queue is empty."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT op, reason, seq, attempts, next_ts, last_error FROM outbox ORDER BY next_ts LIMIT 1"
+            ).fetchone()
+        if not row:
+            return None
+        return dict(zip(('op', 'reason', 'seq', 'attempts', 'next_ts', 'last_error'), row))
+
+    def mark_done(self, op, seq):
+        """Drop the row if it still has ``seq``; otherwise make the newer write due now."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM outbox WHERE op=? AND seq=?", (op, seq))
+            if cur.rowcount == 0:
+                self._conn.execute(
+                    "UPDATE outbox SET attempts=0, next_ts=?, last_error=NULL WHERE op=?", (time.time(), op))
+            self._conn.commit()
+            return cur.rowcount > 0
+
+    def mark_failed(self, op, error=''):
+        """Record a failed attempt and schedule the retry. Returns the delay in seconds."""
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM outbox WHERE op=?", (op,)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            delay = backoff_delay(attempts, self.min_backoff, self.max_backoff)
+            self._conn.execute(
+                "UPDATE outbox SET attempts=?, next_ts=?, last_error=? WHERE op=?",
+                (attempts, time.time() + delay, str(error or '')[:200], op),
+            )
+            self._conn.commit()
+        return delay
+
+    def retry_now(self):
+        # Connectivity probably changed (app resumed, manual upload): clear the backoff
+        with self._lock:
+            self._conn.execute("UPDATE outbox SET next_ts=?", (time.time(),))
+            self._conn.commit()
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
@@ -0,0 +1,19 @@
+"""Shared pytest setup: import the app modules from the repo root without
+touching real app data or Kivy's command line/console logging."""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO not in sys.path:
+    sys.path.insert(0, _REPO)
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KIVY_NO_FILELOG', '1')
+# Modules that open the DB or state files write here instead
+if not os.environ.get('DRAFTBUDDY_DATA_DIR'):
+    os.environ['DRAFTBUDDY_DATA_DIR'] = tempfile.mkdtemp(prefix='draftbuddy-tests-')
+    atexit.register(shutil.rmtree, os.environ['DRAFTBUDDY_DATA_DIR'], True)
@@ -0,0 +1,63 @@
+"""CancellableSession.cancel() aborts a request that is waiting on the server."""
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from sync import CancellableSession
+
+
+@pytest.fixture
+def silent_server():
+    # Accepts connections and never answers, like a server stuck on a slow request
+    srv = socket.socket()
+    srv.bind(('127.0.0.1', 0))
+    srv.listen(4)
+    held = []
+    stop = threading.Event()
+
+    def _accept():
+        srv.settimeout(0.1)
+        while not stop.is_set():
+            try:
+                held.append(srv.accept()[0])
+            except OSError:
+                pass
+    t = threading.Thread(target=_accept, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{srv.getsockname()[1]}"
+    stop.set()
+    t.join()
+    for c in held:
+        c.close()
+    srv.close()
+
+
+def test_cancel_aborts_request_in_flight(silent_server):
+    session = CancellableSession()
+    outcome = {}
+
+    def _call():
+        t0 = time.monotonic()
+        try:
+            session.get(f"{silent_server}/auth/login", timeout=(5, 30))
+        except requests.exceptions.RequestException as e:
+            outcome['error'] = e
+        outcome['secs'] = time.monotonic() - t0
+    t = threading.Thread(target=_call)
+    t.start()
+    time.sleep(0.3)
+    session.cancel()
+    t.join(5)
+    assert not t.is_alive()
+    assert isinstance(outcome['error'], requests.exceptions.ConnectionError)
+    assert outcome['secs'] < 5
+
+
+def test_calls_after_cancel_fail_at_once(silent_server):
+    session = CancellableSession()
+    session.cancel()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(f"{silent_server}/health", timeout=(5, 30))
@@ -0,0 +1,71 @@
+"""fit_font_size: binary search result and per-box cache behaviour."""
+import pytest
+
+import timer
+from timer import fit_font_size
+
+
+@pytest.fixture(autouse=True)
+def measured(monkeypatch):
+    """Count real text measurements; start every test with an empty cache."""
+    timer._FIT_CACHE.clear()
+    calls = []
+    real = timer._text_fits
+
+    def counting(text, size, max_w, max_h, font_name):
+        calls.append((text, size))
+        return real(text, size, max_w, max_h, font_name)
+    monkeypatch.setattr(timer, '_text_fits', counting)
+    yield calls
+    timer._FIT_CACHE.clear()
+
+
+def _linear_fit(text, max_w, max_h, max_px, min_px):
+    # The original top-down scan, as the reference result
+    size = max_px
+    while size > min_px and not timer._text_fits(text, size, max_w, max_h, None):
+        size -= 0.5
+    return max(min_px, size - 1.0)
+
+
+@pytest.mark.parametrize('text, box', [('88', (300, 200)), ('Ready', (240, 80)), ('Pick Review', (120, 40))])
+def test_matches_the_linear_scan(text, box):
+    expected = _linear_fit('88' if text.isdigit() else text, box[0], box[1], 150.0, 10.0)
+    assert fit_font_size(text, box[0], box[1], 150.0, 10.0) == expected
+
+
+def test_countdown_values_share_one_entry_per_digit_count(measured):
+    first = fit_font_size('45', 300, 200, 150.0)
+    searched = len(measured)
+    assert searched > 0
+    # Every other 1- and 2-digit value is a cache hit
+    assert all(fit_font_size(str(n), 300, 200, 150.0) == first for n in range(60))
+    assert len(measured) == searched
+    fit_font_size('120', 300, 200, 150.0)
+    assert len(measured) > searched
+
+
+def test_binary_search_measures_logarithmically(measured):
+    fit_font_size('Pick Review', 120, 40, 150.0, 10.0)
+    # 281 candidate sizes; a linear scan would measure most of them
+    assert len(measured) <= 10
+
+
+def test_cache_is_keyed_by_box_and_font(measured):
+    fit_font_size('Ready', 240, 80, 150.0)
+    n = len(measured)
+    fit_font_size('Ready', 240.4, 80.2, 150.0)  # same whole-pixel box
+    assert len(measured) == n
+    fit_font_size('Ready', 241, 80, 150.0)
+    assert len(measured) > n
+
+
+def test_text_that_never_fits_gets_min_size():
+    assert fit_font_size('Pick Review', 1, 1, 150.0, 10.0) == 10.0
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(timer, '_FIT_CACHE_MAX', 4)
+    for w in range(100, 110):
+        fit_font_size('Ready', w, 80, 60.0)
+    assert len(timer._FIT_CACHE) <= 4
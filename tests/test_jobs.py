@@ -0,0 +1,105 @@
+"""JobScheduler: key dedupe, follow-up coalescing, priority order, cancellation."""
+import threading
+
+import pytest
+
+from jobs import JobScheduler, PRIORITY_MEDIA, PRIORITY_SYNC
+
+
+@pytest.fixture
+def sched():
+    # Deliver callbacks inline instead of through the Kivy Clock
+    s = JobScheduler(workers=1, deliver=lambda fn: fn())
+    yield s
+    s.shutdown()
+
+
+def _block(sched, key='gate'):
+    """Occupy the only worker until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def _gate(job):
+        started.set()
+        release.wait(5)
+    sched.submit(_gate, key=key)
+    assert started.wait(5)
+    return release
+
+
+def _wait_idle(sched, *keys):
+    done = threading.Event()
+    sched.submit(lambda job: None, key='_idle', priority=PRIORITY_MEDIA + 100, on_done=lambda _r: done.set())
+    assert done.wait(5)
+    assert not any(sched.busy(k) for k in keys)
+
+
+def test_same_key_while_queued_returns_the_queued_job(sched):
+    release = _block(sched)
+    calls = []
+    a = sched.submit(lambda job: calls.append('a'), key='sync')
+    b = sched.submit(lambda job: calls.append('b'), key='sync')
+    assert a is b
+    release.set()
+    _wait_idle(sched, 'sync')
+    assert calls == ['a']
+
+
+def test_same_key_while_running_queues_one_follow_up(sched):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def _first(job):
+        started.set()
+        release.wait(5)
+        calls.append('first')
+    sched.submit(_first, key='upload')
+    assert started.wait(5)
+    f1 = sched.submit(lambda job: calls.append('second'), key='upload')
+    f2 = sched.submit(lambda job: calls.append('third'), key='upload')
+    assert f1 is f2
+    release.set()
+    _wait_idle(sched, 'upload')
+    assert calls == ['first', 'second']
+
+
+def test_lower_priority_number_runs_first(sched):
+    release = _block(sched)
+    order = []
+    sched.submit(lambda job: order.append('idle'), priority=PRIORITY_MEDIA + 10)
+    sched.submit(lambda job: order.append('media'), priority=PRIORITY_MEDIA)
+    sched.submit(lambda job: order.append('sync'), priority=PRIORITY_SYNC)
+    sched.submit(lambda job: order.append('sync2'), priority=PRIORITY_SYNC)
+    release.set()
+    _wait_idle(sched)
+    assert order == ['sync', 'sync2', 'media', 'idle']
+
+
+def test_cancelled_queued_job_never_runs(sched):
+    release = _block(sched)
+    calls = []
+    sched.submit(lambda job: calls.append('x'), key='export', on_done=lambda r: calls.append('done'))
+    assert sched.cancel('export')
+    assert not sched.busy('export')
+    release.set()
+    _wait_idle(sched)
+    assert calls == []
+    assert sched.metrics()['jobs']['export']['cancelled'] == 1
+
+
+def test_results_and_errors_reach_their_callbacks(sched):
+    got = []
+    done = threading.Event()
+    sched.submit(lambda job: 42, on_done=got.append)
+
+    def _boom(job):
+        raise ValueError('boom')
+    sched.submit(_boom, on_error=lambda e: (got.append(type(e).__name__), done.set()))
+    assert done.wait(5)
+    assert got == [42, 'ValueError']
+
+
+def test_submit_after_shutdown_is_rejected(sched):
+    sched.shutdown()
+    with pytest.raises(RuntimeError):
+        sched.submit(lambda job: None, key='late')
+    assert not sched.busy('late')
@@ -0,0 +1,89 @@
+"""OutboundQueue coalescing/retry bookkeeping and backoff_delay bounds."""
+import random
+import time
+
+import pytest
+
+from sync import OutboundQueue, backoff_delay
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return OutboundQueue(str(tmp_path / 'outbox.db'), min_backoff=2.0, max_backoff=300.0)
+
+
+@pytest.mark.parametrize('failures, top', [(0, 2.0), (1, 2.0), (2, 4.0), (3, 8.0), (20, 60.0)])
+def test_backoff_delay_stays_in_equal_jitter_range(failures, top):
+    cap = 60.0
+    for _ in range(200):
+        delay = backoff_delay(failures, base=2.0, cap=cap)
+        assert top / 2.0 <= delay <= top
+
+
+def test_backoff_delay_is_jittered():
+    random.seed(1)
+    assert len({round(backoff_delay(5), 6) for _ in range(20)}) > 1
+
+
+def test_writes_coalesce_into_one_row(outbox):
+    for _ in range(3):
+        outbox.enqueue('upload', 'write')
+    outbox.enqueue('upload', 'manual')
+    assert outbox.pending_count() == 1
+    item = outbox.next_item()
+    assert item['seq'] == 4
+    assert item['reason'] == 'manual'
+
+
+def test_mark_done_removes_the_sent_seq(outbox):
+    outbox.enqueue('upload')
+    item = outbox.next_item()
+    assert outbox.mark_done(item['op'], item['seq'])
+    assert outbox.next_item() is None
+
+
+def test_write_during_upload_keeps_a_due_row(outbox):
+    outbox.enqueue('upload')
+    sent = outbox.next_item()
+    outbox.mark_failed('upload', 'offline')
+    outbox.enqueue('upload')  # newer write while the snapshot was in flight
+    assert not outbox.mark_done(sent['op'], sent['seq'])
+    item = outbox.next_item()
+    assert item['seq'] == sent['seq'] + 1
+    assert item['attempts'] == 0 and item['last_error'] is None
+    assert item['next_ts'] <= time.time()
+
+
+def test_mark_failed_backs_off_and_counts_attempts(outbox):
+    outbox.enqueue('upload')
+    before = time.time()
+    delay = outbox.mark_failed('upload', 'server unreachable')
+    item = outbox.next_item()
+    assert 1.0 <= delay <= 2.0
+    assert item['attempts'] == 1
+    assert item['last_error'] == 'server unreachable'
+    assert item['next_ts'] >= before + delay - 0.01
+    assert 2.0 <= outbox.mark_failed('upload') <= 4.0
+    assert outbox.next_item()['attempts'] == 2
+
+
+def test_enqueue_keeps_a_running_backoff(outbox):
+    outbox.enqueue('upload')
+    outbox.mark_failed('upload')
+    due = outbox.next_item()['next_ts']
+    outbox.enqueue('upload')
+    assert outbox.next_item()['next_ts'] == due
+
+
+def test_retry_now_clears_the_backoff(outbox):
+    outbox.enqueue('upload')
+    outbox.mark_failed('upload')
+    outbox.retry_now()
+    assert outbox.next_item()['next_ts'] <= time.time()
+
+
+def test_queue_survives_reopening(tmp_path):
+    path = str(tmp_path / 'outbox.db')
+    OutboundQueue(path).enqueue('upload', 'write')
+    item = OutboundQueue(path).next_item()
+    assert item['op'] == 'upload' and item['seq'] == 1
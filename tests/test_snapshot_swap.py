@@ -0,0 +1,62 @@
+"""Applying a downloaded snapshot: prepare, repoint and table digests."""
+import os
+
+import pytest
+
+import db
+
+
+def _snapshot(path, players):
+    conn = db.init_db(str(path))
+    conn.execute("DELETE FROM players")
+    conn.executemany("INSERT INTO players(name) VALUES(?)", [(n,) for n in players])
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def data_dir():
+    return os.path.dirname(db.get_db_path())
+
+
+def test_prepare_rejects_a_file_that_is_not_sqlite(data_dir):
+    path = os.path.join(data_dir, 'garbage.sqlite')
+    with open(path, 'wb') as f:
+        f.write(b'not a database' * 100)
+    try:
+        assert not db.prepare_snapshot(path)
+    finally:
+        os.remove(path)
+
+
+def test_repoint_keeps_the_imported_handle(data_dir):
+    handle = db.DB
+    path = _snapshot(os.path.join(data_dir, 'dl.sqlite'), ['Ann', 'Bob'])
+    assert db.prepare_snapshot(path)
+    old = db.repoint_live(path)
+    if old is not None:
+        old.close()
+    assert handle is db.DB
+    assert [r[0] for r in handle.execute("SELECT name FROM players ORDER BY id")] == ['Ann', 'Bob']
+    assert not os.path.exists(path)
+
+
+def test_live_digests_expire_on_local_write(data_dir):
+    path = _snapshot(os.path.join(data_dir, 'dl.sqlite'), ['Ann'])
+    digests = db.table_digests(path, {'players', 'events'})
+    assert digests['players'][0] == 1 and digests['events'][0] == 0
+    old = db.repoint_live(path, digests)
+    if old is not None:
+        old.close()
+    assert db.live_digests() == digests
+    db.DB.execute("INSERT INTO players(name) VALUES('Cy')")
+    db.DB.commit()
+    assert db.live_digests() is None
+
+
+def test_changed_tables():
+    before = {'players': (2, 11), 'events': (1, 5), 'leagues': (0, 0)}
+    after = {'players': (2, 11), 'events': (1, 6), 'matches': (3, 9)}
+    assert db.changed_tables(before, after) == {'events', 'leagues', 'matches'}
+    assert db.changed_tables(after, dict(after)) == set()
@@ -0,0 +1,120 @@
+"""Round trip against the stand-in server (tools/sync_server.py): a manager
+upload wakes a guest's long-poll, and the guest then downloads exactly the
+uploaded snapshot. The test does the outbox bookkeeping around the upload by
+hand; the app's own outbox processing needs the UI and is not covered here."""
+import io
+import json
+import queue
+import sqlite3
+import time
+
+import pytest
+import requests
+
+from sync import OutboundQueue, VersionWatcher
+from tools.sync_server import SyncServer
+
+
+@pytest.fixture
+def server():
+    srv = SyncServer().start_background()
+    yield srv
+    srv.stop()
+
+
+def _login(base, username):
+    r = requests.post(f"{base}/auth/login", json={'username': username, 'password': 'x'}, timeout=10)
+    r.raise_for_status()
+    return r.json()
+
+
+def _upload(base, token, data):
+    files = {'file': ('events.db', io.BytesIO(data), 'application/octet-stream')}
+    return requests.post(f"{base}/db/upload", headers={'Authorization': f'Bearer {token}'},
+                         files=files, timeout=10)
+
+
+def test_long_poll_returns_at_once_when_version_differs(server):
+    server.publish('1', b'v1')
+    r = requests.get(f"{server.base_url}/public/1/version", params={'since': 0, 'wait': 10}, timeout=5)
+    assert r.json() == {'version': 1}
+
+
+def test_long_poll_times_out_with_unchanged_version(server):
+    server.publish('1', b'v1')
+    r = requests.get(f"{server.base_url}/public/1/version", params={'since': 1, 'wait': 0.2}, timeout=5)
+    assert r.json() == {'version': 1}
+
+
+def test_guests_cannot_upload(server):
+    token = _login(server.base_url, 'guest')['access_token']
+    assert _upload(server.base_url, token, b'data').status_code == 403
+
+
+def test_manager_upload_reaches_watching_guest(server, tmp_path):
+    base = server.base_url
+    server.publish('1', b'initial snapshot')
+    versions = queue.Queue()
+    states = []
+    watcher = VersionWatcher(base, '1', on_version=versions.put, on_state=states.append, wait=5)
+    watcher.start()
+    try:
+        # Wait for the baseline reading before the manager writes
+        deadline = time.monotonic() + 5
+        while watcher.version is None and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert watcher.version == 1
+        assert watcher.state == 'live'
+
+        # Manager side: two writes coalesce into one pending upload, sent and marked done by hand
+        q = OutboundQueue(str(tmp_path / 'outbox.db'))
+        q.enqueue('upload', 'write')
+        q.enqueue('upload', 'write')
+        item = q.next_item()
+        assert item['seq'] == 2 and q.pending_count() == 1
+        token = _login(base, 'manager1')['access_token']
+        payload = b'snapshot after two writes'
+        r = _upload(base, token, payload)
+        assert r.status_code == 200 and r.json()['version'] == 2
+        assert q.mark_done(item['op'], item['seq'])
+        assert q.next_item() is None
+
+        # Guest side: the long-poll wakes up and the public snapshot is the upload
+        assert versions.get(timeout=5) == 2
+        snap = requests.get(f"{base}/public/1/snapshot.sqlite", timeout=10)
+        assert snap.status_code == 200 and snap.content == payload
+    finally:
+        watcher.stop()
+    assert states[0] == 'connecting' and 'live' in states
+
+
+def _snapshot(tmp_path, players, events):
+    path = tmp_path / f'snap_{len(players)}_{len(events)}.sqlite'
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE players(name)")
+    conn.execute("CREATE TABLE events(name)")
+    conn.executemany("INSERT INTO players VALUES(?)", [(p,) for p in players])
+    conn.executemany("INSERT INTO events VALUES(?)", [(e,) for e in events])
+    conn.commit()
+    conn.close()
+    return path.read_bytes()
+
+
+def test_snapshot_carries_per_table_versions(server, tmp_path):
+    server.publish('1', _snapshot(tmp_path, ['ann'], ['friday']))
+    server.publish('1', _snapshot(tmp_path, ['ann', 'bob'], ['friday']))
+    r = requests.get(f"{server.base_url}/public/1/snapshot.sqlite", timeout=5)
+    # Only players changed in version 2; events keeps the version that last touched it
+    assert json.loads(r.headers['X-Table-Versions']) == {'players': 2, 'events': 1}
+
+
+def test_unchanged_snapshot_is_not_sent_again(server):
+    server.publish('1', b'v1')
+    url = f"{server.base_url}/public/1/snapshot.sqlite"
+    first = requests.get(url, timeout=5)
+    etag = first.headers['ETag']
+    again = requests.get(url, headers={'If-None-Match': etag}, timeout=5)
+    assert again.status_code == 304 and again.content == b''
+    server.publish('1', b'v2')
+    fresh = requests.get(url, headers={'If-None-Match': etag}, timeout=5)
+    assert fresh.status_code == 200 and fresh.content == b'v2'
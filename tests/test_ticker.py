@@ -0,0 +1,88 @@
+"""tick_phase() placement and TickService subscription bookkeeping."""
+import time
+
+import pytest
+
+from ticker import TickService, _next_due, tick_phase
+
+
+@pytest.mark.parametrize('start, expected', [(100.25, 0.75), (100.5, 0.0), (100.0, 0.5), (100.9, 0.4)])
+def test_tick_phase_is_half_a_second_from_the_start(start, expected):
+    assert tick_phase(start) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('phase, now, expected', [(0.0, 100.3, 101.0), (0.0, 100.0, 101.0),
+                                                   (0.75, 100.3, 100.75), (0.75, 100.75, 101.75)])
+def test_next_due_is_the_next_matching_point_after_now(phase, now, expected):
+    assert _next_due(phase, now) == pytest.approx(expected)
+
+
+@pytest.fixture
+def ticker():
+    t = TickService()
+    yield t
+    for sub in list(t._subs):
+        sub.cancel()
+
+
+def test_subscribe_is_deduplicated_and_cancel_stops_the_clock(ticker):
+    def cb(now):
+        pass
+    sub = ticker.subscribe(cb)
+    assert ticker.subscribe(cb) is sub
+    assert ticker.active and ticker._event is not None
+    sub.cancel()
+    assert not ticker.active and ticker._event is None
+    sub.cancel()  # cancelling twice is harmless
+
+
+def test_resubscribing_moves_the_phase(ticker):
+    def cb(now):
+        pass
+    sub = ticker.subscribe(cb, 0.25)
+    assert ticker.subscribe(cb, 0.75) is sub
+    assert sub.phase == 0.75 and sub.due % 1 == pytest.approx(0.75)
+
+
+def test_early_fire_waits_for_the_boundary(ticker):
+    calls = []
+    sub = ticker.subscribe(calls.append)
+    sub.due = time.time() + 5
+    ticker._fire(0)
+    assert calls == []
+    assert ticker._event is not None
+
+
+def test_fire_calls_subscribers_and_skips_ones_cancelled_this_tick(ticker):
+    calls = []
+    later = []
+
+    def first(now):
+        calls.append(now)
+        sub_b.cancel()
+    sub_a = ticker.subscribe(first)
+    sub_b = ticker.subscribe(later.append)
+    sub_a.due = sub_b.due = time.time() - 0.1
+    ticker._fire(0)
+    assert len(calls) == 1 and later == []
+    # Rescheduled for the next whole second
+    assert ticker._event is not None and sub_a.due > calls[0] and sub_a.due % 1 == 0
+
+
+def test_failing_subscriber_does_not_stop_the_others(ticker):
+    got = []
+
+    def bad(now):
+        raise RuntimeError('boom')
+    for sub in (ticker.subscribe(bad), ticker.subscribe(got.append)):
+        sub.due = time.time() - 0.1
+    ticker._fire(0)
+    assert len(got) == 1
+
+
+def test_only_due_subscribers_fire(ticker):
+    early, late = [], []
+    ticker.subscribe(early.append, 0.25).due = time.time() - 0.1
+    ticker.subscribe(late.append, 0.75).due = time.time() + 0.5
+    ticker._fire(0)
+    assert len(early) == 1 and late == []
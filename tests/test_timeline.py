@@ -0,0 +1,107 @@
+"""PhaseTimeline layout/lookup and DraftTimer pause/resume bookkeeping."""
+import random
+
+import pytest
+
+import timer
+from ticker import TICKER
+from timer import PhaseTimeline
+
+
+def test_phases_and_starts_follow_the_sequence():
+    tl = PhaseTimeline([50, 45], rounds=2, review=60, gap=2)
+    assert tl.phases == [(1, 1, 50), (1, 2, 45), (1, 3, 60), (2, 1, 50), (2, 2, 45), (2, 3, 60)]
+    assert tl.starts == [0, 52, 99, 161, 213, 260]
+    assert tl.total == 322 and len(tl) == 6
+
+
+@pytest.mark.parametrize('elapsed, expected', [
+    (0, (0, 50)),
+    (0.2, (0, 50)),     # partial seconds count as a whole second left
+    (49.5, (0, 1)),
+    (50.5, (0, 0)),     # break after the phase
+    (52, (1, 45)),
+    (321.9, (5, 0)),
+    (322, (6, 0)),      # draft over
+    (10 ** 6, (6, 0)),
+])
+def test_locate(elapsed, expected):
+    tl = PhaseTimeline([50, 45], rounds=2, review=60, gap=2)
+    assert tl.locate(elapsed) == expected
+
+
+def test_locate_agrees_with_a_linear_scan():
+    tl = PhaseTimeline([40, 35, 30, 25], rounds=3, review=60, gap=2)
+    rnd = random.Random(7)
+    for _ in range(500):
+        elapsed = rnd.uniform(0, tl.total - 0.001)
+        idx = max(i for i, s in enumerate(tl.starts) if s <= elapsed)
+        assert tl.locate(elapsed)[0] == idx
+
+
+@pytest.fixture
+def draft_timer(monkeypatch):
+    clock = {'now': 1_000_000.25}
+    monkeypatch.setattr(timer.time, 'time', lambda: clock['now'])
+    # Keep the test's state file away from pod 0 and its sounds silent
+    tw = timer.DraftTimer(pod=timer.MAX_PODS - 1)
+    tw._clear_state()
+    monkeypatch.setattr(tw, 'play_animal_sound', lambda *a: None, raising=False)
+    tw.spinner.text = 'Regular'
+    yield tw, clock
+    tw.reset_all(None)
+    tw._clear_state()
+    for sub in list(TICKER._subs):
+        sub.cancel()
+
+
+def test_pause_resume_does_not_lose_time(draft_timer):
+    tw, clock = draft_timer
+    tw.start_sequence(None)
+    ran = tw._elapsed()
+    rnd = random.Random(3)
+    for _ in range(100):
+        step = rnd.uniform(0.05, 3.0)
+        clock['now'] += step
+        ran += step
+        tw.pause_timer(None)
+        assert tw.paused_elapsed == pytest.approx(ran, abs=1e-6)
+        clock['now'] += rnd.uniform(0.1, 5.0)
+        tw.start_sequence(None)
+        assert tw._elapsed() == pytest.approx(ran, abs=1e-6)
+
+
+@pytest.mark.parametrize('idx', [0, 1, 13])  # Regular: picks 1 and 2, then the pick review
+def test_a_phase_shows_its_full_length_at_its_start(draft_timer, idx):
+    tw, clock = draft_timer
+    assert tw.timeline.phases[idx][2] == 60
+    tw._seek(idx)
+    assert tw.get_remaining() == 60 and tw.time_label.text == '60'
+    clock['now'] += 0.99
+    assert tw.get_remaining() == 60
+    clock['now'] += 0.01
+    assert tw.get_remaining() == 59
+
+
+def test_ticks_fall_between_the_display_boundaries(draft_timer):
+    tw, clock = draft_timer
+    tw.start_sequence(None)
+    # Started at .25 past the second: the display changes at .25, the ticks come at .75
+    assert tw.timer_event.phase == pytest.approx(0.75)
+    assert tw.timer_event.due % 1 == pytest.approx(0.75)
+
+
+def test_paused_position_survives_a_restart(draft_timer):
+    tw, clock = draft_timer
+    tw.start_sequence(None)
+    clock['now'] += 75.3
+    tw.update(0)  # the tick that moves it into the second pick
+    tw.pause_timer(None)
+    assert tw._phase_idx == 1
+    restored = timer.DraftTimer(pod=tw.pod)
+    try:
+        assert restored.paused
+        assert restored.paused_elapsed == pytest.approx(tw.paused_elapsed)
+        assert restored._phase_idx == tw._phase_idx
+    finally:
+        restored._cancel_schedule()
@@ -0,0 +1,126 @@
+"""Shared one-second tick for countdown displays.
+
+All one-second UI timers (event round timer, draft timer) subscribe to the
+single TICKER instead of running their own Clock.schedule_interval(..., 1):
+
+- Each subscriber ticks once per second at its own phase (seconds past each
+  wall-clock second; 0 by default, i.e. just after the boundary), so nothing
+  drifts against the clock and one Clock event serves all of them.
+- A countdown that starts mid-second subscribes with the phase half a second
+  away from its own display boundaries (tick_phase), so frame jitter cannot
+  make it skip or repeat a value and its start time never has to be moved.
+- Subscribers get the current time.time() and compute what to show from
+  their own timestamps; a late or skipped tick (busy frame, app resume)
+  is simply caught up by the next one.
+- The Clock event only exists while someone is subscribed.
+- subscribe() returns a handle with cancel(), like a ClockEvent, and a
+  callback that is already subscribed is not added twice.
+"""
+import math
+import time
+
+from kivy.clock import Clock
+
+# Fire slightly after the due time so int(now) already shows the new second
+_OFFSET = 0.01
+
+
+def tick_phase(start_ts):
+    """Tick phase for a countdown started at start_ts: half a second away from
+    the points where its whole-second display changes."""
+    return (start_ts + 0.5) % 1.0
+
+
+def _next_due(phase, now):
+    # First time after now that sits `phase` seconds past a wall-clock second
+    return math.floor(now - phase) + 1 + phase
+
+
+class Subscription:
+    __slots__ = ('service', 'callback', 'phase', 'due')
+
+    def __init__(self, service, callback, phase):
+        self.service = service
+        self.callback = callback
+        self.phase = phase
+        self.due = 0
+
+    def cancel(self):
+        self.service._remove(self)
+
+
+class TickService:
+    def __init__(self):
+        self._subs = []
+        self._event = None
+
+    def subscribe(self, callback, phase=0.0) -> Subscription:
+        """Call callback(now) once per second, `phase` seconds past each
+        wall-clock second, until cancelled. Subscribing an already subscribed
+        callback returns its handle, moved to the new phase."""
+        phase = float(phase) % 1.0
+        for sub in self._subs:
+            if sub.callback == callback:
+                if sub.phase != phase:
+                    sub.phase = phase
+                    sub.due = _next_due(phase, time.time())
+                    self._schedule()
+                return sub
+        sub = Subscription(self, callback, phase)
+        sub.due = _next_due(phase, time.time())
+        self._subs.append(sub)
+        self._schedule()
+        return sub
+
+    def _remove(self, sub):
+        try:
+            self._subs.remove(sub)
+        except ValueError:
+            pass
+        if not self._subs:
+            self._cancel()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subs)
+
+    def resync(self):
+        """Re-align to the wall clock (after the app was paused)."""
+        self._cancel()
+        if self._subs:
+            # Runs the ticks that were still pending, then schedules the next one
+            self._fire(0)
+
+    def _cancel(self):
+        if self._event is not None:
+            try:
+                self._event.cancel()
+            except Exception:
+                pass
+            self._event = None
+
+    def _schedule(self):
+        self._cancel()
+        if not self._subs:
+            return
+        due = min(sub.due for sub in self._subs)
+        self._event = Clock.schedule_once(self._fire, max(0.0, due - time.time()) + _OFFSET)
+
+    def _fire(self, dt):
+        self._event = None
+        now = time.time()
+        # The Clock may run an event up to a frame early; then nothing is due yet
+        for sub in [sub for sub in self._subs if sub.due <= now]:
+            if sub not in self._subs:
+                continue  # cancelled by an earlier subscriber this tick
+            sub.due = _next_due(sub.phase, now)
+            try:
+                sub.callback(now)
+            except Exception:
+                pass
+        if self._event is None:
+            self._schedule()
+
+
+# Shared app-wide tick
+TICKER = TickService()
@@ -4,16 +4,20 @@ Provides a self-contained DraftTimer Kivy widget with play/pause/reset controls
 and an IconButton that supports PNG and SVG (with graceful fallbacks). The timer
 runs on wall-clock time and is safe to pause/resume without drifting.
 
-Documentation only; logic and visuals unchanged.
+The three boosters (picks plus a pick review each, with a short break after
+every phase) are laid out as one PhaseTimeline, so the current phase at any
+instant is a binary search over the phase offsets and the running state is
+just a start timestamp, persisted so a draft survives the app being killed.
 """
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
-from kivy.clock import Clock
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.spinner import Spinner
-from kivy.core.audio import SoundLoader
 from kivy.core.text import Label as CoreLabel
+import bisect
+import json
+import math
 import random
 import time
 import os
@@ -26,9 +30,14 @@ from kivy.metrics import dp
 from kivy.properties import StringProperty
 from kivy.uix.image import Image
 from kivy.core.window import Window
+from lazy_imports import optional
+from ticker import TICKER, tick_phase
+from sounds import SOUNDS
 
-GardenSvgWidget = None
-GardenSvgInstruction = None
+
+def _svg_support():
+    """(SvgWidget, Svg) from Kivy Garden svg, probed on the first .svg icon; (None, None) if absent."""
+    return optional('kivy.garden.svg', 'SvgWidget'), optional('kivy.garden.svg', 'Svg')
 
 class IconButton(ButtonBehavior, Widget):
     """A lightweight image icon button with SVG and raster support.
@@ -108,6 +117,7 @@ class IconButton(ButtonBehavior, Widget):
         src = self.source or ''
         try:
             if src.lower().endswith('.svg'):
+                GardenSvgWidget, GardenSvgInstruction = _svg_support()
                 if GardenSvgWidget is not None:
                     # Preferred path: dedicated widget for svg
                     self._icon = GardenSvgWidget(filename=src)
@@ -257,6 +267,136 @@ class IconButton(ButtonBehavior, Widget):
             except Exception:
                 self.canvas.add(self._draw_group)
 
+# Seconds between phases (the animal sound plays here), pick review length, boosters per draft
+PHASE_BREAK = 2
+REVIEW_SECONDS = 60
+ROUNDS = 3
+
+
+# Font fitting: (text class, box, size bounds, font) -> fitted font size
+_FIT_CACHE = {}
+_FIT_CACHE_MAX = 512
+
+
+def _is_numeric_text(t: str):
+    t = t.strip()
+    return len(t) > 0 and all(ch.isdigit() for ch in t)
+
+
+def _text_fits(text, size, max_w, max_h, font_name):
+    kw = {'font_name': font_name} if font_name else {}
+    cl = CoreLabel(text=text, font_size=size, **kw)
+    cl.refresh()
+    tw, th = cl.texture.size if cl.texture else (0, 0)
+    return tw <= max_w and th <= max_h
+
+
+def fit_font_size(text, max_w, max_h, max_px, min_px=10.0, font_name=None):
+    """Largest font size (0.5 px steps) at which `text` fits in max_w x max_h.
+
+    Numbers are measured as the same count of '8' (the widest digit, at least
+    two), so all countdown values share one entry per digit count; other text
+    is keyed by itself. Results are cached per box (whole pixels) and font,
+    and a miss is a binary search over the sizes instead of a linear scan.
+    Includes a 1 px safety shrink; returns None if text cannot be measured.
+    """
+    if _is_numeric_text(text):
+        sample = '8' * max(2, len(text.strip()))
+        cls = ('digits', len(sample))
+    else:
+        sample = text
+        cls = ('text', text)
+    max_w, max_h = int(max_w), int(max_h)
+    max_px = max_px if max_px and max_px > 0 else 10.0
+    key = (cls, max_w, max_h, round(max_px, 1), round(min_px, 1), font_name)
+    if key in _FIT_CACHE:
+        return _FIT_CACHE[key]
+    # Candidates max_px - 0.5 * k, k = 0..steps; find the smallest k that fits
+    steps = max(0, int(math.ceil((max_px - min_px) / 0.5)))
+    lo, hi = 0, steps + 1  # hi: nothing above min_px fits
+    try:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _text_fits(sample, max_px - 0.5 * mid, max_w, max_h, font_name):
+                hi = mid
+            else:
+                lo = mid + 1
+    except Exception:
+        return None
+    size = max_px - 0.5 * lo if lo <= steps else min_px
+    # Safety shrink so glyphs never touch the edges due to rounding
+    size = max(min_px, size - 1.0)
+    if len(_FIT_CACHE) >= _FIT_CACHE_MAX:
+        _FIT_CACHE.clear()
+    _FIT_CACHE[key] = size
+    return size
+
+
+# Pods a multi-pod screen can show; pod 0 keeps the original state file name
+MAX_PODS = 4
+
+# Pods currently keeping the screen awake, and the applied state
+_KEEP_AWAKE = {'pods': set(), 'on': None}
+
+
+def pod_state_path(pod=0):
+    name = 'drafttimer.json' if not pod else f'drafttimer-pod{int(pod) + 1}.json'
+    try:
+        from db import _get_persistent_db_path
+        return _get_persistent_db_path(name)
+    except Exception:
+        return os.path.join(os.path.expanduser('~'), '.draft_buddy', name)
+
+
+def saved_pod_count():
+    """Number of pods to show so that every pod with a saved draft is restored."""
+    count = 0
+    for pod in range(MAX_PODS):
+        try:
+            if os.path.exists(pod_state_path(pod)):
+                count = pod + 1
+        except Exception:
+            pass
+    return count
+
+
+class PhaseTimeline:
+    """All phases of a draft laid out on one time axis.
+
+    phases[i] is (round, pick_index, duration) with pick_index 1-based and
+    len(seq) + 1 for the pick review; starts[i] is the offset (seconds since
+    the draft started) at which phase i begins, each phase being followed by
+    a PHASE_BREAK gap.
+    """
+
+    def __init__(self, seq, rounds=ROUNDS, review=REVIEW_SECONDS, gap=PHASE_BREAK):
+        self.gap = gap
+        self.phases = []
+        self.starts = []
+        t = 0
+        for rnd in range(1, rounds + 1):
+            for i, dur in enumerate(list(seq) + [review]):
+                self.phases.append((rnd, i + 1, int(dur)))
+                self.starts.append(t)
+                t += int(dur) + gap
+        self.total = t
+
+    def __len__(self):
+        return len(self.phases)
+
+    def locate(self, elapsed):
+        """Return (index, remaining) for `elapsed` seconds into the draft.
+
+        remaining counts whole seconds left in the phase (0 during the break
+        after it); index == len(self) once the draft is over.
+        """
+        if elapsed >= self.total:
+            return len(self.phases), 0
+        i = max(0, bisect.bisect_right(self.starts, elapsed) - 1)
+        dur = self.phases[i][2]
+        return i, max(0, min(dur, math.ceil(dur - (elapsed - self.starts[i]))))
+
+
 class DraftTimer(BoxLayout):
     """A vertical layout widget implementing a three-round draft timer.
 
@@ -264,9 +404,17 @@ class DraftTimer(BoxLayout):
     supports play/pause/reset, manual next/previous phase navigation, and
     plays short sounds between phases. The widget is self-contained and does
     not manipulate the app's navigation.
+
+    Several instances (one per pod, see DraftTimerScreen) can run at once:
+    each has its own persisted state and sound channels, while the tick
+    (ticker.TICKER) and the loaded sounds (sounds.SOUNDS) are shared.
     """
-    def __init__(self, **kwargs):
+    def __init__(self, pod=0, **kwargs):
         super().__init__(orientation="vertical", **kwargs)
+        self.pod = int(pod)
+        self.title_prefix = ""  # e.g. "Pod 2 · " when several pods are shown
+        self.on_select = None  # called with this widget when touched (pod selection)
+        self._highlight = None
 
         # Mode and round tracking
         self.mode = "Expert"
@@ -278,7 +426,15 @@ class DraftTimer(BoxLayout):
         # Sound suppression window (epoch seconds). When now < suppress_until, no tick/animal sounds.
         self.suppress_until = 0
 
-        # Phase timing (wall-clock based)
+        # Phase timing (wall-clock based). The whole draft is one timeline
+        # (see PhaseTimeline); run_start_ts is when its offset 0 was, so the
+        # current phase is always looked up from the wall clock.
+        self.run_start_ts = 0
+        self.paused_elapsed = None  # timeline position when the user paused
+        self._phase_idx = None  # current timeline phase, None before starting
+        self._finished = False
+        self._ticked = None  # (phase, second) of the last tick sound
+        self._chimed = None  # phase whose end sound already played
         self.phase_start_ts = 0  # epoch seconds when current phase started
         self.phase_duration = 0  # seconds allocated to current phase
 
@@ -300,23 +456,25 @@ class DraftTimer(BoxLayout):
             p for p in audio_files
             if os.path.basename(p).lower() != 'tick.wav' and os.path.isfile(p)
         ]
-        # Cache for loaded Sound objects (path -> Sound)
-        self._sound_cache = {}
-        # Backward-compat list to hold loaded sounds when available (used for stopping any playing sounds)
-        self.animal_sounds = []
-        # Load the tick sound only (small, commonly used near zero)
-        # Defer loading tick sound to avoid initializing audio provider during first screen open
-        self.tick_sound = None
         try:
             self.tick_sound_path = os.path.join("assets", "tick.wav")
         except Exception:
             self.tick_sound_path = "assets/tick.wav"
+        # Sounds are loaded in the background by the shared pool (sounds.py): the tick
+        # right away, and the next phase-end sound a whole phase before it plays
+        self.tick_channel = f'drafttimer.{self.pod}.tick'
+        self.cue_channel = f'drafttimer.{self.pod}.cue'
+        self._next_sound = None
+        SOUNDS.preload((self.tick_sound_path,))
+        self._prefetch_sound()
 
-        # Prepare sequences
+        # Prepare sequences; a draft saved by a previous process picks the mode
         self.sequences = self.get_sequences()
+        saved = self._load_state()
+        if saved:
+            self.mode = saved['mode']
+        self.timeline = PhaseTimeline(self.sequences[self.mode])
         self.timer_event = None
-        # Track a pending transition between phases to avoid duplications
-        self.transition_event = None
         self.time_left = 0
 
         # UI: Top Booster, middle Pick, big Time, then compact mode spinner
@@ -346,41 +504,13 @@ class DraftTimer(BoxLayout):
         except Exception:
             sp = lambda v: v
 
-        def _is_numeric_text(t: str):
-            t = t.strip()
-            return len(t) > 0 and all(ch.isdigit() for ch in t)
-
-        def _fit_label_font(label: Label, max_w: float, max_h: float, max_px: float, min_px: float = 10.0, measure_text: str = None):
-            # Iteratively reduce font size until the texture of measure_text (or label.text) fits within max_w and max_h
-            size = max_px if max_px and max_px > 0 else 10.0
-            fitted = False
-            # Use CoreLabel to measure text without altering the visible widget text and avoid flicker
-            text_to_measure = measure_text if (measure_text is not None and len(measure_text) > 0) else label.text
-            for _ in range(500):  # cap iterations with fine steps
-                try:
-                    cl = CoreLabel(text=text_to_measure, font_size=size)
-                    cl.refresh()
-                    tw, th = cl.texture.size if cl.texture else (0, 0)
-                    if tw <= max_w and th <= max_h:
-                        fitted = True
-                        break
-                except Exception:
-                    break
-                size -= 0.5  # finer decrement to avoid slight overflow
-                if size <= min_px:
-                    size = min_px
-                    fitted = True
-                    break
-            # Apply a safety shrink to ensure we don't touch the edges due to rounding
-            try:
-                if fitted:
-                    safe_size = max(min_px, size - 1.0)
-                    label.font_size = safe_size
-            except Exception:
-                pass
+        def _fit_label_font(label: Label, max_w: float, max_h: float, max_px: float, min_px: float = 10.0):
+            # Cached per (text class, box, font): a countdown tick is a dict lookup
+            size = fit_font_size(label.text, max_w, max_h, max_px, min_px, getattr(label, 'font_name', None))
+            if size is not None and label.font_size != size:
+                label.font_size = size
 
-        def _refit_all(*_):
-            # Available width is this widget width minus side margins and a tiny safety pad
+        def _time_box():
             try:
                 margin = dp(28)
                 safe_pad_w = dp(5)
@@ -390,35 +520,40 @@ class DraftTimer(BoxLayout):
                 safe_pad_w = 5
                 safe_pad_h = 4
             max_w = max(0, self.width - 2 * margin - 2 * safe_pad_w)
-            # Booster and Pick labels: fit within their own heights and available width
-            for lbl in (self.booster_label, self.pick_label):
-                try:
-                    max_h = max(0, lbl.height * 0.90 - safe_pad_h)
-                    # Start from a reasonable upper bound (in px)
-                    max_px = max(12.0, min(sp(64), max_h))
-                    _fit_label_font(lbl, max_w, max_h, max_px, min_px=sp(10))
-                except Exception:
-                    pass
+            return max_w, safe_pad_h
+
+        def _fit_time(*_):
             # Time label: if numeric, maximize; else fit like text
             try:
-                max_w_time = max(0, self.width - 2 * margin - 2 * safe_pad_w)
+                max_w_time, safe_pad_h = _time_box()
                 max_h_time = max(0, self.time_label.height * 0.90 - safe_pad_h)
                 if _is_numeric_text(self.time_label.text):
                     # For numbers, allow a larger starting size (nearly fill height)
                     max_px = max(24.0, max_h_time)
-                    # Measure against widest two-digit string to avoid overflow on glyph changes
-                    _fit_label_font(self.time_label, max_w_time, max_h_time, max_px, min_px=sp(12), measure_text='88')
                 else:
                     max_px = max(24.0, min(sp(160), max_h_time))
-                    _fit_label_font(self.time_label, max_w_time, max_h_time, max_px, min_px=sp(12))
+                _fit_label_font(self.time_label, max_w_time, max_h_time, max_px, min_px=sp(12))
             except Exception:
                 pass
 
+        def _refit_all(*_):
+            # Available width is this widget width minus side margins and a tiny safety pad
+            max_w, safe_pad_h = _time_box()
+            # Booster and Pick labels: fit within their own heights and available width
+            for lbl in (self.booster_label, self.pick_label):
+                try:
+                    max_h = max(0, lbl.height * 0.90 - safe_pad_h)
+                    # Start from a reasonable upper bound (in px)
+                    max_px = max(12.0, min(sp(64), max_h))
+                    _fit_label_font(lbl, max_w, max_h, max_px, min_px=sp(10))
+                except Exception:
+                    pass
+            _fit_time()
+
         # Expose refit so other methods can call it without rebinding
         self._refit_all = _refit_all
-        # Bind refit on size changes only (avoid per-second refit on numeric text updates)
         self.bind(size=_refit_all)
-        self.time_label.bind(size=_refit_all)
+        self.time_label.bind(size=_fit_time, text=_fit_time)
         # Booster and Pick labels should also trigger refit on their changes
         self.booster_label.bind(size=_refit_all, text=_refit_all)
         self.pick_label.bind(size=_refit_all, text=_refit_all)
@@ -428,7 +563,7 @@ class DraftTimer(BoxLayout):
 
         # Mode spinner (kept compact and below the time)
         self.spinner = Spinner(
-            text="Expert",
+            text=self.mode,
             values=("Expert", "Regular", "Beginner", "Test"),
             size_hint=(1, None)
         )
@@ -446,10 +581,13 @@ class DraftTimer(BoxLayout):
         except Exception:
             pass
         # Controls moved to kv: DraftTimerScreen now provides Play/Pause/Reset buttons
+        if saved:
+            self._restore_state(saved)
 
     def set_mode(self, spinner, text):
         self.mode = text
         self.sequences = self.get_sequences()
+        self.timeline = PhaseTimeline(self.sequences[self.mode])
         self.reset_all(None)
 
     def get_sequences(self):
@@ -468,110 +606,81 @@ class DraftTimer(BoxLayout):
         # Start or resume sequence
         if self.timer_event:
             return
-        # Ensure spinner reflects non-waiting state when resuming
-        try:
-            self._update_spinner_state()
-        except Exception:
-            pass
-        # Ensure device stays awake while an active timer is running
-        try:
-            self._set_keep_awake(True)
-        except Exception:
-            pass
-        if self.current_round > 0 and self.paused and self.phase_duration > 0:
-            # Resume current phase from the exact paused remaining value
-            remaining = self.paused_remaining if self.paused_remaining is not None else self.get_remaining()
+        if self._phase_idx is not None and self.paused:
+            # Resume from the exact paused position on the timeline
+            elapsed = self.paused_elapsed if self.paused_elapsed is not None else 0
             self.paused = False
+            self.paused_elapsed = None
             self.paused_remaining = None
-            # Re-anchor start time so remaining stays the same
-            self.phase_start_ts = time.time() - (self.phase_duration - int(remaining))
-            # Refresh headers and current remaining
-            try:
-                self._update_headers()
-                self.time_label.text = str(int(remaining))
-            except Exception:
-                pass
-            self.timer_event = Clock.schedule_interval(self.update, 1)
-            self.update(0)
+            self.run_start_ts = time.time() - elapsed
+            self._run()
             return
         # Fresh start
-        self.current_round = 1
-        self.pick_index = 0
+        self._seek(0)
+
+    def start_next_timer(self, dt=None):
+        # Start the phase after the current one (the first one before starting)
+        self._seek(0 if self._phase_idx is None else self._phase_idx + 1)
+
+    def _seek(self, idx, suppress=0.0):
+        """Start timeline phase `idx` now (constant work: one offset lookup)."""
+        self._cancel_schedule()
+        idx = max(0, min(int(idx), len(self.timeline) - 1))
+        self.run_start_ts = time.time() - self.timeline.starts[idx]
+        self._finished = False
+        self._sync_phase(idx)
         self.paused = False
+        self.paused_elapsed = None
         self.paused_remaining = None
-        self.start_next_timer()
+        self._ticked = None
+        self._chimed = None
+        if suppress:
+            self.suppress_until = time.time() + suppress
+        self._run()
 
-    def start_next_timer(self, dt=None):
-        # Ensure no stray schedules/transitions from previous phase
-        try:
-            self._cancel_schedule()
-        except Exception:
-            pass
-        # Ensure spinner dimmed while a timer phase is active
+    def _run(self):
+        # Ensure spinner dimmed and device awake while the timeline runs
         try:
             self._update_spinner_state()
         except Exception:
             pass
-        # Make sure the screen does not sleep during active timer
         try:
             self._set_keep_awake(True)
         except Exception:
             pass
-        # Clear any transition guard as we are actively in a phase now
+        self._subscribe()
+        self.update(0)
+        self._save_state()
+
+    def _subscribe(self):
+        # Tick between this timeline's second boundaries, wherever in the second it started
+        self.timer_event = TICKER.subscribe(self.update, tick_phase(self.run_start_ts))
+
+    def _elapsed(self, now=None):
+        if self.paused and self.paused_elapsed is not None:
+            return self.paused_elapsed
+        return (time.time() if now is None else now) - self.run_start_ts
+
+    def _sync_phase(self, idx):
+        # Mirror the timeline position into the per-phase fields used by headers and controls
+        self.phase_start_ts = self.run_start_ts + self.timeline.starts[idx]
+        if idx == self._phase_idx:
+            return
+        self._phase_idx = idx
+        self.current_round, self.pick_index, self.phase_duration = self.timeline.phases[idx]
+        self._update_headers()
         try:
-            self.transition_event = None
+            self._update_spinner_state()
         except Exception:
             pass
-        seq = self.sequences[self.mode]
-        if self.pick_index < len(seq):
-            # Pick timer
-            self.phase_duration = int(seq[self.pick_index])
-            self.phase_start_ts = time.time()
-            self.pick_index += 1
-            # Update headers and time display
-            self._update_headers()
-            self.time_label.text = str(self.phase_duration)
-            self.timer_event = Clock.schedule_interval(self.update, 1)
-            self.update(0)
-        elif self.pick_index == len(seq):
-            # 1-minute pick review
-            self.phase_duration = 60
-            self.phase_start_ts = time.time()
-            self.pick_index += 1
-            self._update_headers()
-            self.time_label.text = str(self.phase_duration)
-            self.timer_event = Clock.schedule_interval(self.update, 1)
-            self.update(0)
-        else:
-            # Repeat sequence if rounds remain
-            if self.current_round < 3:
-                self.current_round += 1
-                self.pick_index = 0
-                self.start_next_timer()
-            else:
-                # Draft finished across all rounds
-                try:
-                    self.pick_label.text = "Draft Finished!"
-                except Exception:
-                    pass
-                try:
-                    self.time_label.text = "0"
-                except Exception:
-                    pass
-                # Allow the device to sleep again
-                try:
-                    self._set_keep_awake(False)
-                except Exception:
-                    pass
 
     def get_remaining(self):
         # If user manually paused, freeze the remaining time regardless of wall-clock
         if self.paused and self.paused_remaining is not None:
             return int(self.paused_remaining)
-        if self.phase_duration <= 0 or self.phase_start_ts <= 0:
+        if self._phase_idx is None or self.run_start_ts <= 0:
             return 0
-        remaining = int(self.phase_duration - (time.time() - self.phase_start_ts))
-        return remaining
+        return self.timeline.locate(self._elapsed())[1]
 
     def _phase_title(self):
         seq_len = len(self.sequences[self.mode])
@@ -601,7 +710,7 @@ class DraftTimer(BoxLayout):
         """Update Booster X and Pick Y/Pick Review labels."""
         try:
             booster = self._current_booster_iter()
-            self.booster_label.text = f"Booster {booster}"
+            self.booster_label.text = f"{self.title_prefix}Booster {booster}"
         except Exception:
             pass
         try:
@@ -617,13 +726,6 @@ class DraftTimer(BoxLayout):
             except Exception:
                 pass
             self.timer_event = None
-        # Also cancel any pending transition to the next phase
-        if getattr(self, 'transition_event', None):
-            try:
-                self.transition_event.cancel()
-            except Exception:
-                pass
-            self.transition_event = None
 
     def _update_spinner_state(self):
         try:
@@ -638,232 +740,113 @@ class DraftTimer(BoxLayout):
             pass
 
     def on_app_resume(self):
-        # If not paused and a phase was running, reschedule updates
-        if self.current_round > 0 and not self.paused and self.phase_duration > 0 and self.timer_event is None:
-            self.timer_event = Clock.schedule_interval(self.update, 1)
+        # If not paused and the draft is running, reschedule updates; the
+        # timeline lookup lands on whatever phase the wall clock is in now
+        if self._phase_idx is not None and not self.paused and not self._finished and self.timer_event is None:
+            self._subscribe()
             self.update(0)
 
-    def update(self, dt):
-        remaining = self.get_remaining()
-        # Tick for last 3 seconds (unless suppressed)
+    def update(self, dt=None):
+        if self._phase_idx is None or self.paused:
+            return
         now = time.time()
-        if remaining in (1, 2, 3) and now >= self.suppress_until:
-            # Lazy-load tick sound at first use to avoid audio provider init during first screen open
-            try:
-                if self.tick_sound is None:
-                    try:
-                        self.tick_sound = SoundLoader.load(getattr(self, 'tick_sound_path', 'assets/tick.wav'))
-                    except Exception:
-                        self.tick_sound = None
-                if self.tick_sound is not None:
-                    self.tick_sound.play()
-            except Exception:
-                pass
+        elapsed = self._elapsed(now)
+        idx, remaining = self.timeline.locate(elapsed)
+        if idx >= len(self.timeline):
+            self._finish()
+            return
+        self._sync_phase(idx)
+        quiet = now < self.suppress_until
         if remaining > 0:
-            # Update big time and keep headers as-is
+            # Tick for last 3 seconds (unless suppressed), once per second
+            if remaining in (1, 2, 3) and not quiet and self._ticked != (idx, remaining):
+                self._ticked = (idx, remaining)
+                SOUNDS.play(self.tick_sound_path, channel=self.tick_channel)
             try:
                 self.time_label.text = str(remaining)
             except Exception:
                 pass
             return
-        # Phase complete
-        # Cancel active interval but don't clear any existing transition that might have been scheduled
-        if self.timer_event:
-            try:
-                self.timer_event.cancel()
-            except Exception:
-                pass
-            self.timer_event = None
-        # Only schedule transition and play sound once
-        if getattr(self, 'transition_event', None) is None:
-            # Only play sound if not within suppression window
-            if time.time() >= self.suppress_until:
+        # Break after the phase: the next phase starts by itself on the timeline
+        try:
+            self.time_label.text = "0"
+        except Exception:
+            pass
+        # Play the sound once per phase end (not for a break reached by seeking or a long resume)
+        if self._chimed != idx:
+            self._chimed = idx
+            phase_end = self.timeline.starts[idx] + self.phase_duration
+            if not quiet and elapsed - phase_end < self.timeline.gap:
                 self.play_animal_sound()
-            try:
-                self.transition_event = Clock.schedule_once(self.start_next_timer, 2)  # 2-second break
-            except Exception:
-                # Fallback: call directly
-                self.start_next_timer()
 
-    def play_animal_sound(self):
-        # If we have neither cached sounds nor paths, nothing to play
-        if not getattr(self, 'animal_sound_paths', None) and not getattr(self, '_sound_cache', None):
-            return
-        # Stop any currently playing animal sounds to avoid overlap
+    def _finish(self):
+        # Draft finished across all rounds
+        self._cancel_schedule()
+        self._finished = True
+        self._sync_phase(len(self.timeline) - 1)
         try:
-            cache_vals = list(getattr(self, '_sound_cache', {}).values())
-            for s in cache_vals:
-                try:
-                    if s is not None and getattr(s, 'status', None) == 'play':
-                        s.stop()
-                except Exception:
-                    try:
-                        s.stop()
-                    except Exception:
-                        pass
+            self.pick_label.text = "Draft Finished!"
         except Exception:
             pass
-        # Small safety to ensure tick sound doesn't overlap right at 0
         try:
-            if self.tick_sound is not None:
-                self.tick_sound.stop()
+            self.time_label.text = "0"
         except Exception:
             pass
-        # Choose a random path and lazily load the sound if needed
-        try:
-            paths = getattr(self, 'animal_sound_paths', [])
-            if not paths:
-                return
-            path = random.choice(paths)
-            sound = None
-            if path in self._sound_cache:
-                sound = self._sound_cache.get(path)
-            else:
-                try:
-                    sound = SoundLoader.load(path)
-                except Exception:
-                    sound = None
-                if sound is not None:
-                    self._sound_cache[path] = sound
-                    # Maintain backward-compat list used elsewhere in code (if any)
-                    try:
-                        self.animal_sounds.append(sound)
-                    except Exception:
-                        pass
-            if sound:
-                sound.play()
-        except Exception:
-            # As a fallback (shouldn't normally hit), try any preloaded sounds list
-            try:
-                if self.animal_sounds:
-                    s = random.choice(self.animal_sounds)
-                    if s:
-                        s.play()
-            except Exception:
-                pass
-
-    # ---- Manual navigation helpers (prev/next) ----
-    def _current_phase_info(self):
-        """Return a tuple (kind, index) where kind is 'pick', 'review', or 'none'.
-        For 'pick', index is zero-based within the sequence. For 'review', index is None.
-        """
+        # Allow the device to sleep again
         try:
-            if self.current_round <= 0 or self.pick_index <= 0:
-                return ('none', None)
-            seq_len = len(self.sequences[self.mode])
-            if 1 <= self.pick_index <= seq_len:
-                return ('pick', self.pick_index - 1)
-            if self.pick_index == seq_len + 1:
-                return ('review', None)
-            return ('none', None)
+            self._set_keep_awake(False)
         except Exception:
-            return ('none', None)
+            pass
+        self._clear_state()
+
+    def _prefetch_sound(self):
+        # Pick the sound for the next phase end and load it ahead of time
+        paths = getattr(self, 'animal_sound_paths', None)
+        if not paths:
+            self._next_sound = None
+            return
+        self._next_sound = random.choice(paths)
+        SOUNDS.preload((self._next_sound,))
+
+    def play_animal_sound(self):
+        paths = getattr(self, 'animal_sound_paths', None)
+        if not paths:
+            return
+        # Prefer the prefetched sound; if it is still loading, any loaded one will do
+        path = self._next_sound
+        if path is None or not SOUNDS.loaded(path):
+            ready = [p for p in paths if SOUNDS.loaded(p)]
+            path = random.choice(ready) if ready else (path or random.choice(paths))
+        # Small safety to ensure tick sound doesn't overlap right at 0;
+        # the cue channel stops the previous animal sound
+        SOUNDS.stop(self.tick_channel)
+        SOUNDS.play(path, channel=self.cue_channel)
+        self._prefetch_sound()
 
+    # ---- Manual navigation helpers (prev/next) ----
     def has_prev_phase(self):
-        kind, idx = self._current_phase_info()
-        if kind == 'pick':
-            if idx > 0:
-                return True
-            # idx == 0 -> previous round's review if exists
-            return self.current_round > 1
-        if kind == 'review':
-            return True  # previous is last pick of this round
-        return False
+        return self._phase_idx is not None and self._phase_idx > 0
 
     def has_next_phase(self):
-        if self.current_round <= 0:
-            return False
-        seq_len = len(self.sequences[self.mode])
-        kind, idx = self._current_phase_info()
-        if kind == 'pick':
-            # next pick or review always exists within a round
-            return True
-        if kind == 'review':
-            # next is next round if available
-            return self.current_round < 3
-        return False
-
-    def _start_phase_by_upcoming_index(self, up_idx: int):
-        """Start a phase immediately given its 'upcoming index'.
-        up_idx in [0..len(seq)-1] -> picks; up_idx == len(seq) -> review.
-        """
-        try:
-            self._cancel_schedule()
-        except Exception:
-            pass
-        self.paused = False
-        self.paused_remaining = None
-        # Keep device awake while a phase is running
-        try:
-            self._set_keep_awake(True)
-        except Exception:
-            pass
-        seq = self.sequences[self.mode]
-        if up_idx < len(seq):
-            self.phase_duration = int(seq[up_idx])
-        else:
-            self.phase_duration = 60  # review
-        self.phase_start_ts = time.time()
-        # As in start_next_timer, set pick_index to reflect started phase (human 1-based picks, review = len+1)
-        self.pick_index = min(up_idx + 1, len(seq) + 1)
-        # Update headers and time
-        try:
-            self._update_headers()
-            self.time_label.text = str(self.phase_duration)
-        except Exception:
-            pass
-        # Suppress immediate sounds caused by manual navigation
-        try:
-            self.suppress_until = time.time() + 1.0
-        except Exception:
-            self.suppress_until = 0
-        # Schedule ticking
-        self.timer_event = Clock.schedule_interval(self.update, 1)
-        self.update(0)
+        return self._phase_idx is not None and self._phase_idx < len(self.timeline) - 1
 
     def go_next_phase(self):
         # Handle starting if not started yet
-        if self.current_round <= 0:
-            self.current_round = 1
-            self._start_phase_by_upcoming_index(0)
-            return
-        kind, idx = self._current_phase_info()
-        seq_len = len(self.sequences[self.mode])
-        if kind == 'pick':
-            if idx + 1 < seq_len:
-                self._start_phase_by_upcoming_index(idx + 1)
-            else:
-                # move to review
-                self._start_phase_by_upcoming_index(seq_len)
-        elif kind == 'review':
-            if self.current_round < 3:
-                self.current_round += 1
-                self._start_phase_by_upcoming_index(0)
-            else:
-                # Already at final review; do nothing
-                return
+        if self._phase_idx is None:
+            self._seek(0, suppress=1.0)
+        elif self.has_next_phase():
+            self._seek(self._phase_idx + 1, suppress=1.0)
 
     def go_prev_phase(self):
-        if self.current_round <= 0:
-            return
-        kind, idx = self._current_phase_info()
-        seq_len = len(self.sequences[self.mode])
-        if kind == 'pick':
-            if idx > 0:
-                self._start_phase_by_upcoming_index(idx - 1)
-            else:
-                # First pick of round -> go to previous round's review if any
-                if self.current_round > 1:
-                    self.current_round -= 1
-                    self._start_phase_by_upcoming_index(seq_len)
-        elif kind == 'review':
-            # Go to last pick of this round
-            if seq_len > 0:
-                self._start_phase_by_upcoming_index(seq_len - 1)
+        if self.has_prev_phase():
+            self._seek(self._phase_idx - 1, suppress=1.0)
 
     def pause_timer(self, instance):
         # User-initiated pause: freeze remaining time exactly as seen
+        if self._phase_idx is None or self._finished:
+            return
         self.paused_remaining = self.get_remaining()
+        self.paused_elapsed = self._elapsed()
         self.paused = True
         self._cancel_schedule()
         try:
@@ -875,6 +858,7 @@ class DraftTimer(BoxLayout):
             self._set_keep_awake(False)
         except Exception:
             pass
+        self._save_state()
 
     def reset_all(self, instance):
         # Full reset of the timer state
@@ -891,11 +875,17 @@ class DraftTimer(BoxLayout):
         self.current_round = 0
         self.paused = False
         self.paused_remaining = None
+        self.paused_elapsed = None
+        self.run_start_ts = 0
         self.phase_start_ts = 0
         self.phase_duration = 0
+        self._phase_idx = None
+        self._finished = False
+        self._ticked = None
+        self._chimed = None
         # Reset headers
         try:
-            self.booster_label.text = "Booster 1"
+            self.booster_label.text = f"{self.title_prefix}Booster 1"
             self.pick_label.text = ""
         except Exception:
             pass
@@ -909,19 +899,138 @@ class DraftTimer(BoxLayout):
             self._set_keep_awake(False)
         except Exception:
             pass
+        self._clear_state()
+
+    # ---- Persisted state (survives process death) ----
+    def _state_path(self):
+        return pod_state_path(self.pod)
+
+    def _save_state(self):
+        # The whole position is (mode, run_start_ts, paused_elapsed); written on user actions only
+        if self._phase_idx is None:
+            return
+        path = self._state_path()
+        try:
+            d = os.path.dirname(path)
+            if d and not os.path.exists(d):
+                os.makedirs(d, exist_ok=True)
+            tmp = path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'mode': self.mode,
+                    'run_start_ts': self.run_start_ts,
+                    'paused_elapsed': self.paused_elapsed if self.paused else None,
+                }, f)
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def _clear_state(self):
+        try:
+            path = self._state_path()
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
+
+    def _load_state(self):
+        try:
+            with open(self._state_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('mode') not in self.sequences or float(data.get('run_start_ts') or 0) <= 0:
+                return None
+            return data
+        except Exception:
+            return None
+
+    def _restore_state(self, data):
+        """Continue a draft saved by a previous process (mode already applied)."""
+        self.run_start_ts = float(data['run_start_ts'])
+        paused_elapsed = data.get('paused_elapsed')
+        elapsed = float(paused_elapsed) if paused_elapsed is not None else time.time() - self.run_start_ts
+        idx, remaining = self.timeline.locate(elapsed)
+        if idx >= len(self.timeline):
+            # Finished while the app was gone; start from a clean state
+            self._clear_state()
+            return
+        # Phases that ended while the app was gone stay silent
+        self._chimed = idx if remaining <= 0 else None
+        self._sync_phase(idx)
+        if paused_elapsed is not None:
+            self.paused = True
+            self.paused_elapsed = float(paused_elapsed)
+            self.paused_remaining = remaining
+            try:
+                self.time_label.text = str(remaining)
+                self._update_spinner_state()
+            except Exception:
+                pass
+        else:
+            self._run()
+
+    # ---- Pod selection ----
+    def set_title_prefix(self, prefix):
+        self.title_prefix = prefix
+        if self.current_round > 0:
+            self._update_headers()
+        else:
+            try:
+                self.booster_label.text = f"{self.title_prefix}Booster 1"
+            except Exception:
+                pass
+
+    def set_highlight(self, on):
+        """Outline this pod (the one the screen controls act on)."""
+        from kivy.graphics import InstructionGroup, Color, Line
+        if bool(on) == (self._highlight is not None):
+            return
+        if not on:
+            self.canvas.after.remove(self._highlight)
+            self._highlight = None
+            self.unbind(pos=self._update_highlight, size=self._update_highlight)
+            return
+        g = InstructionGroup()
+        g.add(Color(0.25, 0.6, 1.0, 1))
+        self._highlight_line = Line(width=1.5)
+        g.add(self._highlight_line)
+        self._highlight = g
+        self.canvas.after.add(g)
+        self.bind(pos=self._update_highlight, size=self._update_highlight)
+        self._update_highlight()
+
+    def _update_highlight(self, *_):
+        try:
+            self._highlight_line.rounded_rectangle = (self.x + 1, self.y + 1, self.width - 2, self.height - 2, dp(8))
+        except Exception:
+            pass
+
+    def on_touch_down(self, touch):
+        if self.on_select is not None and self.collide_point(*touch.pos):
+            try:
+                self.on_select(self)
+            except Exception:
+                pass
+        return super().on_touch_down(touch)
 
     # ---- Keep screen awake handling ----
     def _set_keep_awake(self, enable: bool):
         """Prevent device from sleeping while the draft timer is active.
 
+        Shared by all pods: the screen stays on while any of them is running.
+
         Cross-platform best effort:
         - On Kivy desktop/mobile: toggle Window.allow_screensaver.
         - On Android: additionally set FLAG_KEEP_SCREEN_ON via Android APIs if available.
         """
+        if enable:
+            _KEEP_AWAKE['pods'].add(id(self))
+        else:
+            _KEEP_AWAKE['pods'].discard(id(self))
+        enable = bool(_KEEP_AWAKE['pods'])
         # Avoid redundant toggles
-        if getattr(self, '_keep_awake_enabled', None) == bool(enable):
+        if _KEEP_AWAKE['on'] == enable:
             return
-        self._keep_awake_enabled = bool(enable)
+        _KEEP_AWAKE['on'] = enable
         # Kivy Window toggle (works on most platforms including Android)
         try:
             # When allow_screensaver is False, the screen should not dim/lock
@@ -0,0 +1,144 @@
+"""Cold-start profiler: runs the app N times with the startup trace enabled.
+
+Each run starts `python main.py` in a fresh process with
+DRAFTBUDDY_STARTUP_TRACE (see startup_trace.py) and DRAFTBUDDY_STARTUP_EXIT=1,
+so the app writes its JSON trace at the first frame and quits. The runs are
+aggregated (median per phase) and can be compared with a previous report to
+catch startup regressions: slower phases, extra SQL statements at startup,
+or modules that became eager imports.
+
+The app needs a window. Without a DISPLAY on Linux the runs are wrapped in
+`xvfb-run -a` when it is available (CI); otherwise use a desktop session.
+
+Usage:
+    python tools/startup_profile.py --runs 5 --json startup.json
+    python tools/startup_profile.py --runs 5 --baseline startup.json   # exit 1 on regression
+    python tools/startup_profile.py --data-dir ~/.draft_buddy          # profile against a real DB
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _command():
+    cmd = [sys.executable, os.path.join(_REPO, 'main.py')]
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY') and shutil.which('xvfb-run'):
+        cmd = ['xvfb-run', '-a'] + cmd
+    return cmd
+
+
+def run_once(data_dir, trace_path, timeout=120):
+    env = dict(os.environ)
+    env.update({
+        'DRAFTBUDDY_STARTUP_TRACE': trace_path,
+        'DRAFTBUDDY_STARTUP_EXIT': '1',
+        'DRAFTBUDDY_DATA_DIR': data_dir,
+        'KIVY_NO_ARGS': '1',
+        'KIVY_NO_CONSOLELOG': '1',
+    })
+    if os.path.exists(trace_path):
+        os.remove(trace_path)
+    # ui.kv is loaded relative to the working directory
+    proc = subprocess.run(_command(), cwd=_REPO, env=env, timeout=timeout,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if not os.path.exists(trace_path):
+        tail = proc.stdout.decode('utf-8', 'replace').strip().splitlines()[-5:]
+        raise RuntimeError(f"no trace written (exit {proc.returncode}): " + ' | '.join(tail))
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def aggregate(traces):
+    durations = {}
+    for t in traces:
+        for p in t['phases']:
+            durations.setdefault(p['name'], []).append(p['dur_ms'])
+    eager = {}
+    for t in traces:
+        for mod, loaded in t.get('eager_imports', {}).items():
+            eager[mod] = eager.get(mod, False) or bool(loaded)
+    frames = [t['first_frame_ms'] for t in traces if t.get('first_frame_ms') is not None]
+    return {
+        'runs': len(traces),
+        'first_frame_ms': round(statistics.median(frames), 2) if frames else None,
+        'phases_ms': {k: round(statistics.median(v), 2) for k, v in durations.items()},
+        'sql_statements': max(t.get('sql_statements', 0) for t in traces),
+        'modules': max(t.get('modules', 0) for t in traces),
+        'eager_imports': eager,
+    }
+
+
+def compare(report, baseline, tolerance=0.15, min_ms=20.0):
+    """Regressions of `report` against `baseline`, as human readable lines."""
+    out = []
+
+    def slower(name, cur, base):
+        if cur is not None and base is not None and cur > base * (1 + tolerance) and cur - base >= min_ms:
+            out.append(f"{name}: {base:.1f} -> {cur:.1f} ms")
+    slower('first_frame', report['first_frame_ms'], baseline.get('first_frame_ms'))
+    for name, cur in report['phases_ms'].items():
+        base = baseline.get('phases_ms', {}).get(name)
+        if base is None:
+            if name.startswith('screen.') and not name.endswith('first_refresh') and cur >= min_ms:
+                out.append(f"{name}: new at startup ({cur:.1f} ms)")
+            continue
+        slower(name, cur, base)
+    if report['sql_statements'] > baseline.get('sql_statements', report['sql_statements']):
+        out.append(f"sql statements: {baseline['sql_statements']} -> {report['sql_statements']}")
+    for mod, loaded in report['eager_imports'].items():
+        if loaded and not baseline.get('eager_imports', {}).get(mod, False):
+            out.append(f"{mod}: now imported at startup")
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Cold-start profiler (JSON startup trace per run)')
+    ap.add_argument('--runs', type=int, default=5)
+    ap.add_argument('--data-dir', help='DB/auth directory to start with (copied; default: a fresh one)')
+    ap.add_argument('--json', dest='json_path', help='write the aggregated report here')
+    ap.add_argument('--baseline', help='previous report to compare against; exit 1 on regression')
+    ap.add_argument('--tolerance', type=float, default=0.15, help='allowed relative slowdown per phase')
+    args = ap.parse_args(argv)
+
+    work = tempfile.mkdtemp(prefix='dbstartup_')
+    try:
+        data_dir = os.path.join(work, 'data')
+        if args.data_dir:
+            shutil.copytree(os.path.expanduser(args.data_dir), data_dir)
+        else:
+            os.makedirs(data_dir)
+        trace_path = os.path.join(work, 'trace.json')
+        # Unmeasured first run: creates/migrates the DB so every measured run is comparable
+        run_once(data_dir, trace_path)
+        traces = [run_once(data_dir, trace_path) for _ in range(max(1, args.runs))]
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    report = aggregate(traces)
+    print(f"runs={report['runs']} first frame={report['first_frame_ms']} ms "
+          f"sql={report['sql_statements']} modules={report['modules']}")
+    for name, ms in sorted(report['phases_ms'].items(), key=lambda kv: -kv[1]):
+        print(f"  {ms:9.1f} ms  {name}")
+    eager = [m for m, loaded in report['eager_imports'].items() if loaded]
+    print(f"eager imports: {', '.join(eager) or '-'}")
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Offline sync load test against the local stand-in server.
+
+Starts tools/sync_server.py in-process and drives the app's real sync code
+paths (SettingsScreen.do_upload / do_download from main.py) headlessly:
+one manager uploads a fresh snapshot each round, then N simulated guests
+(1-200) download it in parallel worker processes. Each guest keeps its own
+data directory (DRAFTBUDDY_DATA_DIR), auth.json and SQLite connection, just
+like a separate device.
+
+Reported per run:
+- ok/failed syncs and latency p50/p95/max (wall clock around do_download)
+- bytes transferred (total and per guest), from the server's /metrics
+- server CPU time (total and per guest), from the server's /metrics
+
+Usage:
+    python tools/sync_load_test.py --guests 50 --rounds 3
+    python tools/sync_load_test.py --guests 200 --procs 4 --json report.json
+
+No window is opened: workers import main with KIVY_WINDOW=none and only
+instantiate the App object, so screens are never built.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO not in sys.path:
+    sys.path.insert(0, _REPO)
+
+from tools.sync_server import SyncServer  # noqa: E402
+
+# Worker-process state (set by _init_worker)
+_W = {}
+
+
+def _init_worker(base_url, root):
+    os.environ.update({
+        'KIVY_NO_ARGS': '1',
+        'KIVY_WINDOW': 'none',
+        'KIVY_NO_CONSOLELOG': '1',
+        'KIVY_NO_FILELOG': '1',
+        'DRAFTBUDDY_SERVER_URL': base_url,
+        # Keep the import-time DB out of the repo folder
+        'DRAFTBUDDY_DATA_DIR': os.path.join(root, f'worker-{os.getpid()}'),
+    })
+    if _REPO not in sys.path:
+        sys.path.insert(0, _REPO)
+    import db
+    import main
+    # Instantiating the App registers it as the running app; build() is never called
+    app = main.EventsApp()
+    # Drive the SettingsScreen methods without constructing the Screen widget
+    funcs = {k: v for k, v in vars(main.SettingsScreen).items() if callable(v) and not isinstance(v, type)}
+    funcs['last_status'] = ''
+    driver_cls = type('SettingsDriver', (object,), funcs)
+    _W.update(db=db, main=main, app=app, driver=driver_cls(), base_url=base_url, root=root)
+
+
+def _use_device(name, username):
+    """Point db/auth at this device's data dir, logging in on first use."""
+    import requests
+    db, main = _W['db'], _W['main']
+    data_dir = os.path.join(_W['root'], name)
+    os.makedirs(data_dir, exist_ok=True)
+    os.environ['DRAFTBUDDY_DATA_DIR'] = data_dir
+    db.reload_db()
+    # auth.json lives next to the DB: drop the cached session of the previous device
+    main.SESSION.invalidate()
+    if not main.load_auth():
+        r = requests.post(f"{_W['base_url']}/auth/login",
+                          json={'username': username, 'password': 'x', 'remember': True, 'playgroup': 'loadtest'},
+                          timeout=30)
+        r.raise_for_status()
+        data = r.json()
+        main.save_auth({
+            'base_url': _W['base_url'],
+            'username': username,
+            'playgroup': 'loadtest',
+            'token': data.get('access_token'),
+            'manager_id': data.get('manager_id'),
+            'exp': data.get('exp'),
+            'role': data.get('role'),
+        })
+    try:
+        _W['app'].refresh_auth_cache()
+    except Exception:
+        pass
+    return db
+
+
+def _manager_round(round_idx, players):
+    db = _use_device('manager', 'manager')
+    cur = db.DB.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    if cur < players:
+        db.DB.executemany("INSERT INTO players(name, nickname) VALUES(?, ?)",
+                          [(f'Player {i}', f'p{i}') for i in range(cur, players)])
+    # One small edit per round so every upload is a new snapshot
+    db.DB.execute("INSERT INTO events(name, type, rounds, round_time, status) VALUES(?, 'swiss', 3, 3000, 'active')",
+                  (f'Round {round_idx} event',))
+    db.DB.commit()
+    drv = _W['driver']
+    drv.last_status = ''
+    t0 = time.perf_counter()
+    ok = bool(drv.do_upload())
+    dt = time.perf_counter() - t0
+    return {'ok': ok, 'latency_s': dt, 'status': drv.last_status}
+
+
+def _guest_sync(guest_idx):
+    _use_device(f'guest-{guest_idx:03d}', f'guest{guest_idx}')
+    drv = _W['driver']
+    drv.last_status = ''
+    t0 = time.perf_counter()
+    drv.do_download()
+    dt = time.perf_counter() - t0
+    return {'guest': guest_idx, 'ok': drv.last_status.startswith('Downloaded'), 'latency_s': dt,
+            'status': drv.last_status}
+
+
+def _percentile(values, pct):
+    # Nearest-rank percentile; small samples stay honest (no interpolation)
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = max(0, min(len(s) - 1, int(-(-pct * len(s) // 100)) - 1))
+    return s[k]
+
+
+def run(guests=10, rounds=1, procs=None, players=200):
+    guests = max(1, min(200, int(guests)))
+    procs = max(1, int(procs or min(guests, os.cpu_count() or 1)))
+    root = tempfile.mkdtemp(prefix='dbsync_load_')
+    srv = SyncServer().start_background()
+    ctx = mp.get_context('spawn')
+    results, uploads = [], []
+    try:
+        with ctx.Pool(procs, initializer=_init_worker, initargs=(srv.base_url, root)) as pool:
+            # Warm the pool (imports, logins) so setup cost is not counted as sync cost
+            pool.apply(_manager_round, (0, players))
+            pool.map(_guest_sync, range(guests))
+            srv.metrics.reset()
+            for r in range(1, rounds + 1):
+                uploads.append(pool.apply(_manager_round, (r, players)))
+                results.extend(pool.map(_guest_sync, range(guests)))
+        metrics = srv.metrics.snapshot()
+    finally:
+        srv.stop()
+        shutil.rmtree(root, ignore_errors=True)
+
+    lat = [r['latency_s'] for r in results if r['ok']]
+    guest_routes = ('handle_download', 'handle_public_snapshot')
+    g_bytes = sum(metrics['routes'].get(k, {}).get('bytes_out', 0) for k in guest_routes)
+    g_cpu = sum(metrics['routes'].get(k, {}).get('cpu_s', 0.0) for k in guest_routes)
+    syncs = guests * rounds
+    failures = [r for r in results if not r['ok']]
+    return {
+        'guests': guests,
+        'rounds': rounds,
+        'procs': procs,
+        'syncs_ok': len(lat),
+        'syncs_failed': len(failures),
+        'uploads_ok': sum(1 for u in uploads if u['ok']),
+        'latency_ms': {
+            'p50': round(_percentile(lat, 50) * 1000, 1),
+            'p95': round(_percentile(lat, 95) * 1000, 1),
+            'max': round(max(lat) * 1000, 1) if lat else 0.0,
+        },
+        'bytes': {
+            'total': metrics['total']['bytes_in'] + metrics['total']['bytes_out'],
+            'per_guest_sync': round(g_bytes / syncs, 1),
+        },
+        'server_cpu_ms': {
+            'total': round(metrics['total']['cpu_s'] * 1000, 2),
+            'per_guest_sync': round(g_cpu * 1000 / syncs, 3),
+        },
+        'routes': metrics['routes'],
+        'first_failure': failures[0]['status'] if failures else None,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Offline sync load test (manager + simulated guests)')
+    ap.add_argument('--guests', type=int, default=10, help='simulated guests, 1-200')
+    ap.add_argument('--rounds', type=int, default=1, help='upload/download rounds')
+    ap.add_argument('--procs', type=int, default=None, help='worker processes (default: min(guests, CPUs))')
+    ap.add_argument('--players', type=int, default=200, help='players seeded into the manager DB')
+    ap.add_argument('--json', dest='json_path', help='also write the report to this file')
+    args = ap.parse_args(argv)
+    report = run(args.guests, args.rounds, args.procs, args.players)
+    print(f"guests={report['guests']} rounds={report['rounds']} procs={report['procs']}")
+    print(f"syncs ok={report['syncs_ok']} failed={report['syncs_failed']} uploads ok={report['uploads_ok']}")
+    lm = report['latency_ms']
+    print(f"latency ms p50={lm['p50']} p95={lm['p95']} max={lm['max']}")
+    print(f"bytes total={report['bytes']['total']} per guest sync={report['bytes']['per_guest_sync']}")
+    print(f"server cpu ms total={report['server_cpu_ms']['total']} per guest sync={report['server_cpu_ms']['per_guest_sync']}")
+    if report['first_failure']:
+        print(f"first failure: {report['first_failure']}")
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0 if report['syncs_failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,374 @@
+"""Local stand-in for the Draft Buddy sync server.
+
+A small, dependency-free HTTP server (stdlib only) that mimics the parts of
+the real server the app talks to, so sync features can be exercised offline:
+
+- GET  /health
+- POST /auth/login                  (any password; role from username prefix)
+- POST /db/upload                   (manager token, multipart field "file")
+- GET  /db/download                 (manager token; guests get 403)
+- GET  /public/<manager_id>/snapshot.sqlite
+  (both send X-Table-Versions: {table: version}, see SnapshotStore, and
+  ETag: "<version>"; a matching If-None-Match gets 304 with no body)
+- GET  /public/<manager_id>/version?since=<v>&wait=<s>   (long-poll)
+- GET  /metrics                     (stand-in only: bytes and CPU per route)
+
+Snapshots are kept in memory. Uploads, or SyncServer.publish() from tests and
+scripts, bump the version and wake any waiting long-polls. Every request is
+metered (bytes in/out and handler thread CPU time) so tools/sync_load_test.py
+can report transfer volume and server cost per guest.
+
+Usage:
+    python tools/sync_server.py --port 8765 --manager-id 1 --seed events.db
+Then point the app at it:
+    DRAFTBUDDY_SERVER_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import hashlib
+import json
+import re
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+def _table_digests(data: bytes) -> dict:
+    """{table: sha1 of its rows} for a SQLite snapshot; {} if it is not one."""
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.deserialize(data)
+        names = [r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+        return {n: hashlib.sha1(repr(conn.execute(f'SELECT rowid, * FROM "{n}" ORDER BY rowid').fetchall())
+                                .encode('utf-8')).hexdigest() for n in names}
+    except (sqlite3.Error, AttributeError):
+        return {}
+    finally:
+        conn.close()
+
+
+class SnapshotStore:
+    """In-memory snapshots per manager with a condition for long-polls.
+
+    Each table also gets a version: the snapshot version that last changed
+    its rows. Clients compare them with the versions of the snapshot they
+    hold instead of rescanning every table to find what changed.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._snapshots = {}  # manager_id -> (version, bytes)
+        self._tables = {}  # manager_id -> ({table: digest}, {table: version})
+
+    def publish(self, manager_id, data: bytes) -> int:
+        mid = str(manager_id)
+        digests = _table_digests(data)
+        with self._cond:
+            ver = self._snapshots.get(mid, (0, b''))[0] + 1
+            self._snapshots[mid] = (ver, bytes(data))
+            old_digests, old_versions = self._tables.get(mid, ({}, {}))
+            self._tables[mid] = (digests, {
+                t: old_versions[t] if d == old_digests.get(t) else ver for t, d in digests.items()})
+            self._cond.notify_all()
+            return ver
+
+    def table_versions(self, manager_id) -> dict:
+        with self._cond:
+            return dict(self._tables.get(str(manager_id), ({}, {}))[1])
+
+    def get(self, manager_id):
+        with self._cond:
+            return self._snapshots.get(str(manager_id))
+
+    def version(self, manager_id) -> int:
+        snap = self.get(manager_id)
+        return snap[0] if snap else 0
+
+    def wait_for_change(self, manager_id, since, timeout: float) -> int:
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            while True:
+                cur = self._snapshots.get(str(manager_id), (0, b''))[0]
+                if since is None or cur != since:
+                    return cur
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return cur
+                self._cond.wait(left)
+
+
+class Metrics:
+    """Thread-safe per-route counters: requests, bytes in/out, handler CPU."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def record(self, route, bytes_in, bytes_out, cpu_s):
+        with self._lock:
+            m = self._routes.setdefault(route, {'requests': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_s': 0.0})
+            m['requests'] += 1
+            m['bytes_in'] += int(bytes_in)
+            m['bytes_out'] += int(bytes_out)
+            m['cpu_s'] += float(cpu_s)
+
+    def snapshot(self):
+        with self._lock:
+            routes = {k: dict(v) for k, v in self._routes.items()}
+        total = {'requests': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_s': 0.0}
+        for m in routes.values():
+            for k in total:
+                total[k] += m[k]
+        return {'routes': routes, 'total': total}
+
+    def reset(self):
+        with self._lock:
+            self._routes = {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'DraftBuddyStandIn/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    # Route table: (method, regex) -> handler method name
+    routes = [
+        ('GET', re.compile(r'^/health$'), 'handle_health'),
+        ('POST', re.compile(r'^/auth/login$'), 'handle_login'),
+        ('POST', re.compile(r'^/db/upload$'), 'handle_upload'),
+        ('GET', re.compile(r'^/db/download$'), 'handle_download'),
+        ('GET', re.compile(r'^/public/(?P<mid>[^/]+)/snapshot\.sqlite$'), 'handle_public_snapshot'),
+        ('GET', re.compile(r'^/public/(?P<mid>[^/]+)/version$'), 'handle_version'),
+        ('GET', re.compile(r'^/metrics$'), 'handle_metrics'),
+    ]
+
+    def log_message(self, fmt, *args):
+        if getattr(self.server, 'verbose', False):
+            super().log_message(fmt, *args)
+
+    @property
+    def store(self) -> SnapshotStore:
+        return self.server.store
+
+    # ---- Plumbing ----
+    def _dispatch(self, method):
+        cpu0 = time.thread_time()
+        self._bytes_in = 0
+        self._bytes_out = 0
+        parts = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        route = 'unknown'
+        try:
+            for m, rx, name in self.routes:
+                if m != method:
+                    continue
+                match = rx.match(parts.path)
+                if match:
+                    route = name
+                    try:
+                        getattr(self, name)(**match.groupdict())
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+                    return
+            self.send_json(404, {'detail': 'Not Found'})
+        finally:
+            if route != 'handle_metrics':
+                self.server.metrics.record(route, self._bytes_in, self._bytes_out, time.thread_time() - cpu0)
+
+    def read_body(self) -> bytes:
+        try:
+            n = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            n = 0
+        body = self.rfile.read(n) if n > 0 else b''
+        self._bytes_in += len(body)
+        return body
+
+    def bearer_session(self):
+        auth = self.headers.get('Authorization') or ''
+        if not auth.startswith('Bearer '):
+            return None
+        return self.server.sessions.get(auth[len('Bearer '):].strip())
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def send_bytes(self, status, body: bytes, content_type='application/octet-stream', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self._bytes_out += len(body)
+
+    def send_json(self, status, payload):
+        self.send_bytes(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    # ---- Endpoints ----
+    def handle_health(self):
+        self.send_json(200, {'status': 'ok'})
+
+    def handle_login(self):
+        try:
+            data = json.loads(self.read_body() or b'{}')
+        except ValueError:
+            data = {}
+        user = str(data.get('username') or '').strip()
+        if not user or not data.get('password'):
+            self.send_json(401, {'detail': 'Invalid credentials'})
+            return
+        role = 'manager' if user.lower().startswith('manager') else 'guest'
+        token = secrets.token_hex(16)
+        session = {'username': user, 'role': role, 'manager_id': self.server.manager_id}
+        self.server.sessions[token] = session
+        self.send_json(200, {
+            'access_token': token,
+            'manager_id': session['manager_id'],
+            'exp': int(time.time()) + 24 * 3600,
+            'role': role,
+        })
+
+    def handle_upload(self):
+        body = self.read_body()
+        session = self.bearer_session()
+        if session is None:
+            self.send_json(401, {'detail': 'Not authenticated'})
+            return
+        if session['role'] != 'manager':
+            self.send_json(403, {'detail': 'Forbidden'})
+            return
+        ctype = self.headers.get('Content-Type') or ''
+        data = None
+        try:
+            msg = BytesParser(policy=HTTP).parsebytes(
+                b'Content-Type: ' + ctype.encode('latin-1') + b'\r\n\r\n' + body)
+            for part in msg.iter_parts():
+                if part.get_param('name', header='content-disposition') == 'file':
+                    data = part.get_payload(decode=True)
+                    break
+        except Exception:
+            data = None
+        if data is None:
+            self.send_json(400, {'detail': 'Missing file'})
+            return
+        ver = self.store.publish(session['manager_id'], data)
+        self.send_json(200, {'stored': f"{session['manager_id']}/snapshot.sqlite", 'version': ver, 'size': len(data)})
+
+    def handle_download(self):
+        session = self.bearer_session()
+        if session is None:
+            self.send_json(401, {'detail': 'Not authenticated'})
+            return
+        if session['role'] != 'manager':
+            self.send_json(403, {'detail': 'Forbidden'})
+            return
+        snap = self.store.get(session['manager_id'])
+        if not snap:
+            self.send_json(404, {'detail': 'No snapshot'})
+            return
+        self.send_snapshot(session['manager_id'], snap)
+
+    def handle_metrics(self):
+        self.send_json(200, self.server.metrics.snapshot())
+
+    def handle_public_snapshot(self, mid):
+        snap = self.store.get(mid)
+        if not snap:
+            self.send_json(404, {'detail': 'No snapshot'})
+            return
+        self.send_snapshot(mid, snap)
+
+    def send_snapshot(self, mid, snap):
+        etag = f'"{snap[0]}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_bytes(304, b'', headers={'ETag': etag})
+            return
+        headers = {'ETag': etag}
+        versions = self.store.table_versions(mid)
+        if versions:
+            headers['X-Table-Versions'] = json.dumps(versions, separators=(',', ':'))
+        self.send_bytes(200, snap[1], headers=headers)
+
+    def handle_version(self, mid):
+        try:
+            since = int(self.query['since']) if 'since' in self.query else None
+        except ValueError:
+            since = None
+        try:
+            wait = min(60.0, max(0.0, float(self.query.get('wait', 0))))
+        except ValueError:
+            wait = 0.0
+        ver = self.store.wait_for_change(mid, since, wait)
+        self.send_json(200, {'version': ver})
+
+
+class SyncServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, manager_id='1', verbose=False):
+        super().__init__((host, port), _Handler)
+        self.store = SnapshotStore()
+        self.metrics = Metrics()
+        self.sessions = {}  # token -> {'username', 'role', 'manager_id'}
+        self.manager_id = str(manager_id)
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def publish(self, manager_id, data: bytes) -> int:
+        return self.store.publish(manager_id, data)
+
+    def handle_error(self, request, client_address):
+        # Clients that hang up mid-response (long-poll timeouts, killed guests)
+        # are routine here; keep the traceback for anything else
+        if isinstance(sys.exc_info()[1], ConnectionError) and not self.verbose:
+            return
+        super().handle_error(request, client_address)
+
+    def start_background(self):
+        self._thread = threading.Thread(target=self.serve_forever, name='sync-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Local stand-in for the Draft Buddy sync server')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8765)
+    ap.add_argument('--manager-id', default='1')
+    ap.add_argument('--seed', help='SQLite file to publish as the initial snapshot')
+    ap.add_argument('-v', '--verbose', action='store_true')
+    args = ap.parse_args(argv)
+    srv = SyncServer(args.host, args.port, manager_id=args.manager_id, verbose=args.verbose)
+    if args.seed:
+        with open(args.seed, 'rb') as f:
+            srv.publish(args.manager_id, f.read())
+    print(f"Serving on {srv.base_url} (manager {args.manager_id})")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+
+
+if __name__ == '__main__':
+    main()